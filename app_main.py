@@ -8,6 +8,7 @@ from src.scouter.agent.mcp import app as mcp_app
 from src.scouter.config import config as app_config
 from src.scouter.config import setup_logging
 from src.scouter.ingestion.api import router as ingestion_router
+from src.scouter.tools.api import router as search_router
 
 # Setup logging
 setup_logging()
@@ -24,6 +25,7 @@ app: FastAPI = FastAPI(
 
 # Include REST API routers
 app.include_router(ingestion_router)
+app.include_router(search_router)
 
 # Mount FastMCP for tool access
 app.mount("/mcp", mcp_app)  # type: ignore[arg-type]
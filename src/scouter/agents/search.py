@@ -1,3 +1,4 @@
+import scouter.tools  # noqa: F401  # registers the search tools
 from scouter.llmcore import AgentConfig, AgentRuntime, create_agent, run_agent
 from scouter.llmcore.types import (
     ChatCompletionMessageParam,
@@ -15,11 +16,12 @@ def get_search_agent() -> tuple[AgentRuntime, AgentConfig]:
         temperature=0.0,  # Deterministic for search
         instructions=(
             "You are a search agent specialized in retrieving information from a knowledge graph. "
-            "Use the semantic_search tool to find relevant information based on the user's query. "
+            "Use the semantic_search tool to find relevant information based on the user's query, "
+            "or the hybrid_search tool when the query contains exact identifiers, names or rare terms. "
             "Analyze the search results and provide a comprehensive answer.",
             "What information are you looking for?",
         ),
-        tools=["semantic_search"],
+        tools=["semantic_search", "hybrid_search"],
         max_tokens=1000,  # Allow longer responses for search results
     )
     agent = create_agent(config)
@@ -41,7 +43,8 @@ async def search_knowledge_graph(query: str, hints: str = "") -> str:
     # Prepare messages with hints if provided
     base_instructions = (
         "You are a search agent specialized in retrieving information from a knowledge graph. "
-        "Use the semantic_search tool to find relevant information based on the user's query. "
+        "Use the semantic_search tool to find relevant information based on the user's query, "
+        "or the hybrid_search tool when the query contains exact identifiers, names or rare terms. "
         "Analyze the search results and provide a comprehensive answer."
     )
 
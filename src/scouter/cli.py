@@ -0,0 +1,92 @@
+"""Command line interface for Project Scouter."""
+
+import argparse
+import asyncio
+from pathlib import Path
+
+from scouter.config import config, setup_logging
+from scouter.ingestion.bulk import BulkIngester, discover
+from scouter.ingestion.service import IngestionService
+
+
+async def _ingest(args: argparse.Namespace) -> int:
+    # Each concurrent document needs its own pipeline.
+    config.ingestion.pipeline_pool_size = max(
+        config.ingestion.pipeline_pool_size, args.concurrency
+    )
+    service = IngestionService()
+    try:
+        stats = await BulkIngester(
+            service,
+            args.state or f"{Path(args.source).name}.ingest-state.jsonl",
+            concurrency=args.concurrency,
+            parse_workers=args.parse_workers,
+            extraction=args.extraction,
+            report_every=args.report_every,
+        ).run(discover(args.source))
+    finally:
+        service.close()
+    return 1 if stats.failed else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the ``scouter`` command.
+
+    Args:
+        argv: Command line arguments, defaulting to ``sys.argv``.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="scouter", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser(
+        "ingest",
+        help="ingest local documents without the API or Celery",
+        description=(
+            "Ingest a directory of PDF/.txt/.md files, an NDJSON manifest of "
+            '{"path"|"text", "id", "metadata"} objects, or a single file. '
+            "Finished documents are recorded in a state file; rerunning the "
+            "same command resumes an interrupted run."
+        ),
+    )
+    ingest.add_argument("source", help="directory, .jsonl/.ndjson manifest or file")
+    ingest.add_argument(
+        "--state",
+        help="state file (default: <source name>.ingest-state.jsonl in the "
+        "working directory)",
+    )
+    ingest.add_argument(
+        "--concurrency",
+        type=int,
+        default=config.ingestion.pipeline_pool_size,
+        help="documents ingested at the same time",
+    )
+    ingest.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="processes extracting PDF text (default: one per CPU)",
+    )
+    ingest.add_argument(
+        "--extraction",
+        choices=["inline", "deferred", "skip"],
+        default="inline",
+        help="extract the graph per document, after indexing all of them, "
+        "or not at all",
+    )
+    ingest.add_argument(
+        "--report-every",
+        type=float,
+        default=10.0,
+        help="seconds between progress reports",
+    )
+
+    args = parser.parse_args(argv)
+    setup_logging()
+    return asyncio.run(_ingest(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
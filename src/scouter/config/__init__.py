@@ -4,6 +4,7 @@ import logging
 import os
 import sys
 from dataclasses import dataclass
+from pathlib import Path
 
 import openai
 from neo4j_graphrag.embeddings import SentenceTransformerEmbeddings
@@ -80,11 +81,168 @@ class LoggingConfig:
     level: str = "INFO"
 
 
+@dataclass
+class IngestionConfig:
+    max_upload_bytes: int = 200 * 1024 * 1024
+    max_batch_upload_bytes: int = 2 * 1024 * 1024 * 1024
+    upload_chunk_bytes: int = 1024 * 1024
+    text_offload_bytes: int = 256 * 1024
+    pipeline_pool_size: int = 2
+    embed_batch_size: int = 64
+    embed_batch_wait_ms: int = 20
+    write_batch_size: int = 2000
+    llm_concurrency_initial: int = 4
+    llm_concurrency_max: int = 32
+    llm_max_attempts: int = 8
+    staged: bool = False
+    pdf_pages_per_part: int = 50
+    blob_dir: str = str(Path.home() / ".cache" / "scouter" / "blobs")
+    blob_ttl_s: int = 7 * 24 * 60 * 60
+    redis_url: str = "redis://localhost:6379/0"
+    progress_ttl_s: int = 24 * 60 * 60
+    max_queued_messages: int = 10_000
+    max_inflight_bytes: int = 8 * 1024 * 1024 * 1024
+    tenant_max_inflight_bytes: int = 2 * 1024 * 1024 * 1024
+    retry_after_s: int = 30
+    near_duplicate_threshold: float = 0.9
+    minhash_permutations: int = 128
+    minhash_bands: int = 16
+
+    @classmethod
+    def load_from_env(cls) -> IngestionConfig:
+        return cls(
+            max_upload_bytes=int(
+                os.getenv("INGEST_MAX_UPLOAD_BYTES", cls.max_upload_bytes)
+            ),
+            max_batch_upload_bytes=int(
+                os.getenv("INGEST_MAX_BATCH_UPLOAD_BYTES", cls.max_batch_upload_bytes)
+            ),
+            upload_chunk_bytes=int(
+                os.getenv("INGEST_UPLOAD_CHUNK_BYTES", cls.upload_chunk_bytes)
+            ),
+            text_offload_bytes=int(
+                os.getenv("INGEST_TEXT_OFFLOAD_BYTES", cls.text_offload_bytes)
+            ),
+            pipeline_pool_size=int(
+                os.getenv("INGEST_PIPELINE_POOL_SIZE", cls.pipeline_pool_size)
+            ),
+            embed_batch_size=int(
+                os.getenv("INGEST_EMBED_BATCH_SIZE", cls.embed_batch_size)
+            ),
+            embed_batch_wait_ms=int(
+                os.getenv("INGEST_EMBED_BATCH_WAIT_MS", cls.embed_batch_wait_ms)
+            ),
+            write_batch_size=int(
+                os.getenv("INGEST_WRITE_BATCH_SIZE", cls.write_batch_size)
+            ),
+            llm_concurrency_initial=int(
+                os.getenv("INGEST_LLM_CONCURRENCY_INITIAL", cls.llm_concurrency_initial)
+            ),
+            llm_concurrency_max=int(
+                os.getenv("INGEST_LLM_CONCURRENCY_MAX", cls.llm_concurrency_max)
+            ),
+            llm_max_attempts=int(
+                os.getenv("INGEST_LLM_MAX_ATTEMPTS", cls.llm_max_attempts)
+            ),
+            staged=os.getenv("INGEST_STAGED", "false").lower() in {"1", "true", "yes"},
+            blob_dir=os.getenv("INGEST_BLOB_DIR", cls.blob_dir),
+            blob_ttl_s=int(os.getenv("INGEST_BLOB_TTL_S", cls.blob_ttl_s)),
+            pdf_pages_per_part=int(
+                os.getenv("INGEST_PDF_PAGES_PER_PART", cls.pdf_pages_per_part)
+            ),
+            redis_url=os.getenv("REDIS_URL", cls.redis_url),
+            progress_ttl_s=int(os.getenv("INGEST_PROGRESS_TTL_S", cls.progress_ttl_s)),
+            max_queued_messages=int(
+                os.getenv("INGEST_MAX_QUEUED_MESSAGES", cls.max_queued_messages)
+            ),
+            max_inflight_bytes=int(
+                os.getenv("INGEST_MAX_INFLIGHT_BYTES", cls.max_inflight_bytes)
+            ),
+            tenant_max_inflight_bytes=int(
+                os.getenv(
+                    "INGEST_TENANT_MAX_INFLIGHT_BYTES", cls.tenant_max_inflight_bytes
+                )
+            ),
+            retry_after_s=int(os.getenv("INGEST_RETRY_AFTER_S", cls.retry_after_s)),
+            near_duplicate_threshold=float(
+                os.getenv(
+                    "INGEST_NEAR_DUPLICATE_THRESHOLD", cls.near_duplicate_threshold
+                )
+            ),
+            minhash_permutations=int(
+                os.getenv("INGEST_MINHASH_PERMUTATIONS", cls.minhash_permutations)
+            ),
+            minhash_bands=int(os.getenv("INGEST_MINHASH_BANDS", cls.minhash_bands)),
+        )
+
+
+@dataclass
+class CacheConfig:
+    embedding_path: str = str(Path.home() / ".cache" / "scouter" / "embeddings.sqlite3")
+    embedding_max_entries: int = 500_000
+    extraction_path: str = str(
+        Path.home() / ".cache" / "scouter" / "extractions.sqlite3"
+    )
+    extraction_max_entries: int = 200_000
+
+    @classmethod
+    def load_from_env(cls) -> CacheConfig:
+        return cls(
+            embedding_path=os.getenv("EMBEDDING_CACHE_PATH", cls.embedding_path),
+            embedding_max_entries=int(
+                os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", cls.embedding_max_entries)
+            ),
+            extraction_path=os.getenv("EXTRACTION_CACHE_PATH", cls.extraction_path),
+            extraction_max_entries=int(
+                os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", cls.extraction_max_entries)
+            ),
+        )
+
+
+@dataclass
+class SearchConfig:
+    retriever_ttl_s: int = 300
+    query_embedding_cache_size: int = 4096
+    result_cache_ttl_s: int = 300
+    result_cache_max_entries: int = 1024
+    result_cache_version_ttl_s: float = 1.0
+
+    @classmethod
+    def load_from_env(cls) -> SearchConfig:
+        return cls(
+            retriever_ttl_s=int(
+                os.getenv("SEARCH_RETRIEVER_TTL_S", cls.retriever_ttl_s)
+            ),
+            query_embedding_cache_size=int(
+                os.getenv(
+                    "SEARCH_QUERY_EMBEDDING_CACHE_SIZE", cls.query_embedding_cache_size
+                )
+            ),
+            result_cache_ttl_s=int(
+                os.getenv("SEARCH_RESULT_CACHE_TTL_S", cls.result_cache_ttl_s)
+            ),
+            result_cache_max_entries=int(
+                os.getenv(
+                    "SEARCH_RESULT_CACHE_MAX_ENTRIES", cls.result_cache_max_entries
+                )
+            ),
+            result_cache_version_ttl_s=float(
+                os.getenv(
+                    "SEARCH_RESULT_CACHE_VERSION_TTL_S",
+                    cls.result_cache_version_ttl_s,
+                )
+            ),
+        )
+
+
 @dataclass
 class AppConfig:
     llm: LLMConfig
     db: DBConfig
     logging: LoggingConfig
+    ingestion: IngestionConfig
+    cache: CacheConfig
+    search: SearchConfig
 
     @classmethod
     def load_from_env(cls) -> AppConfig:
@@ -92,6 +250,9 @@ class AppConfig:
             llm=LLMConfig.load_from_env(),
             db=DBConfig.load_from_env(),
             logging=LoggingConfig(),
+            ingestion=IngestionConfig.load_from_env(),
+            cache=CacheConfig.load_from_env(),
+            search=SearchConfig.load_from_env(),
         )
 
     def get_llm_client(self) -> openai.OpenAI:
@@ -10,13 +10,51 @@ from .agent_run import (
     persist_agent_runtime,
     persist_trace,
 )
-from .neo4j import get_neo4j_driver, get_neo4j_embedder, get_neo4j_llm
+from .embedding_cache import (
+    CachedEmbedder,
+    EmbeddingCache,
+    QueryCachedEmbedder,
+    QueryEmbeddingCache,
+    get_embedding_cache,
+    get_query_embedding_cache,
+)
+from .llm_cache import CachedLLM, ExtractionCache, get_extraction_cache
+from .llm_limiter import AdaptiveRateLimitHandler, AIMDLimiter
+from .neo4j import (
+    get_neo4j_driver,
+    get_neo4j_embedder,
+    get_neo4j_llm,
+    get_query_embedder,
+)
+from .retrievers import RetrieverRegistry, get_retriever_registry
+from .search_cache import (
+    SearchResultCache,
+    bump_corpus_version,
+    get_search_result_cache,
+)
 
 __all__ = [
+    "AIMDLimiter",
+    "AdaptiveRateLimitHandler",
+    "CachedEmbedder",
+    "CachedLLM",
     "DBAgentRuntimeSerializer",
+    "EmbeddingCache",
+    "ExtractionCache",
+    "QueryCachedEmbedder",
+    "QueryEmbeddingCache",
+    "RetrieverRegistry",
+    "SearchResultCache",
+    "bump_corpus_version",
+    "get_embedding_cache",
+    "get_extraction_cache",
     "get_neo4j_driver",
     "get_neo4j_embedder",
     "get_neo4j_llm",
+    "get_query_embedder",
+    "get_query_embedding_cache",
+    "get_retriever_registry",
+    "get_search_result_cache",
     "load_agent_runtime",
     "persist_agent_runtime",
     "persist_trace",
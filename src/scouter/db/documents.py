@@ -0,0 +1,553 @@
+"""Neo4j operations for ingested Document nodes."""
+
+import re
+from typing import Any
+
+import neo4j
+
+# Characters with a meaning in Lucene query syntax.
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+# Full-text matches fetched per requested chunk, so enough remain once
+# near-duplicates are filtered out.
+_FULLTEXT_OVERFETCH = 4
+
+_CHUNK_TEXT_INDEX = (
+    "CREATE FULLTEXT INDEX chunk_text IF NOT EXISTS FOR (c:Chunk) ON EACH [c.text]"
+)
+
+
+def create_document_constraints(driver: neo4j.Driver) -> None:
+    """Create Neo4j constraints and indexes for ingested documents.
+
+    Safe to run repeatedly; every statement is idempotent.
+
+    Args:
+        driver: Neo4j driver instance
+    """
+    constraints = [
+        "CREATE CONSTRAINT document_content_hash_unique IF NOT EXISTS FOR (d:Document) REQUIRE d.content_hash IS UNIQUE",
+        "CREATE INDEX chunk_content_hash IF NOT EXISTS FOR (c:Chunk) ON (c.content_hash)",
+        "CREATE INDEX chunk_duplicate_of IF NOT EXISTS FOR (c:Chunk) ON (c.duplicate_of)",
+        _CHUNK_TEXT_INDEX,
+    ]
+
+    with driver.session() as session:
+        for constraint in constraints:
+            session.run(constraint)
+
+
+def find_document_by_hash(
+    driver: neo4j.Driver, content_hash: str
+) -> dict[str, Any] | None:
+    """Find an ingested document by its content fingerprint.
+
+    Args:
+        driver: Neo4j driver instance
+        content_hash: SHA-256 hex digest of the document content
+
+    Returns:
+        Document properties if the content was already ingested, None otherwise
+    """
+    query = """
+    MATCH (d:Document {content_hash: $content_hash})
+    RETURN d {.*} as document
+    LIMIT 1
+    """
+    with driver.session() as session:
+        record = session.run(query, content_hash=content_hash).single()
+        return record["document"] if record else None
+
+
+def find_ingested_hashes(driver: neo4j.Driver, content_hashes: list[str]) -> set[str]:
+    """Return the subset of content fingerprints that were already ingested.
+
+    Args:
+        driver: Neo4j driver instance
+        content_hashes: SHA-256 hex digests to look up
+
+    Returns:
+        Set of content hashes that have a Document node
+    """
+    if not content_hashes:
+        return set()
+    query = """
+    UNWIND $content_hashes AS content_hash
+    MATCH (d:Document {content_hash: content_hash})
+    RETURN DISTINCT d.content_hash as content_hash
+    """
+    with driver.session() as session:
+        result = session.run(query, content_hashes=content_hashes)
+        return {record["content_hash"] for record in result}
+
+
+def merge_document_metadata(
+    driver: neo4j.Driver, content_hash: str, metadata: dict[str, Any]
+) -> None:
+    """Merge metadata into an existing Document node.
+
+    Args:
+        driver: Neo4j driver instance
+        content_hash: SHA-256 hex digest identifying the document
+        metadata: Properties to set on the document
+    """
+    properties = {k: v for k, v in metadata.items() if k != "content_hash"}
+    if not properties:
+        return
+    query = """
+    MATCH (d:Document {content_hash: $content_hash})
+    SET d += $properties
+    """
+    with driver.session() as session:
+        session.run(query, content_hash=content_hash, properties=properties)
+
+
+def find_document_by_doc_id(driver: neo4j.Driver, doc_id: str) -> dict[str, Any] | None:
+    """Find an ingested document by its caller-supplied doc_id metadata.
+
+    Args:
+        driver: Neo4j driver instance
+        doc_id: Stable document identifier provided in the ingestion metadata
+
+    Returns:
+        Document properties if a document with this doc_id exists, None otherwise
+    """
+    query = """
+    MATCH (d:Document {doc_id: $doc_id})
+    RETURN d {.*} as document
+    LIMIT 1
+    """
+    with driver.session() as session:
+        record = session.run(query, doc_id=doc_id).single()
+        return record["document"] if record else None
+
+
+def get_document_chunks(driver: neo4j.Driver, doc_id: str) -> list[dict[str, Any]]:
+    """Get the chunks of a document in index order.
+
+    Args:
+        driver: Neo4j driver instance
+        doc_id: Stable document identifier
+
+    Returns:
+        List of dicts with the chunk element_id and content_hash
+    """
+    query = """
+    MATCH (d:Document {doc_id: $doc_id})<-[:FROM_DOCUMENT]-(c:Chunk)
+    RETURN elementId(c) as element_id, c.content_hash as content_hash
+    ORDER BY c.index
+    """
+    with driver.session() as session:
+        result = session.run(query, doc_id=doc_id)
+        return [record.data() for record in result]
+
+
+def create_document_chunks(
+    driver: neo4j.Driver, doc_id: str, rows: list[dict[str, Any]]
+) -> None:
+    """Create Chunk nodes attached to an existing document.
+
+    The chunks keep ``__tmp_internal_id`` set to the row id so a KG writer can
+    attach extracted entities to them in the same ingestion run. Rows without
+    an embedding, such as near-duplicate chunks, are created without one.
+
+    Args:
+        driver: Neo4j driver instance
+        doc_id: Stable document identifier
+        rows: Dicts with id, text, index, properties (including the chunk's
+            content_hash) and embedding
+    """
+    query = """
+    MATCH (d:Document {doc_id: $doc_id})
+    UNWIND $rows AS row
+    CREATE (c:Chunk:__KGBuilder__ {__tmp_internal_id: row.id})
+    SET c += row.properties,
+        c.text = row.text,
+        c.index = row.index
+    CREATE (c)-[:FROM_DOCUMENT]->(d)
+    WITH c, row
+    WHERE row.embedding IS NOT NULL
+    CALL db.create.setNodeVectorProperty(c, 'embedding', row.embedding)
+    """
+    with driver.session() as session:
+        session.run(query, doc_id=doc_id, rows=rows)
+
+
+def delete_chunks(driver: neo4j.Driver, element_ids: list[str]) -> None:
+    """Delete chunks and any entities that were only extracted from them.
+
+    Args:
+        driver: Neo4j driver instance
+        element_ids: Element IDs of the Chunk nodes to delete
+    """
+    if not element_ids:
+        return
+    query = """
+    MATCH (c:Chunk) WHERE elementId(c) IN $element_ids
+    OPTIONAL MATCH (e:__Entity__)-[:FROM_CHUNK]->(c)
+    WITH collect(DISTINCT c) AS chunks, collect(DISTINCT e) AS entities
+    FOREACH (c IN chunks | DETACH DELETE c)
+    WITH entities
+    UNWIND entities AS e
+    WITH e WHERE NOT (e)-[:FROM_CHUNK]->()
+    DETACH DELETE e
+    """
+    with driver.session() as session:
+        session.run(query, element_ids=element_ids)
+
+
+def find_orphaned_duplicates(
+    driver: neo4j.Driver, content_hashes: list[str]
+) -> list[dict[str, Any]]:
+    """Find near-duplicate chunks whose canonical chunk no longer exists.
+
+    Args:
+        driver: Neo4j driver instance
+        content_hashes: Content hashes of deleted chunks
+
+    Returns:
+        Dicts with id, text, index and content_hash of every chunk, in any
+        document, marked ``duplicate_of`` one of the hashes while no embedded
+        chunk with that hash remains, and the ``extraction`` status of its
+        document.
+    """
+    if not content_hashes:
+        return []
+    query = """
+    MATCH (c:Chunk)-[:FROM_DOCUMENT]->(d:Document)
+    WHERE c.duplicate_of IN $content_hashes
+        AND NOT EXISTS {
+            MATCH (k:Chunk {content_hash: c.duplicate_of})
+            WHERE k.embedding IS NOT NULL
+        }
+    RETURN elementId(c) AS id, c.text AS text, c.index AS index,
+        c.content_hash AS content_hash, d.extraction AS extraction
+    ORDER BY c.duplicate_of, id
+    """
+    with driver.session() as session:
+        result = session.run(query, content_hashes=content_hashes)
+        return [record.data() for record in result]
+
+
+def update_chunk_duplicates(driver: neo4j.Driver, rows: list[dict[str, Any]]) -> None:
+    """Mark stored chunks as canonical or as near-duplicates again.
+
+    Canonical rows get their MinHash data and embedding set and
+    ``duplicate_of`` removed; near-duplicate rows get ``duplicate_of`` set and
+    their MinHash data removed. Rows with ``extract`` set get
+    ``__tmp_internal_id`` set to their id so a KG writer can attach entities
+    extracted from them.
+
+    Args:
+        driver: Neo4j driver instance
+        rows: Dicts with id, duplicate_of, minhash, minhash_bands, embedding
+            and extract
+    """
+    query = """
+    UNWIND $rows AS row
+    MATCH (c:Chunk) WHERE elementId(c) = row.id
+    SET c.duplicate_of = row.duplicate_of,
+        c.minhash = row.minhash,
+        c.minhash_bands = row.minhash_bands
+    FOREACH (_ IN CASE WHEN row.extract THEN [1] ELSE [] END |
+        SET c:__KGBuilder__, c.__tmp_internal_id = row.id)
+    WITH c, row
+    WHERE row.embedding IS NOT NULL
+    CALL db.create.setNodeVectorProperty(c, 'embedding', row.embedding)
+    """
+    with driver.session() as session:
+        session.run(query, rows=rows)
+
+
+def reorder_document_chunks(
+    driver: neo4j.Driver, doc_id: str, rows: list[dict[str, Any]]
+) -> None:
+    """Update chunk indexes and rebuild the NEXT_CHUNK chain of a document.
+
+    Args:
+        driver: Neo4j driver instance
+        doc_id: Stable document identifier
+        rows: Dicts with the element_id and new index of each moved chunk
+    """
+    reindex_query = """
+    UNWIND $rows AS row
+    MATCH (c:Chunk) WHERE elementId(c) = row.element_id
+    SET c.index = row.index
+    """
+    relink_query = """
+    MATCH (d:Document {doc_id: $doc_id})<-[:FROM_DOCUMENT]-(c:Chunk)
+    OPTIONAL MATCH (c)-[r:NEXT_CHUNK]->()
+    DELETE r
+    WITH DISTINCT c
+    ORDER BY c.index
+    WITH collect(c) AS chunks
+    UNWIND range(0, size(chunks) - 2) AS i
+    WITH chunks[i] AS current, chunks[i + 1] AS next
+    MERGE (current)-[:NEXT_CHUNK]->(next)
+    """
+    with driver.session() as session:
+        if rows:
+            session.run(reindex_query, rows=rows)
+        session.run(relink_query, doc_id=doc_id)
+
+
+def update_document_properties(
+    driver: neo4j.Driver, doc_id: str, properties: dict[str, Any]
+) -> None:
+    """Set properties on the document with the given doc_id.
+
+    Args:
+        driver: Neo4j driver instance
+        doc_id: Stable document identifier
+        properties: Properties to set, including the new content_hash
+    """
+    query = """
+    MATCH (d:Document {doc_id: $doc_id})
+    SET d += $properties
+    """
+    with driver.session() as session:
+        session.run(query, doc_id=doc_id, properties=properties)
+
+
+def merge_document_parts(
+    driver: neo4j.Driver, content_hash: str, run_id: str, properties: dict[str, Any]
+) -> None:
+    """Merge the part documents of a split PDF into one Document node.
+
+    Chunks of every Document marked ``part_of`` the content hash by the same
+    run are moved to the new Document, re-indexed in (part, index) order and
+    chained with NEXT_CHUNK across part boundaries. The part Document nodes
+    are deleted. Parts of other runs ingesting the same PDF are left alone.
+
+    Args:
+        driver: Neo4j driver instance
+        content_hash: SHA-256 hex digest of the whole document
+        run_id: Identifies the ingestion run that wrote the parts
+        properties: Properties of the merged Document node
+
+    Raises:
+        neo4j.exceptions.ConstraintError: If a Document with the content hash
+            already exists, e.g. because a concurrent run finished first.
+    """
+    relink_query = """
+    CREATE (d:Document {content_hash: $content_hash})
+    SET d += $properties,
+        d.createdAt = toString(datetime())
+    WITH d
+    MATCH (p:Document {part_of: $content_hash, part_run: $run_id})
+          <-[r:FROM_DOCUMENT]-(c:Chunk)
+    WITH d, p, r, c
+    ORDER BY toInteger(p.part), c.index
+    WITH d, collect(c) AS chunks, collect(r) AS rels
+    FOREACH (r IN rels | DELETE r)
+    WITH d, chunks
+    UNWIND range(0, size(chunks) - 1) AS i
+    WITH d, chunks[i] AS c, i
+    SET c.index = i
+    MERGE (c)-[:FROM_DOCUMENT]->(d)
+    """
+    delete_parts_query = """
+    MATCH (p:Document {part_of: $content_hash, part_run: $run_id})
+    DETACH DELETE p
+    """
+    chain_query = """
+    MATCH (d:Document {content_hash: $content_hash})<-[:FROM_DOCUMENT]-(c:Chunk)
+    WITH c
+    ORDER BY c.index
+    WITH collect(c) AS chunks
+    UNWIND range(0, size(chunks) - 2) AS i
+    WITH chunks[i] AS current, chunks[i + 1] AS next
+    MERGE (current)-[:NEXT_CHUNK]->(next)
+    """
+    with driver.session() as session:
+        session.run(
+            relink_query,
+            content_hash=content_hash,
+            run_id=run_id,
+            properties=properties,
+        )
+        session.run(delete_parts_query, content_hash=content_hash, run_id=run_id)
+        session.run(chain_query, content_hash=content_hash)
+
+
+def delete_document_parts(driver: neo4j.Driver, content_hash: str, run_id: str) -> None:
+    """Delete the part documents of a split PDF written by one run.
+
+    Used when the PDF turns out to be ingested already. The parts' chunks are
+    deleted too, along with entities extracted only from them.
+
+    Args:
+        driver: Neo4j driver instance
+        content_hash: SHA-256 hex digest of the whole document
+        run_id: Identifies the ingestion run that wrote the parts
+    """
+    query = """
+    MATCH (p:Document {part_of: $content_hash, part_run: $run_id})
+    OPTIONAL MATCH (c:Chunk)-[:FROM_DOCUMENT]->(p)
+    OPTIONAL MATCH (e:__Entity__)-[:FROM_CHUNK]->(c)
+    WITH collect(DISTINCT p) AS parts, collect(DISTINCT c) AS chunks,
+         collect(DISTINCT e) AS entities
+    FOREACH (c IN chunks | DETACH DELETE c)
+    FOREACH (p IN parts | DETACH DELETE p)
+    WITH entities
+    UNWIND entities AS e
+    WITH e WHERE NOT (e)-[:FROM_CHUNK]->()
+    DETACH DELETE e
+    """
+    with driver.session() as session:
+        session.run(query, content_hash=content_hash, run_id=run_id)
+
+
+def claim_chunks_for_extraction(
+    driver: neo4j.Driver, content_hash: str
+) -> list[dict[str, Any]]:
+    """Claim the chunks of a vector-only document for graph extraction.
+
+    The document's ``extraction`` status moves from ``pending`` or ``skipped``
+    to ``running``, so a document is only claimed once. Its chunks get
+    ``__tmp_internal_id`` set to their element id so a KG writer can attach
+    extracted entities to them.
+
+    Args:
+        driver: Neo4j driver instance
+        content_hash: SHA-256 hex digest of the document content
+
+    Returns:
+        Dicts with id, text, index and duplicate_of of each chunk in order,
+        or an empty list if the document is unknown or not awaiting
+        extraction.
+    """
+    query = """
+    MATCH (d:Document {content_hash: $content_hash})
+    WHERE d.extraction IN ['pending', 'skipped']
+    SET d.extraction = 'running'
+    WITH d
+    MATCH (c:Chunk)-[:FROM_DOCUMENT]->(d)
+    SET c:__KGBuilder__, c.__tmp_internal_id = elementId(c)
+    RETURN elementId(c) AS id, c.text AS text, c.index AS index,
+        c.duplicate_of AS duplicate_of
+    ORDER BY c.index
+    """
+    with driver.session() as session:
+        result = session.run(query, content_hash=content_hash)
+        return [record.data() for record in result]
+
+
+def set_document_extraction(
+    driver: neo4j.Driver, content_hash: str, status: str
+) -> None:
+    """Set the graph extraction status of a document.
+
+    Args:
+        driver: Neo4j driver instance
+        content_hash: SHA-256 hex digest of the document content
+        status: ``pending``, ``skipped``, ``running`` or ``done``
+    """
+    query = """
+    MATCH (d:Document {content_hash: $content_hash})
+    SET d.extraction = $status
+    """
+    with driver.session() as session:
+        session.run(query, content_hash=content_hash, status=status)
+
+
+def create_chunk_minhash_index(driver: neo4j.Driver) -> None:
+    """Create the full-text index over the MinHash band hashes of chunks.
+
+    Args:
+        driver: Neo4j driver instance
+    """
+    query = """
+    CREATE FULLTEXT INDEX chunk_minhash_bands IF NOT EXISTS
+    FOR (c:Chunk) ON EACH [c.minhash_bands]
+    OPTIONS {indexConfig: {`fulltext.analyzer`: 'whitespace'}}
+    """
+    with driver.session() as session:
+        session.run(query)
+
+
+def find_minhash_candidates(
+    driver: neo4j.Driver, bands: list[list[str]], limit: int
+) -> list[list[dict[str, Any]]]:
+    """Find stored chunks sharing MinHash bands with each of several chunks.
+
+    Args:
+        driver: Neo4j driver instance
+        bands: Band hashes of each chunk to look up
+        limit: Maximum number of candidates per chunk, most shared bands first
+
+    Returns:
+        One list per input chunk of dicts with the content_hash and minhash
+        signature of embedded chunks that share at least one band.
+    """
+    query = """
+    UNWIND range(0, size($queries) - 1) AS i
+    CALL {
+        WITH i
+        CALL db.index.fulltext.queryNodes('chunk_minhash_bands', $queries[i])
+        YIELD node, score
+        WHERE node.embedding IS NOT NULL
+        RETURN node
+        ORDER BY score DESC
+        LIMIT $limit
+    }
+    RETURN i, node.content_hash AS content_hash, node.minhash AS minhash
+    """
+    candidates: list[list[dict[str, Any]]] = [[] for _ in bands]
+    with driver.session() as session:
+        result = session.run(
+            query, queries=[" ".join(keys) for keys in bands], limit=limit
+        )
+        for record in result:
+            candidates[record["i"]].append(
+                {"content_hash": record["content_hash"], "minhash": record["minhash"]}
+            )
+    return candidates
+
+
+def create_chunk_text_index(driver: neo4j.Driver) -> None:
+    """Create the full-text index over the text of chunks.
+
+    Args:
+        driver: Neo4j driver instance
+    """
+    with driver.session() as session:
+        session.run(_CHUNK_TEXT_INDEX)
+
+
+def search_chunk_text(
+    driver: neo4j.Driver, query_text: str, limit: int
+) -> list[dict[str, Any]]:
+    """Find chunks whose text matches the terms of a query.
+
+    The query is searched as plain terms: Lucene operators and wildcards in
+    it are escaped, so identifiers such as ``ERR-42`` or ``a/b`` match
+    literally. Near-duplicate chunks are left out, as they are of vector
+    search; more matches than ``limit`` are fetched to make up for them.
+
+    Args:
+        driver: Neo4j driver instance
+        query_text: Text to search for
+        limit: Maximum number of chunks, best matches first
+
+    Returns:
+        Dicts with the element id, text, index, content_hash and full-text
+        score of each matching chunk.
+    """
+    # Lowercased so AND, OR and NOT are searched as words, not operators.
+    terms = _LUCENE_SPECIAL.sub(r"\\\1", query_text.lower()).strip()
+    if not terms:
+        return []
+    query = """
+    CALL db.index.fulltext.queryNodes('chunk_text', $terms, {limit: $fetch})
+    YIELD node, score
+    WHERE node.duplicate_of IS NULL
+    RETURN elementId(node) AS id, node.text AS text, node.index AS index,
+           node.content_hash AS content_hash, score
+    LIMIT $limit
+    """
+    with driver.session() as session:
+        result = session.run(
+            query, terms=terms, fetch=limit * _FULLTEXT_OVERFETCH, limit=limit
+        )
+        return [record.data() for record in result]
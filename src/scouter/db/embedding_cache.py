@@ -0,0 +1,216 @@
+"""Caches for text embeddings: a persistent SQLite cache and a query LRU."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+
+from neo4j_graphrag.embeddings import SentenceTransformerEmbeddings
+from neo4j_graphrag.embeddings.base import Embedder
+
+from scouter.config import config
+from scouter.db.sqlite_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+
+def text_key(text: str) -> str:
+    """Return the cache key of a text: SHA-256 of its normalized form.
+
+    Unicode is NFC-normalized and runs of whitespace collapse to one space, so
+    chunks that differ only in layout share an embedding.
+    """
+    normalized = " ".join(unicodedata.normalize("NFC", text).split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache(SQLiteCache):
+    """Embeddings stored on disk, keyed by (model name, normalized text hash).
+
+    Vectors are stored as float32 blobs and evicted least recently used first
+    once the cache holds more than ``max_entries`` of them.
+    """
+
+    table = "embeddings"
+
+    def get_many(self, model: str, keys: list[str]) -> dict[str, list[float]]:
+        """Look up cached vectors by text key, counting hits and misses."""
+        return {
+            key: array("f", blob).tolist()
+            for key, blob in self.get_raw(model, keys).items()
+        }
+
+    def put_many(self, model: str, vectors: dict[str, list[float]]) -> None:
+        """Store vectors by text key."""
+        self.put_raw(
+            model,
+            {key: array("f", vector).tobytes() for key, vector in vectors.items()},
+        )
+
+
+class CachedEmbedder(Embedder):
+    """Embedder that consults an EmbeddingCache before the wrapped model.
+
+    Args:
+        embedder: Embedder used for cache misses.
+        cache: Persistent embedding cache.
+        model: Model name that scopes cache keys.
+    """
+
+    def __init__(self, embedder: Embedder, cache: EmbeddingCache, model: str) -> None:
+        super().__init__()
+        self.embedder = embedder
+        self.cache = cache
+        self.model = model
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a single text, using the cache when possible."""
+        return self.embed_documents([text])[0]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed several texts, encoding only the cache misses in one batch.
+
+        Cache failures are logged and treated as misses so embedding never
+        depends on the cache being available.
+        """
+        keys = [text_key(text) for text in texts]
+        try:
+            vectors = self.cache.get_many(self.model, keys)
+        except sqlite3.Error:
+            logger.warning("Embedding cache lookup failed", exc_info=True)
+            vectors = {}
+
+        missing = {
+            key: text
+            for key, text in zip(keys, texts, strict=True)
+            if key not in vectors
+        }
+        if missing:
+            encoded = dict(
+                zip(
+                    missing,
+                    encode_batch(self.embedder, list(missing.values())),
+                    strict=True,
+                )
+            )
+            try:
+                self.cache.put_many(self.model, encoded)
+            except sqlite3.Error:
+                logger.warning("Embedding cache write failed", exc_info=True)
+            vectors.update(encoded)
+        return [vectors[key] for key in keys]
+
+
+class QueryEmbeddingCache:
+    """In-process LRU of query embeddings, keyed by (model name, text key).
+
+    Vectors are held as float32 arrays, a quarter of the memory of float
+    lists, and the least recently used one is dropped once more than
+    ``max_entries`` are held.
+
+    Args:
+        max_entries: Maximum number of cached vectors.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._vectors: OrderedDict[tuple[str, str], array] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, model: str, key: str) -> list[float] | None:
+        """Look up a vector by text key, counting hits and misses."""
+        with self._lock:
+            vector = self._vectors.get((model, key))
+            if vector is None:
+                self._misses += 1
+                return None
+            self._vectors.move_to_end((model, key))
+            self._hits += 1
+        return vector.tolist()
+
+    def put(self, model: str, key: str, vector: list[float]) -> None:
+        """Store a vector by text key, evicting the least recently used."""
+        with self._lock:
+            self._vectors[model, key] = array("f", vector)
+            self._vectors.move_to_end((model, key))
+            while len(self._vectors) > self.max_entries:
+                self._vectors.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit and miss counters and the number of cached vectors."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._vectors),
+                "max_entries": self.max_entries,
+            }
+
+
+class QueryCachedEmbedder(Embedder):
+    """Embedder that answers repeated queries from a QueryEmbeddingCache.
+
+    Misses fall through to the wrapped embedder, normally a CachedEmbedder,
+    so a query embedded by another process is read from the persistent cache
+    instead of being encoded again.
+
+    Args:
+        embedder: Embedder used for cache misses.
+        cache: In-process query cache.
+        model: Model name that scopes cache keys.
+    """
+
+    def __init__(
+        self, embedder: Embedder, cache: QueryEmbeddingCache, model: str
+    ) -> None:
+        super().__init__()
+        self.embedder = embedder
+        self.cache = cache
+        self.model = model
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query, using the in-process cache when possible."""
+        key = text_key(text)
+        vector = self.cache.get(self.model, key)
+        if vector is None:
+            vector = self.embedder.embed_query(text)
+            self.cache.put(self.model, key, vector)
+        return vector
+
+
+def encode_batch(embedder: Embedder, texts: list[str]) -> list[list[float]]:
+    """Embed several texts with as few model calls as the embedder allows.
+
+    Cached embedders look up the whole list at once, SentenceTransformer
+    models encode it in one call, and other embedders fall back to one
+    ``embed_query`` call per text.
+    """
+    if isinstance(embedder, CachedEmbedder):
+        return embedder.embed_documents(texts)
+    if isinstance(embedder, SentenceTransformerEmbeddings):
+        return embedder.model.encode(texts).tolist()
+    return [embedder.embed_query(text) for text in texts]
+
+
+@lru_cache(maxsize=1)
+def get_embedding_cache() -> EmbeddingCache | None:
+    """Get the configured embedding cache, or None if caching is disabled."""
+    if not config.cache.embedding_path:
+        return None
+    return EmbeddingCache(
+        config.cache.embedding_path, max_entries=config.cache.embedding_max_entries
+    )
+
+
+@lru_cache(maxsize=1)
+def get_query_embedding_cache() -> QueryEmbeddingCache | None:
+    """Get the process-wide query embedding cache, or None if disabled."""
+    if config.search.query_embedding_cache_size <= 0:
+        return None
+    return QueryEmbeddingCache(config.search.query_embedding_cache_size)
@@ -0,0 +1,160 @@
+"""Persistent SQLite cache for LLM extraction responses."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+from collections.abc import Sequence
+from functools import lru_cache
+
+from neo4j_graphrag.experimental.components.entity_relation_extractor import (
+    fix_invalid_json,
+)
+from neo4j_graphrag.experimental.pipeline.exceptions import InvalidJSONError
+from neo4j_graphrag.llm import LLMInterface, LLMResponse
+from neo4j_graphrag.llm.types import ToolCallResponse
+from neo4j_graphrag.message_history import MessageHistory
+from neo4j_graphrag.tool import Tool
+from neo4j_graphrag.types import LLMMessage
+
+from scouter.config import config
+from scouter.db.sqlite_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCache(SQLiteCache):
+    """LLM responses stored on disk, keyed by (model name, prompt hash)."""
+
+    table = "extractions"
+
+    def get(self, model: str, key: str) -> str | None:
+        """Look up a cached response, counting the hit or miss."""
+        value = self.get_raw(model, [key]).get(key)
+        return value.decode("utf-8") if value is not None else None
+
+    def put(self, model: str, key: str, content: str) -> None:
+        """Store a response."""
+        self.put_raw(model, {key: content.encode("utf-8")})
+
+
+def _is_json(content: str) -> bool:
+    try:
+        json.loads(fix_invalid_json(content))
+    except (json.JSONDecodeError, InvalidJSONError):
+        return False
+    return True
+
+
+class CachedLLM(LLMInterface):
+    """LLM that answers repeated prompts from an ExtractionCache.
+
+    The extraction prompt embeds the chunk text, the extraction template and
+    the schema, so hashing it together with the system instruction and model
+    parameters covers every input that affects the answer. Only responses
+    that parse as JSON are cached, so a retry can still recover from a
+    malformed answer. Calls with message history or tools are not cached.
+
+    Args:
+        llm: LLM used for cache misses.
+        cache: Persistent extraction cache.
+    """
+
+    def __init__(self, llm: LLMInterface, cache: ExtractionCache) -> None:
+        super().__init__(model_name=llm.model_name, model_params=llm.model_params)
+        self.llm = llm
+        self.cache = cache
+
+    def _key(self, prompt: str, system_instruction: str | None) -> str:
+        payload = json.dumps(
+            {
+                "model_params": self.model_params,
+                "system_instruction": system_instruction,
+                "input": prompt,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str) -> str | None:
+        try:
+            return self.cache.get(self.model_name, key)
+        except sqlite3.Error:
+            logger.warning("Extraction cache lookup failed", exc_info=True)
+            return None
+
+    def _store(self, key: str, content: str) -> None:
+        if not _is_json(content):
+            return
+        try:
+            self.cache.put(self.model_name, key, content)
+        except sqlite3.Error:
+            logger.warning("Extraction cache write failed", exc_info=True)
+
+    def invoke(
+        self,
+        input: str,  # noqa: A002
+        message_history: list[LLMMessage] | MessageHistory | None = None,
+        system_instruction: str | None = None,
+    ) -> LLMResponse:
+        """Send a prompt to the LLM unless its response is already cached."""
+        if message_history:
+            return self.llm.invoke(input, message_history, system_instruction)
+        key = self._key(input, system_instruction)
+        if (content := self._lookup(key)) is not None:
+            return LLMResponse(content=content)
+        response = self.llm.invoke(input, system_instruction=system_instruction)
+        self._store(key, response.content)
+        return response
+
+    async def ainvoke(
+        self,
+        input: str,  # noqa: A002
+        message_history: list[LLMMessage] | MessageHistory | None = None,
+        system_instruction: str | None = None,
+    ) -> LLMResponse:
+        """Asynchronously send a prompt unless its response is already cached."""
+        if message_history:
+            return await self.llm.ainvoke(input, message_history, system_instruction)
+        key = self._key(input, system_instruction)
+        if (content := await asyncio.to_thread(self._lookup, key)) is not None:
+            return LLMResponse(content=content)
+        response = await self.llm.ainvoke(input, system_instruction=system_instruction)
+        await asyncio.to_thread(self._store, key, response.content)
+        return response
+
+    def invoke_with_tools(
+        self,
+        input: str,  # noqa: A002
+        tools: Sequence[Tool],
+        message_history: list[LLMMessage] | MessageHistory | None = None,
+        system_instruction: str | None = None,
+    ) -> ToolCallResponse:
+        """Delegate tool calls to the wrapped LLM without caching."""
+        return self.llm.invoke_with_tools(
+            input, tools, message_history, system_instruction
+        )
+
+    async def ainvoke_with_tools(
+        self,
+        input: str,  # noqa: A002
+        tools: Sequence[Tool],
+        message_history: list[LLMMessage] | MessageHistory | None = None,
+        system_instruction: str | None = None,
+    ) -> ToolCallResponse:
+        """Delegate tool calls to the wrapped LLM without caching."""
+        return await self.llm.ainvoke_with_tools(
+            input, tools, message_history, system_instruction
+        )
+
+
+@lru_cache(maxsize=1)
+def get_extraction_cache() -> ExtractionCache | None:
+    """Get the configured extraction cache, or None if caching is disabled."""
+    if not config.cache.extraction_path:
+        return None
+    return ExtractionCache(
+        config.cache.extraction_path, max_entries=config.cache.extraction_max_entries
+    )
@@ -0,0 +1,242 @@
+"""Adaptive concurrency control for LLM calls made during ingestion."""
+
+import asyncio
+import functools
+import logging
+import random
+import time
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import openai
+from neo4j_graphrag.exceptions import RateLimitError
+from neo4j_graphrag.utils.rate_limit import AF, F, RateLimitHandler
+
+logger = logging.getLogger(__name__)
+
+_OVERLOAD_ERRORS = (
+    RateLimitError,
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    TimeoutError,
+)
+
+
+def _exception_chain(exc: BaseException) -> Iterator[BaseException]:
+    """Yield an exception and every exception it wraps or was raised from."""
+    seen: set[int] = set()
+    stack: list[BaseException | None] = [exc]
+    while stack:
+        current = stack.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        yield current
+        stack.extend([current.__cause__, current.__context__])
+        stack.extend(arg for arg in current.args if isinstance(arg, BaseException))
+
+
+def is_overload(exc: BaseException) -> bool:
+    """Return True if an LLM error means the provider is overloaded.
+
+    Provider errors reach us wrapped in LLMGenerationError or converted to
+    RateLimitError, so the whole exception chain is inspected.
+    """
+    return any(isinstance(e, _OVERLOAD_ERRORS) for e in _exception_chain(exc))
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Read the provider's Retry-After hint from an LLM error, if any.
+
+    Supports ``retry-after-ms`` as well as ``Retry-After`` in seconds or as
+    an HTTP date.
+    """
+    for e in _exception_chain(exc):
+        headers = getattr(getattr(e, "response", None), "headers", None)
+        if not headers:
+            continue
+        try:
+            if milliseconds := headers.get("retry-after-ms"):
+                return max(float(milliseconds) / 1000, 0.0)
+            if value := headers.get("retry-after"):
+                try:
+                    return max(float(value), 0.0)
+                except ValueError:
+                    when = parsedate_to_datetime(value)
+                    return max((when - datetime.now(timezone.utc)).total_seconds(), 0)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+class AIMDLimiter:
+    """Concurrency limit that adapts to provider overload (AIMD).
+
+    Each successful call raises the limit by ``1 / limit``, so the limit grows
+    by about one per window of successful calls. An overload (429 or timeout)
+    multiplies it by ``backoff``, at most once per window: calls that started
+    before the last cut do not cut again. A Retry-After hint pauses all new
+    calls until it expires.
+
+    The limiter must be used from a single event loop. Its state is local to
+    the process: separate processes each adapt on their own and do not see
+    each other's overloads.
+
+    Args:
+        initial: Starting concurrency limit.
+        min_limit: Lowest concurrency limit.
+        max_limit: Highest concurrency limit.
+        backoff: Factor applied to the limit on overload.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+    ) -> None:
+        if not 1 <= min_limit <= initial <= max_limit:
+            msg = "Concurrency limits must satisfy 1 <= min <= initial <= max"
+            raise ValueError(msg)
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.in_flight = 0
+        self._epoch = 0
+        self._paused_until = 0.0
+        self._waiters: list[asyncio.Future[None]] = []
+
+    def _wake(self) -> None:
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+    async def acquire(self) -> int:
+        """Wait for a free slot.
+
+        Returns:
+            The limiter epoch at admission, to pass to :meth:`on_overload`.
+        """
+        while True:
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+            if self.in_flight < int(self.limit):
+                break
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+        self.in_flight += 1
+        return self._epoch
+
+    def on_success(self) -> None:
+        """Release a slot after a successful call and grow the limit."""
+        self.in_flight -= 1
+        self.limit = min(self.limit + 1 / self.limit, float(self.max_limit))
+        self._wake()
+
+    def on_overload(self, epoch: int, retry_after: float | None = None) -> None:
+        """Release a slot after an overload and shrink the limit.
+
+        Args:
+            epoch: Epoch returned by :meth:`acquire` for this call.
+            retry_after: Seconds the provider asked us to wait, if any.
+        """
+        self.in_flight -= 1
+        if epoch == self._epoch:
+            self.limit = max(self.limit * self.backoff, float(self.min_limit))
+            self._epoch += 1
+            logger.info("LLM overloaded; concurrency limit cut to %d", int(self.limit))
+        if retry_after:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        self._wake()
+
+    def on_error(self) -> None:
+        """Release a slot after a call failed for an unrelated reason."""
+        self.in_flight -= 1
+        self._wake()
+
+
+class AdaptiveRateLimitHandler(RateLimitHandler):
+    """neo4j-graphrag rate limit handler backed by an AIMDLimiter.
+
+    Async calls are admitted through the limiter and retried on overload,
+    waiting for the provider's Retry-After hint or an exponential backoff with
+    jitter. Sync calls are retried the same way without admission control.
+
+    Args:
+        limiter: Limiter shared by every call of the LLM.
+        max_attempts: Attempts per call before the overload error is raised.
+        base_delay: First backoff delay in seconds without a Retry-After hint.
+        max_delay: Upper bound on backoff delays in seconds.
+    """
+
+    def __init__(
+        self,
+        limiter: AIMDLimiter,
+        max_attempts: int = 8,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ) -> None:
+        self.limiter = limiter
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def _delay(self, retry_after: float | None, attempt: int) -> float:
+        if retry_after is not None:
+            return retry_after
+        backoff = min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+        return random.uniform(backoff / 2, backoff)  # noqa: S311
+
+    def handle_sync(self, func: F) -> F:
+        """Retry a synchronous call on overload."""
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            attempt = 1
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if not is_overload(e) or attempt >= self.max_attempts:
+                        raise
+                    time.sleep(self._delay(retry_after_seconds(e), attempt))
+                attempt += 1
+
+        return wrapper  # type: ignore[return-value]
+
+    def handle_async(self, func: AF) -> AF:
+        """Admit an asynchronous call through the limiter, retrying on overload."""
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            attempt = 1
+            while True:
+                epoch = await self.limiter.acquire()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    if not is_overload(e):
+                        self.limiter.on_error()
+                        raise
+                    retry_after = retry_after_seconds(e)
+                    self.limiter.on_overload(epoch, retry_after)
+                    if attempt >= self.max_attempts:
+                        raise
+                    await asyncio.sleep(self._delay(retry_after, attempt))
+                except BaseException:
+                    self.limiter.on_error()
+                    raise
+                else:
+                    self.limiter.on_success()
+                    return result
+                attempt += 1
+
+        return wrapper  # type: ignore[return-value]
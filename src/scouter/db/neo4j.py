@@ -10,6 +10,14 @@ from neo4j_graphrag.llm import OpenAILLM
 
 from neo4j import GraphDatabase
 from scouter.config import config
+from scouter.db.embedding_cache import (
+    CachedEmbedder,
+    QueryCachedEmbedder,
+    get_embedding_cache,
+    get_query_embedding_cache,
+)
+from scouter.db.llm_cache import CachedLLM, get_extraction_cache
+from scouter.db.llm_limiter import AdaptiveRateLimitHandler, AIMDLimiter
 
 
 @lru_cache(maxsize=1)
@@ -22,13 +30,56 @@ def get_neo4j_driver():
 
 @lru_cache(maxsize=1)
 def get_neo4j_llm():
-    """Get a singleton Neo4j LLM instance."""
-    return OpenAILLM(
-        config.db.llm_model, api_key=config.llm.api_key, base_url=config.llm.base_url
+    """Get a singleton Neo4j LLM instance.
+
+    Calls share one adaptive concurrency limiter per process, which backs off
+    on rate limits and timeouts. Ingestion workers run a threads pool, so the
+    limiter covers every task of a worker process. Responses are served from the persistent
+    extraction cache when the same prompt was answered before, unless
+    ``EXTRACTION_CACHE_PATH`` is empty.
+    """
+    limiter = AIMDLimiter(
+        initial=config.ingestion.llm_concurrency_initial,
+        max_limit=config.ingestion.llm_concurrency_max,
+    )
+    llm = OpenAILLM(
+        config.db.llm_model,
+        api_key=config.llm.api_key,
+        base_url=config.llm.base_url,
+        rate_limit_handler=AdaptiveRateLimitHandler(
+            limiter, max_attempts=config.ingestion.llm_max_attempts
+        ),
     )
+    cache = get_extraction_cache()
+    if cache is None:
+        return llm
+    return CachedLLM(llm, cache)
 
 
 @lru_cache(maxsize=1)
 def get_neo4j_embedder():
-    """Get a singleton Neo4j embedder instance."""
-    return SentenceTransformerEmbeddings(config.db.embedder_model)
+    """Get a singleton Neo4j embedder instance.
+
+    The embedder consults the persistent embedding cache first unless caching
+    is disabled by setting ``EMBEDDING_CACHE_PATH`` to an empty string.
+    """
+    embedder = SentenceTransformerEmbeddings(config.db.embedder_model)
+    cache = get_embedding_cache()
+    if cache is None:
+        return embedder
+    return CachedEmbedder(embedder, cache, model=config.db.embedder_model)
+
+
+@lru_cache(maxsize=1)
+def get_query_embedder():
+    """Get a singleton embedder for search queries.
+
+    Wraps the Neo4j embedder with the in-process query embedding cache, so a
+    repeated query is not embedded again, unless
+    ``SEARCH_QUERY_EMBEDDING_CACHE_SIZE`` is 0.
+    """
+    embedder = get_neo4j_embedder()
+    cache = get_query_embedding_cache()
+    if cache is None:
+        return embedder
+    return QueryCachedEmbedder(embedder, cache, model=config.db.embedder_model)
@@ -0,0 +1,117 @@
+"""Process-wide Neo4j retrievers for search tools."""
+
+import threading
+import time
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+import neo4j
+from neo4j_graphrag.embeddings.base import Embedder
+from neo4j_graphrag.retrievers import VectorRetriever
+from neo4j_graphrag.types import RetrieverResult, RetrieverResultItem
+
+from scouter.config import config
+from scouter.db.neo4j import get_neo4j_driver
+
+
+class RetrieverRegistry:
+    """Reusable VectorRetrievers keyed by index, embedder and result shape.
+
+    Building a VectorRetriever checks the Neo4j version and reads the vector
+    index's label, property and dimensions, two round-trips that a search
+    should not pay every time. Retrievers are built on first use and reused
+    until ``ttl_s`` seconds have passed, after which the next search rebuilds
+    the retriever and so re-reads the index metadata. A search failing with
+    a Neo4j client error, as after the index was dropped or recreated, is
+    retried once on a rebuilt retriever.
+
+    Args:
+        driver: Neo4j driver shared by the retrievers.
+        ttl_s: Seconds a retriever's index metadata is trusted.
+    """
+
+    def __init__(self, driver: neo4j.Driver, ttl_s: float) -> None:
+        self.driver = driver
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._retrievers: dict[tuple[Any, ...], tuple[VectorRetriever, float]] = {}
+
+    def get(
+        self,
+        index_name: str,
+        embedder: Embedder,
+        result_formatter: Callable[[neo4j.Record], RetrieverResultItem] | None = None,
+        return_properties: tuple[str, ...] | None = None,
+    ) -> VectorRetriever:
+        """Return the retriever of an index, building it if needed.
+
+        Args:
+            index_name: Name of the vector index.
+            embedder: Embedder for query texts.
+            result_formatter: Formatter of result records.
+            return_properties: Node properties the search query returns; all
+                but the embedding if None.
+
+        Returns:
+            A retriever shared with other callers.
+        """
+        key = (index_name, embedder, result_formatter, return_properties)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._retrievers.get(key)
+            if entry is not None and now - entry[1] < self.ttl_s:
+                return entry[0]
+        retriever = VectorRetriever(
+            driver=self.driver,
+            index_name=index_name,
+            embedder=embedder,
+            result_formatter=result_formatter,
+            return_properties=list(return_properties) if return_properties else None,
+        )
+        with self._lock:
+            self._retrievers[key] = (retriever, now)
+        return retriever
+
+    def invalidate(self, index_name: str | None = None) -> None:
+        """Drop cached retrievers of an index, or of every index."""
+        with self._lock:
+            for key in list(self._retrievers):
+                if index_name is None or key[0] == index_name:
+                    del self._retrievers[key]
+
+    def search(
+        self,
+        index_name: str,
+        embedder: Embedder,
+        result_formatter: Callable[[neo4j.Record], RetrieverResultItem] | None = None,
+        return_properties: tuple[str, ...] | None = None,
+        **search_params: Any,
+    ) -> RetrieverResult:
+        """Search an index, refreshing its retriever if the index changed.
+
+        Args:
+            index_name: Name of the vector index.
+            embedder: Embedder for query texts.
+            result_formatter: Formatter of result records.
+            return_properties: Node properties the search query returns.
+            **search_params: Arguments of ``VectorRetriever.search``.
+
+        Returns:
+            The retriever's result.
+        """
+        retriever = self.get(index_name, embedder, result_formatter, return_properties)
+        try:
+            return retriever.search(**search_params)
+        except neo4j.exceptions.ClientError:
+            self.invalidate(index_name)
+            retriever = self.get(
+                index_name, embedder, result_formatter, return_properties
+            )
+            return retriever.search(**search_params)
+
+
+@lru_cache(maxsize=1)
+def get_retriever_registry() -> RetrieverRegistry:
+    """Get the process-wide retriever registry."""
+    return RetrieverRegistry(get_neo4j_driver(), ttl_s=config.search.retriever_ttl_s)
@@ -0,0 +1,138 @@
+"""In-process cache of search results, invalidated when the corpus changes."""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import lru_cache
+from typing import Any, TypeVar
+
+import redis
+
+from scouter.config import config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Redis counter bumped by ingestion after every write to the graph.
+CORPUS_VERSION_KEY = "scouter:corpus_version"
+
+# Seconds to wait for Redis before searching uncached; a slow or unreachable
+# Redis must not stall searches.
+REDIS_TIMEOUT_S = 0.25
+
+
+class SearchResultCache:
+    """Search results reused until they expire or new data is ingested.
+
+    Each result is stored with the corpus version current when its search
+    started. The version is a Redis counter shared by every process and
+    bumped by ingestion after each write. The version read from Redis is
+    reused for ``version_ttl_s``, so cache hits need no round trip and a
+    result computed before a write is served at most that long after it.
+    When Redis is unavailable, searches run uncached.
+
+    Args:
+        client: Redis client holding the corpus version.
+        ttl_s: Seconds a result is reused at most.
+        max_entries: Maximum number of cached results, least recently used
+            evicted first.
+        version_ttl_s: Seconds the corpus version is reused before it is
+            read from Redis again.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        ttl_s: float,
+        max_entries: int,
+        version_ttl_s: float = 1.0,
+    ) -> None:
+        self.client = client
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.version_ttl_s = version_ttl_s
+        self._lock = threading.Lock()
+        self._results: OrderedDict[Hashable, tuple[int, float, Any]] = OrderedDict()
+        self._version_value: int | None = None
+        self._version_expires = 0.0
+
+    def _version(self) -> int | None:
+        now = time.monotonic()
+        with self._lock:
+            if now < self._version_expires:
+                return self._version_value
+        try:
+            version = int(self.client.get(CORPUS_VERSION_KEY) or 0)
+        except redis.RedisError:
+            logger.warning("Failed to read the corpus version", exc_info=True)
+            version = None
+        # Failures are remembered too, so an unreachable Redis costs one
+        # timeout per interval rather than one per search.
+        with self._lock:
+            self._version_value = version
+            self._version_expires = now + self.version_ttl_s
+        return version
+
+    def get_or_search(self, key: Hashable, search: Callable[[], T]) -> T:
+        """Return the cached result of a search, running it on a miss.
+
+        Args:
+            key: Identifies the search, including all of its parameters.
+            search: Runs the search.
+
+        Returns:
+            The cached or freshly computed result.
+        """
+        version = self._version()
+        if version is None:
+            return search()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None and entry[0] == version and entry[1] > now:
+                self._results.move_to_end(key)
+                return entry[2]
+        result = search()
+        with self._lock:
+            self._results[key] = (version, now + self.ttl_s, result)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        return result
+
+
+@lru_cache(maxsize=1)
+def _get_redis() -> redis.Redis:
+    return redis.Redis.from_url(
+        config.ingestion.redis_url,
+        socket_timeout=REDIS_TIMEOUT_S,
+        socket_connect_timeout=REDIS_TIMEOUT_S,
+    )
+
+
+def bump_corpus_version() -> None:
+    """Invalidate cached search results in every process.
+
+    Failures are logged rather than raised, so ingestion never fails because
+    of the cache; cached results then expire with their TTL.
+    """
+    try:
+        _get_redis().incr(CORPUS_VERSION_KEY)
+    except redis.RedisError:
+        logger.warning("Failed to bump the corpus version", exc_info=True)
+
+
+@lru_cache(maxsize=1)
+def get_search_result_cache() -> SearchResultCache | None:
+    """Get the process-wide search result cache, or None if disabled."""
+    if config.search.result_cache_ttl_s <= 0:
+        return None
+    return SearchResultCache(
+        _get_redis(),
+        ttl_s=config.search.result_cache_ttl_s,
+        max_entries=config.search.result_cache_max_entries,
+        version_ttl_s=config.search.result_cache_version_ttl_s,
+    )
@@ -0,0 +1,138 @@
+"""Size-bounded key/value caches stored in SQLite files."""
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+# Stay well below SQLite's bound-parameter limit on older builds.
+_MAX_PARAMS = 500
+
+
+def _batches(items: list[str]) -> Iterable[list[str]]:
+    for i in range(0, len(items), _MAX_PARAMS):
+        yield items[i : i + _MAX_PARAMS]
+
+
+class SQLiteCache:
+    """Byte values stored on disk, keyed by (model name, key).
+
+    When the cache holds more than ``max_entries`` values, the least recently
+    used ones are evicted. Hit and miss counters are kept in the database
+    file, so every process sharing the file contributes to the same totals.
+    Subclasses set ``table`` and convert values to and from bytes.
+
+    Args:
+        path: Path of the SQLite database file.
+        max_entries: Maximum number of cached values.
+    """
+
+    table = "entries"
+
+    def __init__(self, path: str, max_entries: int) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # SQLite connections must not cross a fork, so reopen in each process.
+        if self._conn is None or self._pid != os.getpid():
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    model TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (model, key)
+                );
+                CREATE INDEX IF NOT EXISTS {self.table}_last_used
+                    ON {self.table} (last_used);
+                CREATE TABLE IF NOT EXISTS counters (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO counters VALUES ('hits', 0), ('misses', 0);
+                """  # noqa: S608
+            )
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def get_raw(self, model: str, keys: list[str]) -> dict[str, bytes]:
+        """Look up cached values and count hits and misses.
+
+        Args:
+            model: Model name that scopes the keys.
+            keys: Keys to look up.
+
+        Returns:
+            Cached values by key; missing keys are absent.
+        """
+        keys = list(dict.fromkeys(keys))
+        found: dict[str, bytes] = {}
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                for batch in _batches(keys):
+                    placeholders = ",".join("?" * len(batch))
+                    rows = conn.execute(
+                        f"SELECT key, value FROM {self.table} WHERE model = ? AND key IN ({placeholders})",  # noqa: S608
+                        [model, *batch],
+                    ).fetchall()
+                    found.update(rows)
+                    if rows:
+                        conn.execute(
+                            f"UPDATE {self.table} SET last_used = ? WHERE model = ? AND key IN ({placeholders})",  # noqa: S608
+                            [time.time(), model, *batch],
+                        )
+                conn.executemany(
+                    "UPDATE counters SET value = value + ? WHERE name = ?",
+                    [(len(found), "hits"), (len(keys) - len(found), "misses")],
+                )
+        return found
+
+    def put_raw(self, model: str, values: dict[str, bytes]) -> None:
+        """Store values and evict the least recently used ones over the limit.
+
+        Args:
+            model: Model name that scopes the keys.
+            values: Values by key.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?)",  # noqa: S608
+                    [(model, key, value, now) for key, value in values.items()],
+                )
+                (entries,) = conn.execute(
+                    f"SELECT COUNT(*) FROM {self.table}"  # noqa: S608
+                ).fetchone()
+                if entries > self.max_entries:
+                    conn.execute(
+                        f"DELETE FROM {self.table} WHERE rowid IN (SELECT rowid FROM {self.table} ORDER BY last_used LIMIT ?)",  # noqa: S608
+                        (entries - self.max_entries,),
+                    )
+
+    def stats(self) -> dict[str, int]:
+        """Return hit and miss counters and the number of cached values."""
+        with self._lock:
+            conn = self._connect()
+            counters = dict(conn.execute("SELECT name, value FROM counters"))
+            (entries,) = conn.execute(
+                f"SELECT COUNT(*) FROM {self.table}"  # noqa: S608
+            ).fetchone()
+        return {
+            "hits": counters["hits"],
+            "misses": counters["misses"],
+            "entries": entries,
+            "max_entries": self.max_entries,
+        }
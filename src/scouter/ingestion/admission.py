@@ -0,0 +1,61 @@
+"""Admission control for ingestion requests."""
+
+from fastapi import HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+
+from scouter.config import config
+from scouter.ingestion.progress import get_progress_store
+from scouter.ingestion.tasks import INGEST_QUEUES
+
+
+def request_tenant(request: Request) -> str | None:
+    """Return the tenant of an authenticated request, if any."""
+    identity = getattr(request.state, "identity", None)
+    return getattr(identity, "tenant_id", None)
+
+
+def _overloaded(incoming: int, tenant: str | None) -> str | None:
+    """Return why a request of ``incoming`` bytes must wait, or None."""
+    cfg = config.ingestion
+    store = get_progress_store()
+    if cfg.max_queued_messages:
+        queued = sum(store.queue_depths(INGEST_QUEUES).values())
+        if queued >= cfg.max_queued_messages:
+            return f"{queued} ingestion tasks are already queued"
+    limits = [(None, cfg.max_inflight_bytes)]
+    if tenant:
+        limits.append((tenant, cfg.tenant_max_inflight_bytes))
+    for scope, limit in limits:
+        if not limit:
+            continue
+        # An idle system always admits one request, however large.
+        inflight = store.inflight_bytes(scope)
+        if inflight and inflight + incoming > limit:
+            owner = f"tenant {scope}" if scope else "the system"
+            return f"Too many bytes in flight for {owner}"
+    return None
+
+
+async def check_admission(request: Request) -> None:
+    """Reject an ingestion request while the workers are saturated.
+
+    The broker queue depth and the bytes of documents queued or in
+    processing are checked against the configured limits, globally and for
+    the request's tenant. The request's Content-Length counts towards the
+    byte limits.
+
+    Args:
+        request: Incoming ingestion request.
+
+    Raises:
+        HTTPException: 429 with a Retry-After header if a limit is reached.
+    """
+    content_length = request.headers.get("content-length", "")
+    incoming = int(content_length) if content_length.isdigit() else 0
+    reason = await run_in_threadpool(_overloaded, incoming, request_tenant(request))
+    if reason is not None:
+        raise HTTPException(
+            status_code=429,
+            detail=f"{reason}; retry later",
+            headers={"Retry-After": str(config.ingestion.retry_after_s)},
+        )
@@ -1,43 +1,186 @@
 """API endpoints for document ingestion."""
 
 import json
-import tempfile
+from pathlib import Path
+from typing import Any
 
-from fastapi import APIRouter, Form, UploadFile
+from celery import group
+from celery.result import AsyncResult, GroupResult
+from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
+from starlette.concurrency import run_in_threadpool
 
 from scouter.config import config
-from scouter.ingestion.tasks import process_document_task
-from scouter.shared.domain_models import IngestResponse
+from scouter.db import get_neo4j_driver
+from scouter.db.documents import (
+    find_document_by_hash,
+    find_ingested_hashes,
+    merge_document_metadata,
+)
+from scouter.db.embedding_cache import get_embedding_cache
+from scouter.db.llm_cache import get_extraction_cache
+from scouter.db.sqlite_cache import SQLiteCache
+from scouter.ingestion.admission import request_tenant
+from scouter.ingestion.progress import get_progress_store
+from scouter.ingestion.service import fingerprint_text
+from scouter.ingestion.tasks import INGEST_QUEUES, document_signature
+from scouter.ingestion.tasks import app as celery_app
+from scouter.ingestion.types import ExtractionMode, IngestMode
+from scouter.ingestion.uploads import (
+    BatchUploadLimitRoute,
+    UploadLimitRoute,
+    iter_ndjson,
+    save_upload,
+)
+from scouter.shared.domain_models import (
+    BatchIngestResponse,
+    BatchStatusResponse,
+    CacheStats,
+    IngestResponse,
+    IngestStats,
+    StageStats,
+    TaskStatusResponse,
+)
 
-router = APIRouter()
+router = APIRouter(route_class=UploadLimitRoute)
+batch_router = APIRouter(route_class=BatchUploadLimitRoute)
+
+
+async def _merge_if_ingested(content_hash: str, metadata: dict) -> bool:
+    """Merge metadata into an already-ingested document with the same content.
+
+    Returns:
+        True if the content was already ingested and no pipeline work is needed.
+    """
+    driver = get_neo4j_driver()
+    if await run_in_threadpool(find_document_by_hash, driver, content_hash) is None:
+        return False
+    await run_in_threadpool(merge_document_metadata, driver, content_hash, metadata)
+    return True
+
+
+def _parse_metadata(metadata: str) -> dict[str, Any]:
+    try:
+        metadata_dict = json.loads(metadata)
+    except json.JSONDecodeError:
+        return {}
+    return metadata_dict if isinstance(metadata_dict, dict) else {}
+
+
+async def _cache_stats(cache: SQLiteCache | None, name: str) -> CacheStats:
+    if cache is None:
+        raise HTTPException(status_code=404, detail=f"{name} cache is disabled")
+    stats = await run_in_threadpool(cache.stats)
+    lookups = stats["hits"] + stats["misses"]
+    return CacheStats(**stats, hit_rate=stats["hits"] / lookups if lookups else 0.0)
+
+
+@router.get("/v1/ingest/embedding-cache", response_model=CacheStats)
+async def get_embedding_cache_stats() -> CacheStats:
+    """Report embedding cache hit/miss counters for sizing the cache."""
+    return await _cache_stats(get_embedding_cache(), "Embedding")
+
+
+@router.get("/v1/ingest/extraction-cache", response_model=CacheStats)
+async def get_extraction_cache_stats() -> CacheStats:
+    """Report extraction cache hit/miss counters for sizing the cache."""
+    return await _cache_stats(get_extraction_cache(), "Extraction")
+
+
+@router.get("/v1/ingest/stats", response_model=IngestStats)
+async def get_ingest_stats() -> IngestStats:
+    """Report queue depths and mean stage timings for capacity planning."""
+    store = get_progress_store()
+    queues = await run_in_threadpool(store.queue_depths, INGEST_QUEUES)
+    totals = await run_in_threadpool(store.stage_totals)
+    return IngestStats(
+        queues=queues,
+        stages={
+            stage: StageStats(
+                documents=int(total["documents"]),
+                total_seconds=total["seconds"],
+                mean_seconds=total["seconds"] / total["documents"],
+            )
+            for stage, total in totals.items()
+        },
+    )
+
+
+def _task_status(task_id: str) -> TaskStatusResponse | None:
+    task_progress = get_progress_store().get(task_id)
+    result = AsyncResult(task_id, app=celery_app)
+    state = result.state
+    if state == "PENDING":
+        if task_progress is None:
+            return None
+        if task_progress["stage"] != "queued":
+            state = "STARTED"
+    task_progress = task_progress or {}
+    return TaskStatusResponse(
+        task_id=task_id,
+        state=state,
+        stage=task_progress.get("stage"),
+        chunks=task_progress.get("chunks"),
+        durations=task_progress.get("durations", {}),
+        result=result.result if state == "SUCCESS" else None,
+        error=str(result.result) if state == "FAILURE" else None,
+    )
+
+
+@router.get("/v1/ingest/{task_id}", response_model=TaskStatusResponse)
+async def get_task_status(task_id: str) -> TaskStatusResponse:
+    """Report the state, current stage and stage timings of an ingestion.
+
+    Args:
+        task_id: ID returned by the ingestion endpoint.
+
+    Returns:
+        TaskStatusResponse with the chunk count and seconds spent per stage.
+
+    Raises:
+        HTTPException: 404 if the task is unknown or has expired.
+    """
+    status = await run_in_threadpool(_task_status, task_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Unknown task: {task_id}")
+    return status
 
 
 @router.post("/v1/ingest", response_model=IngestResponse, status_code=202)
 async def ingest_document(
+    request: Request,
     file: UploadFile | None = None,
     text: str | None = Form(None),
     metadata: str = Form("{}"),
+    *,
+    mode: IngestMode = Form("interactive"),
+    extraction: ExtractionMode = Form("inline"),
 ) -> IngestResponse:
     """Ingest a PDF file or raw text into the knowledge graph asynchronously.
 
     Provide either 'file' (PDF) or 'text', not both.
 
     Args:
+        request: Incoming request, used for the tenant of the identity.
         file: PDF file to ingest.
         text: Raw text content to ingest.
         metadata: JSON string containing metadata.
+        mode: "interactive" (default) or "backfill". Interactive documents
+            are processed ahead of queued backfill documents.
+        extraction: "inline" (default) to build the knowledge graph before
+            the task completes, "deferred" to make the chunks searchable by
+            vector first and extract the graph later at backfill priority,
+            or "skip" for vector search only.
 
     Returns:
-        IngestResponse with task ID and status.
+        IngestResponse with task ID and status. Content that was already
+        ingested returns status "already_ingested" without a task.
 
     Raises:
         ValueError: If input validation fails.
+        HTTPException: 413 if the uploaded file exceeds the configured size limit,
+            429 with Retry-After while ingestion is saturated.
     """
-    # Parse metadata
-    try:
-        metadata_dict = json.loads(metadata)
-    except json.JSONDecodeError:
-        metadata_dict = {}
+    metadata_dict = _parse_metadata(metadata)
 
     # Validate input
     if (file is None and text is None) or (file is not None and text is not None):
@@ -47,13 +190,197 @@ async def ingest_document(
     task_data = {"metadata": metadata_dict}
 
     if file is not None:
-        # Save file to temp location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            temp_file.write(await file.read())
-            task_data["file_path"] = temp_file.name
+        # Stream file to temp location, hashing as we go
+        upload = await save_upload(file)
+        task_data["file_path"] = upload.path
+        task_data["content_hash"] = upload.content_hash
     else:
         task_data["text"] = text
+        task_data["content_hash"] = fingerprint_text(text)
 
     cfg = config.llm
-    task = process_document_task.apply_async(args=[task_data])
+    if await _merge_if_ingested(task_data["content_hash"], metadata_dict):
+        if "file_path" in task_data:
+            Path(task_data["file_path"]).unlink(missing_ok=True)
+        return IngestResponse(task_id=None, status="already_ingested", env=cfg.env)
+
+    signature = await run_in_threadpool(
+        document_signature, task_data, mode, request_tenant(request), extraction
+    )
+    task = signature.apply_async()
     return IngestResponse(task_id=task.id, status="accepted", env=cfg.env)
+
+
+async def _read_batch(
+    files: list[UploadFile], texts: UploadFile | None, metadata: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """Persist batch files and parse NDJSON texts into task payloads."""
+    items = []
+    for file in files:
+        upload = await save_upload(file)
+        items.append(
+            {
+                "metadata": dict(metadata),
+                "file_path": upload.path,
+                "content_hash": upload.content_hash,
+            }
+        )
+
+    if texts is not None:
+        async for item in iter_ndjson(texts):
+            text = item.get("text")
+            if not isinstance(text, str) or not text:
+                continue
+            item_metadata = item.get("metadata")
+            if not isinstance(item_metadata, dict):
+                item_metadata = {}
+            items.append(
+                {
+                    "metadata": {**metadata, **item_metadata},
+                    "text": text,
+                    "content_hash": fingerprint_text(text),
+                }
+            )
+    return items
+
+
+def _skip_duplicates(items: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], int]:
+    """Drop documents that repeat within the batch or were already ingested.
+
+    As for single uploads, a duplicate's metadata is not lost: metadata of a
+    document repeated within the batch is merged into its first occurrence,
+    later values taking precedence, and metadata of already-ingested documents
+    is merged into the existing node. Temp files of skipped uploads are
+    removed.
+
+    Returns:
+        Tuple of (documents to enqueue, number of skipped documents).
+    """
+    pending: dict[str, dict[str, Any]] = {}
+    skipped = []
+    for item in items:
+        first = pending.get(item["content_hash"])
+        if first is None:
+            pending[item["content_hash"]] = item
+            continue
+        first["metadata"] = {**first["metadata"], **item["metadata"]}
+        skipped.append(item)
+
+    driver = get_neo4j_driver()
+    ingested = find_ingested_hashes(driver, list(pending))
+    for content_hash in ingested:
+        item = pending.pop(content_hash)
+        merge_document_metadata(driver, content_hash, item["metadata"])
+        skipped.append(item)
+    for item in skipped:
+        if "file_path" in item:
+            Path(item["file_path"]).unlink(missing_ok=True)
+    return list(pending.values()), len(skipped)
+
+
+@batch_router.post(
+    "/v1/ingest/batch", response_model=BatchIngestResponse, status_code=202
+)
+async def ingest_batch(
+    request: Request,
+    files: list[UploadFile] | None = File(None),
+    texts: UploadFile | None = File(None),
+    metadata: str = Form("{}"),
+    *,
+    mode: IngestMode = Form("backfill"),
+    extraction: ExtractionMode = Form("inline"),
+) -> BatchIngestResponse:
+    """Ingest many PDF files and/or texts in one request.
+
+    Documents are fingerprinted and deduplicated up front, then fanned out as
+    a single Celery group so the whole batch is tracked under one ID.
+
+    Args:
+        request: Incoming request, used for the tenant of the identity.
+        files: PDF files to ingest.
+        texts: NDJSON file with one {"text": ..., "metadata": {...}} object per line.
+        metadata: JSON string with metadata applied to every document. Per-text
+            metadata from the NDJSON stream takes precedence.
+        mode: "backfill" (default) or "interactive". Backfill documents yield
+            to interactive ones on every queue.
+        extraction: "inline" (default), "deferred" or "skip"; see
+            :func:`ingest_document`.
+
+    Returns:
+        BatchIngestResponse with the batch ID and how many documents were enqueued.
+
+    Raises:
+        ValueError: If neither files nor texts are provided.
+        HTTPException: 413 if a file exceeds the size limit, 422 on bad NDJSON,
+            429 with Retry-After while ingestion is saturated.
+    """
+    if not files and texts is None:
+        msg = "At least one of 'files' or 'texts' must be provided"
+        raise ValueError(msg)
+
+    tenant = request_tenant(request)
+    items = await _read_batch(files or [], texts, _parse_metadata(metadata))
+    pending, skipped = await run_in_threadpool(_skip_duplicates, items)
+
+    cfg = config.llm
+    if not pending:
+        return BatchIngestResponse(
+            status="already_ingested",
+            accepted=0,
+            already_ingested=skipped,
+            env=cfg.env,
+        )
+
+    signatures = await run_in_threadpool(
+        lambda: [
+            document_signature(task_data, mode, tenant, extraction)
+            for task_data in pending
+        ]
+    )
+    result = group(signatures).apply_async()
+    result.save()
+    return BatchIngestResponse(
+        batch_id=result.id,
+        status="accepted",
+        accepted=len(pending),
+        already_ingested=skipped,
+        env=cfg.env,
+    )
+
+
+def _batch_states(batch_id: str) -> list[str] | None:
+    result = GroupResult.restore(batch_id, app=celery_app)
+    if result is None:
+        return None
+    return [child.state for child in result.results]
+
+
+@batch_router.get("/v1/ingest/batch/{batch_id}", response_model=BatchStatusResponse)
+async def get_batch_status(batch_id: str) -> BatchStatusResponse:
+    """Report aggregate progress of a batch ingestion.
+
+    Args:
+        batch_id: ID returned by the batch ingestion endpoint.
+
+    Returns:
+        BatchStatusResponse with completed, failed and pending counts.
+
+    Raises:
+        HTTPException: 404 if the batch is unknown or has expired.
+    """
+    states = await run_in_threadpool(_batch_states, batch_id)
+    if states is None:
+        raise HTTPException(status_code=404, detail=f"Unknown batch: {batch_id}")
+
+    completed = states.count("SUCCESS")
+    failed = states.count("FAILURE")
+    return BatchStatusResponse(
+        batch_id=batch_id,
+        total=len(states),
+        completed=completed,
+        failed=failed,
+        pending=len(states) - completed - failed,
+    )
+
+
+router.include_router(batch_router)
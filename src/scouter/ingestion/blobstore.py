@@ -0,0 +1,151 @@
+"""Local blob store for handing ingestion artifacts between stage tasks."""
+
+import logging
+import threading
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from scouter.config import config
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+# Seconds between sweeps for expired artifacts in one process.
+_SWEEP_INTERVAL_S = 60 * 60
+
+
+class BlobStore:
+    """Store pydantic artifacts as JSON files under a shared directory.
+
+    Stage tasks pass only the returned references through the Celery broker,
+    so large artifacts such as embedded chunks never travel through Redis.
+    Every worker running ingestion stages must see the same directory, e.g.
+    a shared volume.
+
+    Artifacts are deleted by the task that consumes them. Those left behind
+    by failed or killed tasks are swept once they are older than ``ttl_s``;
+    writes trigger the sweep at most once an hour per process.
+
+    Args:
+        root: Directory holding the artifacts.
+        ttl_s: Age in seconds after which artifacts are swept (0 keeps them).
+    """
+
+    def __init__(self, root: str, ttl_s: float = 0) -> None:
+        self.root = Path(root)
+        self.ttl_s = ttl_s
+        self._next_sweep = 0.0
+        self._sweep_lock = threading.Lock()
+
+    def _path(self, ref: str) -> Path:
+        path = (self.root / ref).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            msg = f"Invalid blob reference: {ref}"
+            raise ValueError(msg)
+        return path
+
+    def put(self, name: str, artifact: BaseModel) -> str:
+        """Write an artifact and return its reference.
+
+        The file is written under a temporary name and renamed into place, so
+        readers never see a partial artifact.
+
+        Args:
+            name: Short artifact name used in the reference, e.g. ``chunks``.
+            artifact: Artifact to store.
+
+        Returns:
+            Reference to pass to :meth:`get` and :meth:`delete`.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._maybe_sweep()
+        ref = f"{uuid.uuid4().hex}-{name}.json"
+        path = self._path(ref)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(artifact.model_dump_json(), encoding="utf-8")
+        tmp_path.replace(path)
+        return ref
+
+    def put_text(self, name: str, text: str) -> str:
+        """Write a text and return its reference, like :meth:`put`."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._maybe_sweep()
+        ref = f"{uuid.uuid4().hex}-{name}.txt"
+        path = self._path(ref)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        tmp_path.replace(path)
+        return ref
+
+    def get_text(self, ref: str) -> str:
+        """Read a text written with :meth:`put_text`.
+
+        The text is read whole: the pipeline needs it in memory to chunk it.
+        """
+        return self._path(ref).read_text(encoding="utf-8")
+
+    def get(self, ref: str, model: type[M]) -> M:
+        """Read an artifact.
+
+        Args:
+            ref: Reference returned by :meth:`put`.
+            model: Pydantic model of the artifact.
+
+        Returns:
+            The artifact.
+        """
+        return model.model_validate_json(self._path(ref).read_text(encoding="utf-8"))
+
+    def delete(self, *refs: str) -> None:
+        """Delete artifacts that are no longer needed."""
+        for ref in refs:
+            self._path(ref).unlink(missing_ok=True)
+
+    def sweep(self) -> int:
+        """Delete artifacts older than the TTL.
+
+        Returns:
+            Number of artifacts deleted.
+        """
+        if not self.ttl_s or not self.root.is_dir():
+            return 0
+        cutoff = time.time() - self.ttl_s
+        expired = [
+            path for path in self.root.iterdir() if _modified_before(path, cutoff)
+        ]
+        for path in expired:
+            path.unlink(missing_ok=True)
+        if expired:
+            logger.info("Swept %d expired ingestion artifacts", len(expired))
+        return len(expired)
+
+    def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        with self._sweep_lock:
+            if not self.ttl_s or now < self._next_sweep:
+                return
+            self._next_sweep = now + _SWEEP_INTERVAL_S
+        try:
+            self.sweep()
+        except OSError:
+            logger.warning("Failed to sweep expired ingestion artifacts", exc_info=True)
+
+
+def _modified_before(path: Path, cutoff: float) -> bool:
+    try:
+        return path.stat().st_mtime < cutoff
+    except FileNotFoundError:
+        # Consumed or swept by another worker meanwhile.
+        return False
+
+
+@lru_cache(maxsize=1)
+def get_blob_store() -> BlobStore:
+    """Get the blob store in the configured shared directory."""
+    return BlobStore(config.ingestion.blob_dir, ttl_s=config.ingestion.blob_ttl_s)
@@ -0,0 +1,323 @@
+"""Bulk ingestion of local files without the HTTP API or Celery.
+
+Documents are read from a directory or an NDJSON manifest and ingested
+in-process through :class:`IngestionService`. PDF text is extracted in a
+process pool, a fixed number of documents are ingested concurrently, and the
+outcome of every document is appended to a state file so an interrupted run
+resumes with the documents it had not finished.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from scouter.ingestion import progress
+from scouter.ingestion.pdf import load_pdf_text
+from scouter.ingestion.service import (
+    IngestionService,
+    fingerprint_file,
+    fingerprint_text,
+)
+from scouter.ingestion.types import ExtractionMode
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_SUFFIXES = frozenset({".pdf", ".txt", ".md"})
+MANIFEST_SUFFIXES = frozenset({".jsonl", ".ndjson"})
+
+
+@dataclass(frozen=True)
+class BulkItem:
+    """A document to ingest.
+
+    Attributes:
+        key: Identifies the document in the state file.
+        file_path: PDF or text file, if the document is a file.
+        text: Text content, if the document is given inline.
+        metadata: Properties of the Document node.
+    """
+
+    key: str
+    file_path: str | None = None
+    text: str | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def discover(source: str) -> Iterator[BulkItem]:
+    """List the documents under a directory, in a manifest, or a single file.
+
+    A directory is searched recursively for PDF, ``.txt`` and ``.md`` files.
+    A manifest has one JSON object per line with either ``path`` (relative to
+    the manifest) or ``text``, and optionally ``id`` and ``metadata``.
+
+    Args:
+        source: Directory, ``.jsonl``/``.ndjson`` manifest or document path.
+
+    Yields:
+        Documents in a stable order.
+
+    Raises:
+        ValueError: If a manifest line is not a JSON object with path or text.
+    """
+    path = Path(source)
+    if path.is_dir():
+        for file in sorted(path.rglob("*")):
+            if file.is_file() and file.suffix.lower() in DOCUMENT_SUFFIXES:
+                yield _file_item(str(file.relative_to(path)), file)
+        return
+    if path.suffix.lower() not in MANIFEST_SUFFIXES:
+        yield _file_item(path.name, path)
+        return
+    with path.open(encoding="utf-8") as manifest:
+        for line_no, line in enumerate(manifest, start=1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if not isinstance(entry, dict) or ("path" in entry) == ("text" in entry):
+                msg = f"{source}:{line_no}: expected an object with 'path' or 'text'"
+                raise ValueError(msg)
+            metadata = entry.get("metadata") or {}
+            if "path" in entry:
+                item = _file_item(entry["path"], path.parent / entry["path"])
+                yield BulkItem(
+                    key=str(entry.get("id", item.key)),
+                    file_path=item.file_path,
+                    metadata={**item.metadata, **metadata},
+                )
+            else:
+                yield BulkItem(
+                    key=str(entry.get("id", f"line:{line_no}")),
+                    text=entry["text"],
+                    metadata=metadata,
+                )
+
+
+def _file_item(key: str, file: Path) -> BulkItem:
+    return BulkItem(key=key, file_path=str(file), metadata={"source_path": str(file)})
+
+
+def _is_pdf(item: BulkItem) -> bool:
+    return item.file_path is not None and Path(item.file_path).suffix.lower() == ".pdf"
+
+
+class IngestState:
+    """Append-only record of finished documents, one JSON object per line.
+
+    The last record of a key wins. A truncated last line, left by a killed
+    run, is ignored.
+
+    Args:
+        path: Path of the state file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        self._tail_checked = False
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        """Read the latest record of every document."""
+        records: dict[str, dict[str, Any]] = {}
+        if not self.path.exists():
+            return records
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                records[record["key"]] = record
+        return records
+
+    def record(self, key: str, result: dict[str, Any]) -> None:
+        """Append the outcome of a document."""
+        line = json.dumps({"key": key, **result}) + "\n"
+        if not self._tail_checked:
+            # Start on a fresh line after a truncated one.
+            if self.path.exists() and self.path.stat().st_size:
+                with self.path.open("rb") as f:
+                    f.seek(-1, 2)
+                    if f.read() != b"\n":
+                        line = "\n" + line
+            self._tail_checked = True
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(line)
+
+
+@dataclass
+class BulkStats:
+    """Running totals of a bulk ingestion."""
+
+    documents: int = 0
+    failed: int = 0
+    skipped: int = 0
+    chunks: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    def summary(self) -> str:
+        """Describe progress and throughput so far."""
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return (
+            f"{self.documents} documents ({self.failed} failed, {self.skipped} "
+            f"already done), {self.documents * 60 / elapsed:.1f} docs/min, "
+            f"{self.chunks / elapsed:.1f} chunks/s"
+        )
+
+
+class BulkIngester:
+    """Ingest many local documents through an in-process IngestionService.
+
+    Args:
+        service: Ingestion service to run documents through.
+        state_path: State file used to resume an interrupted run.
+        concurrency: Documents ingested at the same time.
+        parse_workers: Processes extracting PDF text; None for one per CPU.
+        extraction: ``inline`` to extract the graph with each document,
+            ``deferred`` to index every document first and extract their
+            graphs afterwards, or ``skip`` for vector search only.
+        report_every: Seconds between progress log lines.
+    """
+
+    def __init__(
+        self,
+        service: IngestionService,
+        state_path: str,
+        *,
+        concurrency: int = 4,
+        parse_workers: int | None = None,
+        extraction: ExtractionMode = "inline",
+        report_every: float = 10.0,
+    ) -> None:
+        if concurrency < 1:
+            msg = "Concurrency must be at least 1"
+            raise ValueError(msg)
+        self.service = service
+        self.state = IngestState(state_path)
+        self.concurrency = concurrency
+        self.parse_workers = parse_workers
+        self.extraction = extraction
+        self.report_every = report_every
+        self.stats = BulkStats()
+
+    async def run(self, items: Iterable[BulkItem]) -> BulkStats:
+        """Ingest documents not already finished according to the state file.
+
+        Documents that failed in an earlier run are retried.
+
+        Args:
+            items: Documents to ingest.
+
+        Returns:
+            Totals of this run.
+        """
+        self.stats = BulkStats()
+        finished = self.state.load()
+        queue: asyncio.Queue[BulkItem | None] = asyncio.Queue(self.concurrency * 2)
+
+        async def feed() -> None:
+            for item in items:
+                if finished.get(item.key, {}).get("status", "failed") != "failed":
+                    self.stats.skipped += 1
+                    continue
+                await queue.put(item)
+            for _ in range(self.concurrency):
+                await queue.put(None)
+
+        async def work(pool: ProcessPoolExecutor) -> None:
+            while (item := await queue.get()) is not None:
+                await self._ingest(item, pool)
+
+        # Spawned workers do not inherit the service's driver or event loop.
+        context = multiprocessing.get_context("spawn")
+        reporter = asyncio.create_task(self._report())
+        try:
+            with ProcessPoolExecutor(self.parse_workers, mp_context=context) as pool:
+                await asyncio.gather(
+                    feed(), *(work(pool) for _ in range(self.concurrency))
+                )
+            if self.extraction == "deferred":
+                await self._extract_pending()
+        finally:
+            reporter.cancel()
+        logger.info("Done: %s", self.stats.summary())
+        return self.stats
+
+    async def _report(self) -> None:
+        while True:
+            await asyncio.sleep(self.report_every)
+            logger.info(self.stats.summary())
+
+    async def _parse(
+        self, item: BulkItem, pool: ProcessPoolExecutor
+    ) -> tuple[str, str]:
+        """Return the text and content hash of a document."""
+        if item.file_path is None:
+            return item.text, fingerprint_text(item.text)
+        if not _is_pdf(item):
+            text = await asyncio.to_thread(
+                Path(item.file_path).read_text, encoding="utf-8"
+            )
+            return text, fingerprint_text(text)
+        loop = asyncio.get_running_loop()
+        text, content_hash = await asyncio.gather(
+            loop.run_in_executor(pool, load_pdf_text, item.file_path),
+            asyncio.to_thread(fingerprint_file, item.file_path),
+        )
+        return text, content_hash
+
+    async def _ingest(self, item: BulkItem, pool: ProcessPoolExecutor) -> None:
+        with progress.counting_chunks() as chunks:
+            try:
+                text, content_hash = await self._parse(item, pool)
+                # PDFs keep their path and type; their text is not parsed again.
+                file_path = item.file_path if _is_pdf(item) else None
+                if self.extraction == "inline":
+                    result = await self.service.process_document(
+                        file_path=file_path,
+                        text=text,
+                        metadata=item.metadata,
+                        content_hash=content_hash,
+                    )
+                else:
+                    result = await self.service.index_document(
+                        file_path=file_path,
+                        text=text,
+                        metadata=item.metadata,
+                        content_hash=content_hash,
+                        defer_extraction=self.extraction == "deferred",
+                    )
+            except Exception as e:
+                logger.warning("Failed to ingest %s", item.key, exc_info=True)
+                result = {"status": "failed", "error": str(e)}
+        self.state.record(item.key, {**result, "chunks": chunks.value})
+        self.stats.documents += 1
+        self.stats.chunks += chunks.value
+        if result["status"] == "failed":
+            self.stats.failed += 1
+
+    async def _extract_pending(self) -> None:
+        """Extract the graphs of documents indexed with deferred extraction."""
+        pending = [
+            record
+            for record in self.state.load().values()
+            if record.get("extraction") == "pending"
+        ]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def extract(record: dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    await self.service.extract_deferred(record["content_hash"])
+                except Exception:
+                    logger.warning("Failed to extract %s", record["key"], exc_info=True)
+                    return
+            self.state.record(record["key"], {**record, "extraction": "done"})
+
+        logger.info("Extracting graphs of %d documents", len(pending))
+        await asyncio.gather(*(extract(record) for record in pending))
@@ -0,0 +1,89 @@
+"""Content-defined text chunking for ingestion."""
+
+import hashlib
+
+from neo4j_graphrag.experimental.components.text_splitters.base import TextSplitter
+from neo4j_graphrag.experimental.components.types import TextChunk, TextChunks
+
+
+def chunk_hash(text: str) -> str:
+    """Return the SHA-256 fingerprint of a chunk's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ContentDefinedSplitter(TextSplitter):
+    """Split text at line boundaries chosen by the content itself.
+
+    A chunk ends at a line whose hash hits the boundary modulus once the chunk
+    is at least ``min_chunk_size`` characters, or when adding the next line
+    would exceed ``chunk_size``. Because cut points depend on nearby content
+    rather than absolute offsets, an edit only changes the chunks around it;
+    later chunks keep identical text and hashes, which is what incremental
+    re-ingestion diffs against.
+
+    Each chunk carries its SHA-256 in ``metadata["content_hash"]``, which the
+    KG writer stores on the Chunk node.
+
+    Args:
+        chunk_size: Maximum number of characters in a chunk.
+        min_chunk_size: Minimum number of characters before a content-defined cut.
+        boundary_modulus: A line is a cut point when its hash is divisible by this.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 4000,
+        min_chunk_size: int = 2000,
+        boundary_modulus: int = 16,
+    ) -> None:
+        if not 0 < min_chunk_size <= chunk_size:
+            msg = "min_chunk_size must be positive and at most chunk_size"
+            raise ValueError(msg)
+        self.chunk_size = chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.boundary_modulus = boundary_modulus
+
+    def _pieces(self, text: str) -> list[str]:
+        pieces = []
+        for line in text.splitlines(keepends=True):
+            pieces.extend(
+                line[i : i + self.chunk_size]
+                for i in range(0, len(line), self.chunk_size)
+            )
+        return pieces
+
+    def _is_boundary(self, piece: str) -> bool:
+        digest = hashlib.blake2b(piece.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") % self.boundary_modulus == 0
+
+    async def run(self, text: str) -> TextChunks:
+        """Split text into content-defined chunks.
+
+        Args:
+            text: The text to be split.
+
+        Returns:
+            TextChunks with a content hash in each chunk's metadata.
+        """
+        texts: list[str] = []
+        current: list[str] = []
+        size = 0
+        for piece in self._pieces(text):
+            if current and size + len(piece) > self.chunk_size:
+                texts.append("".join(current))
+                current, size = [], 0
+            current.append(piece)
+            size += len(piece)
+            if size >= self.min_chunk_size and self._is_boundary(piece):
+                texts.append("".join(current))
+                current, size = [], 0
+        if current:
+            texts.append("".join(current))
+
+        chunks = [
+            TextChunk(
+                text=chunk, index=index, metadata={"content_hash": chunk_hash(chunk)}
+            )
+            for index, chunk in enumerate(t for t in texts if t.strip())
+        ]
+        return TextChunks(chunks=chunks)
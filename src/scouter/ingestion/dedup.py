@@ -0,0 +1,307 @@
+"""Near-duplicate chunk detection with MinHash and locality-sensitive hashing.
+
+Each chunk gets a MinHash signature over its word shingles. The signature is
+cut into bands; chunks sharing a band hash are candidates, and a candidate
+whose signature agrees on at least ``threshold`` of its positions is treated
+as the same text. Signatures and band hashes of canonical chunks are stored
+on their Chunk nodes, where a full-text index over the band hashes serves as
+the LSH index.
+
+A near-duplicate chunk is still written to its document, so the document
+keeps its full text, but it carries ``duplicate_of`` with the content hash of
+its canonical chunk instead of an embedding, and no entities are extracted
+from it. When a document update deletes a canonical chunk, its near-duplicates
+in every document are marked again, so one of them takes its place.
+"""
+
+import asyncio
+import hashlib
+import unicodedata
+from array import array
+from typing import Any
+
+import neo4j
+from neo4j_graphrag.experimental.components.entity_relation_extractor import (
+    LLMEntityRelationExtractor,
+)
+from neo4j_graphrag.experimental.components.lexical_graph import LexicalGraphBuilder
+from neo4j_graphrag.experimental.components.schema import GraphSchema
+from neo4j_graphrag.experimental.components.text_splitters.base import TextSplitter
+from neo4j_graphrag.experimental.components.types import (
+    DocumentInfo,
+    LexicalGraphConfig,
+    Neo4jGraph,
+    TextChunk,
+    TextChunks,
+)
+from neo4j_graphrag.experimental.pipeline.config.runner import PipelineRunner
+from neo4j_graphrag.experimental.pipeline.kg_builder import SimpleKGPipeline
+from pydantic import validate_call
+
+from scouter.db.documents import create_chunk_minhash_index, find_minhash_candidates
+
+# Hashes per blake2b call: a 64-byte digest holds eight 64-bit values.
+_HASHES_PER_DIGEST = 8
+
+
+def is_near_duplicate(chunk: TextChunk) -> bool:
+    """Whether a chunk was marked as a near-duplicate of another chunk."""
+    return bool(chunk.metadata and chunk.metadata.get("duplicate_of"))
+
+
+class MinHasher:
+    """MinHash signatures of texts over word shingles.
+
+    The hash functions are blake2b keyed with a different salt per group of
+    eight, so signatures are stable across processes and releases.
+
+    Args:
+        num_perm: Number of hash functions, a multiple of 8.
+        bands: Number of LSH bands; must divide ``num_perm``.
+        shingle_size: Number of words per shingle.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, shingle_size: int = 5):
+        if num_perm < 1 or num_perm % _HASHES_PER_DIGEST:
+            msg = "MinHash permutations must be a positive multiple of 8"
+            raise ValueError(msg)
+        if bands < 1 or num_perm % bands:
+            msg = "MinHash bands must divide the number of permutations"
+            raise ValueError(msg)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self._salts = [
+            group.to_bytes(16, "little")
+            for group in range(num_perm // _HASHES_PER_DIGEST)
+        ]
+
+    def shingles(self, text: str) -> set[bytes]:
+        """Return the word shingles of a text, ignoring case and layout."""
+        words = unicodedata.normalize("NFC", text).lower().split()
+        size = min(self.shingle_size, len(words)) or 1
+        return {
+            " ".join(words[i : i + size]).encode("utf-8")
+            for i in range(max(len(words) - size + 1, 1))
+        }
+
+    def signature(self, text: str) -> list[int]:
+        """Return the MinHash signature of a text as signed 64-bit integers."""
+        shingles = self.shingles(text)
+        signature: list[int] = []
+        for salt in self._salts:
+            digests = [
+                array("q", hashlib.blake2b(s, digest_size=64, salt=salt).digest())
+                for s in shingles
+            ]
+            signature.extend(min(column) for column in zip(*digests, strict=True))
+        return signature
+
+    def band_keys(self, signature: list[int]) -> list[str]:
+        """Return one hash per band of a signature, prefixed with its band."""
+        rows = self.num_perm // self.bands
+        return [
+            f"b{band}x"
+            + hashlib.blake2b(
+                array("q", signature[band * rows : (band + 1) * rows]).tobytes(),
+                digest_size=8,
+            ).hexdigest()
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def similarity(a: list[int], b: list[int]) -> float:
+        """Estimate the Jaccard similarity of two texts from their signatures."""
+        return sum(x == y for x, y in zip(a, b, strict=True)) / len(a)
+
+
+class NearDuplicateSplitter(TextSplitter):
+    """Text splitter that marks chunks duplicating earlier chunks.
+
+    Chunks are checked against earlier chunks of the same text and against
+    canonical chunks already stored in Neo4j. A chunk whose estimated
+    similarity to one of them reaches ``threshold`` gets ``duplicate_of`` set
+    to that chunk's content hash; every other chunk gets its ``minhash``
+    signature and ``minhash_bands`` so later chunks can find it.
+
+    Args:
+        splitter: Splitter producing the chunks, which must carry a
+            ``content_hash`` in their metadata.
+        driver: Neo4j driver.
+        hasher: MinHash parameters.
+        threshold: Minimum estimated Jaccard similarity of a near-duplicate.
+        candidates: Stored chunks compared per chunk, best LSH matches first.
+    """
+
+    def __init__(
+        self,
+        splitter: TextSplitter,
+        driver: neo4j.Driver,
+        hasher: MinHasher,
+        threshold: float = 0.9,
+        candidates: int = 5,
+    ) -> None:
+        self.splitter = splitter
+        self.driver = driver
+        self.hasher = hasher
+        self.threshold = threshold
+        self.candidates = candidates
+        self._index_ready = False
+
+    def _best_match(
+        self, signature: list[int], candidates: list[tuple[list[int], str]]
+    ) -> str | None:
+        """Return the content hash of the most similar candidate, if similar enough."""
+        best, best_score = None, self.threshold
+        for other, content_hash in candidates:
+            score = self.hasher.similarity(signature, other)
+            if score >= best_score:
+                best, best_score = content_hash, score
+        return best
+
+    def _mark(self, chunks: list[TextChunk]) -> list[TextChunk]:
+        if not chunks:
+            return []
+        if not self._index_ready:
+            create_chunk_minhash_index(self.driver)
+            self._index_ready = True
+        signatures = [self.hasher.signature(chunk.text) for chunk in chunks]
+        bands = [self.hasher.band_keys(signature) for signature in signatures]
+        stored = find_minhash_candidates(self.driver, bands, self.candidates)
+
+        # Band index of the canonical chunks seen so far in this text.
+        local: dict[str, list[int]] = {}
+        marked = []
+        for i, chunk in enumerate(chunks):
+            metadata = dict(chunk.metadata or {})
+            earlier = dict.fromkeys(j for key in bands[i] for j in local.get(key, []))
+            canonical = self._best_match(
+                signatures[i],
+                [(signatures[j], chunks[j].metadata["content_hash"]) for j in earlier]
+                + [(row["minhash"], row["content_hash"]) for row in stored[i]],
+            )
+            if canonical is None:
+                metadata["minhash"] = signatures[i]
+                metadata["minhash_bands"] = " ".join(bands[i])
+                for key in bands[i]:
+                    local.setdefault(key, []).append(i)
+            else:
+                metadata["duplicate_of"] = canonical
+            marked.append(
+                TextChunk(
+                    text=chunk.text, index=chunk.index, metadata=metadata, uid=chunk.uid
+                )
+            )
+        return marked
+
+    def canonical(self, chunk: TextChunk) -> TextChunk:
+        """Return a near-duplicate chunk unmarked, to be stored as canonical.
+
+        Used when the chunk it duplicates is about to be deleted.
+        """
+        metadata = {
+            key: value
+            for key, value in (chunk.metadata or {}).items()
+            if key != "duplicate_of"
+        }
+        metadata["minhash"] = self.hasher.signature(chunk.text)
+        metadata["minhash_bands"] = " ".join(self.hasher.band_keys(metadata["minhash"]))
+        return TextChunk(
+            text=chunk.text, index=chunk.index, metadata=metadata, uid=chunk.uid
+        )
+
+    async def mark(self, chunks: list[TextChunk]) -> list[TextChunk]:
+        """Mark chunks duplicating earlier chunks or stored canonical chunks.
+
+        Args:
+            chunks: Chunks in order, with a ``content_hash`` in their metadata.
+
+        Returns:
+            The chunks with MinHash data or ``duplicate_of`` in their metadata.
+        """
+        return await asyncio.to_thread(self._mark, chunks)
+
+    async def run(self, text: str) -> TextChunks:
+        """Split a text and mark its near-duplicate chunks.
+
+        Args:
+            text: The text to be split.
+
+        Returns:
+            TextChunks with MinHash data or ``duplicate_of`` in their metadata.
+        """
+        chunks = await self.splitter.run(text)
+        return TextChunks(chunks=await self.mark(chunks.chunks))
+
+
+class UniqueChunkExtractor(LLMEntityRelationExtractor):
+    """Entity and relation extractor that skips near-duplicate chunks.
+
+    Near-duplicate chunks still appear in the lexical graph, but the LLM is
+    only called for canonical chunks.
+    """
+
+    @validate_call
+    async def run(
+        self,
+        chunks: TextChunks,
+        document_info: DocumentInfo | None = None,
+        lexical_graph_config: LexicalGraphConfig | None = None,
+        schema: GraphSchema | None = None,
+        examples: str = "",
+        **kwargs: Any,
+    ) -> Neo4jGraph:
+        """Extract entities and relations from the canonical chunks.
+
+        Args:
+            chunks: Chunks to extract from, including near-duplicates.
+            document_info: Document the chunks come from, for the lexical graph.
+            lexical_graph_config: Labels and types of the lexical graph.
+            schema: Schema guiding the extraction.
+            examples: Examples for few-shot learning in the prompt.
+            **kwargs: Passed on to the base extractor.
+
+        Returns:
+            The lexical graph, if enabled, and the extracted entities.
+        """
+        return await super().run(
+            chunks=chunks,
+            document_info=document_info,
+            lexical_graph_config=lexical_graph_config,
+            schema=schema,
+            examples=examples,
+            **kwargs,
+        )
+
+    async def run_for_chunk(
+        self,
+        sem: asyncio.Semaphore,
+        chunk: TextChunk,
+        schema: GraphSchema,
+        examples: str,
+        lexical_graph_builder: LexicalGraphBuilder | None = None,
+    ) -> Neo4jGraph:
+        """Extract entities from a chunk unless it is a near-duplicate."""
+        if is_near_duplicate(chunk):
+            return Neo4jGraph()
+        return await super().run_for_chunk(
+            sem, chunk, schema, examples, lexical_graph_builder
+        )
+
+
+def use_unique_chunk_extractor(pipeline: SimpleKGPipeline) -> None:
+    """Replace a pipeline's extractor with an equivalent UniqueChunkExtractor."""
+    runner = getattr(pipeline, "runner", None)
+    if not isinstance(runner, PipelineRunner):
+        return
+    extractor: Any = runner.pipeline.get_node_by_name("extractor").component
+    runner.pipeline.set_component(
+        "extractor",
+        UniqueChunkExtractor(
+            llm=extractor.llm,
+            prompt_template=extractor.prompt_template,
+            create_lexical_graph=extractor.create_lexical_graph,
+            on_error=extractor.on_error,
+            max_concurrency=extractor.max_concurrency,
+        ),
+    )
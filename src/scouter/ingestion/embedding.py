@@ -0,0 +1,159 @@
+"""Cross-document batching of chunk embeddings."""
+
+import asyncio
+import logging
+
+from neo4j_graphrag.embeddings.base import Embedder
+from neo4j_graphrag.experimental.components.embedder import TextChunkEmbedder
+from neo4j_graphrag.experimental.components.types import TextChunk, TextChunks
+from neo4j_graphrag.experimental.pipeline.config.runner import PipelineRunner
+from neo4j_graphrag.experimental.pipeline.kg_builder import SimpleKGPipeline
+from pydantic import validate_call
+
+from scouter.db.embedding_cache import encode_batch
+from scouter.ingestion.dedup import is_near_duplicate
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """Combine embedding requests from concurrent ingests into large batches.
+
+    Texts submitted through :meth:`embed` are queued. A single consumer takes
+    the oldest text, keeps collecting until ``max_batch_size`` texts are
+    queued or ``max_wait_ms`` has passed, then encodes the whole batch in one
+    call on a worker thread. Texts queued while a batch is encoding form the
+    next batch, so batches grow with load.
+
+    Args:
+        embedder: Embedder used to encode batches.
+        max_batch_size: Maximum number of texts per encode call.
+        max_wait_ms: Maximum time to wait for a batch to fill.
+    """
+
+    def __init__(
+        self, embedder: Embedder, max_batch_size: int = 64, max_wait_ms: int = 20
+    ) -> None:
+        if max_batch_size < 1:
+            msg = "Embedding batch size must be at least 1"
+            raise ValueError(msg)
+        self.embedder = embedder
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[list[float]]]] | None = (
+            None
+        )
+        self._consumer: asyncio.Task[None] | None = None
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts as part of shared batches.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            One embedding per text, in input order.
+        """
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._consumer is None or self._consumer.done():
+            self._queue = asyncio.Queue()
+            self._consumer = loop.create_task(self._consume(self._queue))
+        futures = []
+        for text in texts:
+            future: asyncio.Future[list[float]] = loop.create_future()
+            self._queue.put_nowait((text, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def _consume(
+        self, queue: asyncio.Queue[tuple[str, asyncio.Future[list[float]]]]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._encode(batch)
+
+    async def _encode(
+        self, batch: list[tuple[str, asyncio.Future[list[float]]]]
+    ) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            vectors = await asyncio.to_thread(encode_batch, self.embedder, texts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        logger.debug("Embedded batch of %d chunks", len(texts))
+        for (_, future), vector in zip(batch, vectors, strict=True):
+            if not future.done():
+                future.set_result(vector)
+
+
+class BatchedChunkEmbedder(TextChunkEmbedder):
+    """TextChunkEmbedder that embeds through a shared EmbeddingBatcher.
+
+    Args:
+        batcher: Batcher shared by every pipeline of the ingestion service.
+    """
+
+    def __init__(self, batcher: EmbeddingBatcher) -> None:
+        super().__init__(embedder=batcher.embedder)
+        self.batcher = batcher
+
+    @validate_call
+    async def run(self, text_chunks: TextChunks) -> TextChunks:
+        """Embed a list of text chunks.
+
+        Args:
+            text_chunks: The text chunks to embed.
+
+        Returns:
+            The input text chunks with an embedding added to their metadata.
+            Near-duplicate chunks are returned unchanged, without one.
+        """
+        unique = [c for c in text_chunks.chunks if not is_near_duplicate(c)]
+        vectors = dict(
+            zip(
+                (c.uid for c in unique),
+                await self.batcher.embed([c.text for c in unique]),
+                strict=True,
+            )
+        )
+        return TextChunks(
+            chunks=[
+                TextChunk(
+                    text=chunk.text,
+                    index=chunk.index,
+                    metadata={
+                        **(chunk.metadata or {}),
+                        "embedding": vectors[chunk.uid],
+                    },
+                    uid=chunk.uid,
+                )
+                if chunk.uid in vectors
+                else chunk
+                for chunk in text_chunks.chunks
+            ]
+        )
+
+
+def use_batched_embedder(pipeline: SimpleKGPipeline, batcher: EmbeddingBatcher) -> None:
+    """Replace a pipeline's chunk embedder with a BatchedChunkEmbedder."""
+    runner = getattr(pipeline, "runner", None)
+    if isinstance(runner, PipelineRunner):
+        runner.pipeline.set_component("chunk_embedder", BatchedChunkEmbedder(batcher))
@@ -0,0 +1,39 @@
+"""Text extraction and page-range helpers for processing PDFs in parallel."""
+
+import pypdf
+
+
+def count_pdf_pages(file_path: str) -> int:
+    """Return the number of pages in a PDF without extracting any text."""
+    return len(pypdf.PdfReader(file_path).pages)
+
+
+def page_ranges(page_count: int, pages_per_part: int) -> list[tuple[int, int]]:
+    """Split a page count into consecutive half-open page ranges.
+
+    Args:
+        page_count: Number of pages in the document.
+        pages_per_part: Maximum number of pages per range.
+
+    Returns:
+        ``(start, end)`` ranges covering every page in order.
+    """
+    return [
+        (start, min(start + pages_per_part, page_count))
+        for start in range(0, page_count, pages_per_part)
+    ]
+
+
+def load_pdf_pages(file_path: str, start: int, end: int) -> str:
+    """Extract the text of pages ``start`` (inclusive) to ``end`` (exclusive).
+
+    Pages are joined the same way PdfLoader joins a whole document.
+    """
+    reader = pypdf.PdfReader(file_path)
+    return "\n".join(reader.pages[page].extract_text() for page in range(start, end))
+
+
+def load_pdf_text(file_path: str) -> str:
+    """Extract the text of a whole PDF, joined like PdfLoader joins it."""
+    reader = pypdf.PdfReader(file_path)
+    return "\n".join(page.extract_text() for page in reader.pages)
@@ -0,0 +1,63 @@
+"""Reusable knowledge graph pipelines for ingestion."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from neo4j_graphrag.experimental.pipeline.config.runner import PipelineRunner
+from neo4j_graphrag.experimental.pipeline.kg_builder import SimpleKGPipeline
+
+
+class PipelinePool:
+    """Pool of pre-built SimpleKGPipeline instances keyed by input type.
+
+    Building a SimpleKGPipeline assembles its component graph, schema and
+    splitter, which dominates the cost of small ingests. The pool builds up to
+    ``size`` pipelines per input type (PDF or text) on first demand and hands
+    each one to a single document run at a time, so several documents can be
+    processed concurrently without sharing a pipeline's run state.
+
+    Args:
+        factory: Builds a pipeline; receives ``from_pdf`` as a keyword.
+        size: Maximum number of pipelines per input type.
+    """
+
+    def __init__(self, factory: Callable[..., SimpleKGPipeline], size: int) -> None:
+        if size < 1:
+            msg = "Pipeline pool size must be at least 1"
+            raise ValueError(msg)
+        self._factory = factory
+        self._size = size
+        self._idle: dict[bool, asyncio.Queue[SimpleKGPipeline]] = {}
+        self._built: dict[bool, int] = {}
+
+    @asynccontextmanager
+    async def acquire(self, *, from_pdf: bool) -> AsyncIterator[SimpleKGPipeline]:
+        """Borrow a pipeline for one document run.
+
+        Args:
+            from_pdf: Whether the pipeline should load a PDF file.
+
+        Yields:
+            A pipeline used exclusively by the caller until the block exits.
+        """
+        idle = self._idle.setdefault(from_pdf, asyncio.Queue())
+        if idle.empty() and self._built.get(from_pdf, 0) < self._size:
+            pipeline = self._factory(from_pdf=from_pdf)
+            self._built[from_pdf] = self._built.get(from_pdf, 0) + 1
+        else:
+            pipeline = await idle.get()
+        try:
+            yield pipeline
+        finally:
+            _reset(pipeline)
+            idle.put_nowait(pipeline)
+
+
+def _reset(pipeline: SimpleKGPipeline) -> None:
+    """Drop per-run results so a reused pipeline does not accumulate memory."""
+    runner = getattr(pipeline, "runner", None)
+    if not isinstance(runner, PipelineRunner):
+        return
+    runner.pipeline.store.empty()
+    runner.pipeline.final_results.empty()
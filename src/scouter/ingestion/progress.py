@@ -0,0 +1,385 @@
+"""Progress and per-stage timings of ingestion tasks, kept in Redis.
+
+Each document gets a tracking id, the Celery id of its final task, which is
+returned by the ingestion API. Workers record the current stage, chunk count
+and time spent per stage under that id, so the status endpoint can report
+where a document is and where its time went. Stage totals over all finished
+documents are aggregated for capacity planning.
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import redis
+from neo4j_graphrag.experimental.pipeline.config.runner import PipelineRunner
+from neo4j_graphrag.experimental.pipeline.kg_builder import SimpleKGPipeline
+from neo4j_graphrag.experimental.pipeline.notification import (
+    Event,
+    EventType,
+    TaskEvent,
+)
+
+from scouter.config import config
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("queued", "parse", "embed", "extract", "write")
+
+# SimpleKGPipeline components grouped into the stages of staged ingestion.
+COMPONENT_STAGES = {
+    "pdf_loader": "parse",
+    "splitter": "parse",
+    "chunk_embedder": "embed",
+    "schema": "extract",
+    "extractor": "extract",
+    "pruner": "extract",
+    "writer": "write",
+    "resolver": "write",
+}
+
+_TASK_KEY = "scouter:ingest:task:{}"
+_TOTALS_KEY = "scouter:ingest:stage-totals"
+_INFLIGHT_KEY = "scouter:ingest:inflight"
+
+# kombu's Redis transport keeps each priority level of a queue in its own list.
+_PRIORITY_SEP = "\x06\x16"
+_PRIORITY_STEPS = (3, 6, 9)
+
+current_task_id: ContextVar[str | None] = ContextVar("ingest_task_id", default=None)
+current_part: ContextVar[int | None] = ContextVar("ingest_part", default=None)
+
+
+@dataclass
+class ChunkCount:
+    """Chunks produced in a :func:`counting_chunks` context."""
+
+    value: int = 0
+
+
+_chunk_count: ContextVar[ChunkCount | None] = ContextVar(
+    "ingest_chunk_count", default=None
+)
+
+
+class ProgressStore:
+    """Redis-backed record of ingestion progress.
+
+    Args:
+        client: Redis client.
+        ttl: Seconds a task's progress is kept after its last update.
+    """
+
+    def __init__(self, client: redis.Redis, ttl: int) -> None:
+        self.client = client
+        self.ttl = ttl
+
+    def _update(self, task_id: str, **fields: Any) -> None:
+        key = _TASK_KEY.format(task_id)
+        pipe = self.client.pipeline()
+        pipe.hset(key, mapping=fields)
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+
+    @staticmethod
+    def _inflight_key(tenant: str | None) -> str:
+        return f"{_INFLIGHT_KEY}:{tenant}" if tenant else _INFLIGHT_KEY
+
+    def enqueued(self, task_id: str, size: int = 0, tenant: str | None = None) -> None:
+        """Record that a document was handed to the queue.
+
+        Its size counts towards the in-flight bytes, globally and for its
+        tenant, until :meth:`release` is called. Each document has its own
+        entry, keyed by task_id, so the totals are always the sum of the
+        documents actually in flight.
+
+        Args:
+            task_id: Tracking id of the document.
+            size: Size of the document in bytes.
+            tenant: Tenant that submitted the document, if known.
+        """
+        fields: dict[str, Any] = {
+            "stage": "queued",
+            "enqueued_at": time.time(),
+            "bytes": size,
+        }
+        if tenant:
+            fields["tenant"] = tenant
+        self._update(task_id, **fields)
+        pipe = self.client.pipeline()
+        for key in {self._inflight_key(None), self._inflight_key(tenant)}:
+            pipe.hset(key, task_id, size)
+            pipe.zadd(f"{key}:since", {task_id: fields["enqueued_at"]})
+        pipe.execute()
+
+    def release(self, task_id: str) -> None:
+        """Remove a finished or failed document from the in-flight bytes.
+
+        Releasing the same document twice has no effect.
+        """
+        tenant = self.client.hget(_TASK_KEY.format(task_id), "tenant")
+        tenant = tenant.decode() if tenant else None
+        pipe = self.client.pipeline()
+        for key in {self._inflight_key(None), self._inflight_key(tenant)}:
+            pipe.hdel(key, task_id)
+            pipe.zrem(f"{key}:since", task_id)
+        pipe.execute()
+
+    def inflight_bytes(self, tenant: str | None = None) -> int:
+        """Bytes of documents queued or being processed, optionally per tenant.
+
+        Documents never released within the progress TTL, e.g. because their
+        worker was killed, are dropped with a warning.
+        """
+        key = self._inflight_key(tenant)
+        stale = self.client.zrangebyscore(
+            f"{key}:since", "-inf", time.time() - self.ttl
+        )
+        if stale:
+            logger.warning(
+                "Dropping %d in-flight documents never released: %s",
+                len(stale),
+                ", ".join(task_id.decode() for task_id in stale),
+            )
+            pipe = self.client.pipeline()
+            pipe.hdel(key, *stale)
+            pipe.zrem(f"{key}:since", *stale)
+            pipe.execute()
+        return sum(int(size) for size in self.client.hvals(key))
+
+    def started(self, task_id: str, stage: str) -> None:
+        """Record the stage a document entered.
+
+        The first call also records how long the document waited in the queue.
+        """
+        key = _TASK_KEY.format(task_id)
+        now = time.time()
+        if self.client.hsetnx(key, "started_at", now):
+            enqueued_at = self.client.hget(key, "enqueued_at")
+            if enqueued_at is not None:
+                self.client.hset(key, "duration:queued", now - float(enqueued_at))
+        self._update(task_id, stage=stage)
+
+    def record(
+        self, task_id: str, stage: str, seconds: float, part: int | None = None
+    ) -> None:
+        """Add time spent in a stage.
+
+        Parts of a split document run in parallel, so their time is kept per
+        part and only the slowest part counts towards the stage's duration.
+        """
+        key = _TASK_KEY.format(task_id)
+        field = f"duration:{stage}" if part is None else f"duration:{stage}:{part}"
+        self.client.hincrbyfloat(key, field, seconds)
+
+    def add_chunks(self, task_id: str, count: int) -> None:
+        """Add chunks produced for a document."""
+        self.client.hincrby(_TASK_KEY.format(task_id), "chunks", count)
+
+    def finished(self, task_id: str) -> None:
+        """Mark a document done and release its in-flight bytes.
+
+        Its stage timings are added to the totals.
+        """
+        progress = self.get(task_id) or {}
+        pipe = self.client.pipeline()
+        for stage, seconds in progress.get("durations", {}).items():
+            pipe.hincrby(_TOTALS_KEY, f"{stage}:documents", 1)
+            pipe.hincrbyfloat(_TOTALS_KEY, f"{stage}:seconds", seconds)
+        pipe.execute()
+        self._update(task_id, stage="done")
+        self.release(task_id)
+
+    def get(self, task_id: str) -> dict[str, Any] | None:
+        """Read a document's progress.
+
+        Returns:
+            Dictionary with stage, chunks and durations in seconds per stage,
+            or None if the task is unknown or its progress expired.
+        """
+        raw = self.client.hgetall(_TASK_KEY.format(task_id))
+        if not raw:
+            return None
+        fields = {k.decode(): v.decode() for k, v in raw.items()}
+        sequential: dict[str, float] = {}
+        slowest_part: dict[str, float] = {}
+        for field, value in fields.items():
+            if not field.startswith("duration:"):
+                continue
+            stage, _, part = field.removeprefix("duration:").partition(":")
+            if part:
+                slowest_part[stage] = max(slowest_part.get(stage, 0.0), float(value))
+            else:
+                sequential[stage] = float(value)
+        return {
+            "stage": fields.get("stage"),
+            "chunks": int(fields["chunks"]) if "chunks" in fields else None,
+            "durations": {
+                stage: sequential.get(stage, 0.0) + slowest_part.get(stage, 0.0)
+                for stage in STAGES
+                if stage in sequential or stage in slowest_part
+            },
+        }
+
+    def stage_totals(self) -> dict[str, dict[str, float]]:
+        """Aggregate stage timings of all finished documents.
+
+        Returns:
+            Mapping of stage to the number of documents and seconds spent.
+        """
+        raw = {
+            k.decode(): float(v) for k, v in self.client.hgetall(_TOTALS_KEY).items()
+        }
+        return {
+            stage: {
+                "documents": raw[f"{stage}:documents"],
+                "seconds": raw.get(f"{stage}:seconds", 0.0),
+            }
+            for stage in STAGES
+            if raw.get(f"{stage}:documents")
+        }
+
+    def queue_depths(self, queues: list[str]) -> dict[str, int]:
+        """Count messages waiting in each Celery queue on the Redis broker."""
+        pipe = self.client.pipeline()
+        for queue in queues:
+            pipe.llen(queue)
+            for step in _PRIORITY_STEPS:
+                pipe.llen(f"{queue}{_PRIORITY_SEP}{step}")
+        lengths = pipe.execute()
+        per_queue = len(_PRIORITY_STEPS) + 1
+        return {
+            queue: sum(lengths[i * per_queue : (i + 1) * per_queue])
+            for i, queue in enumerate(queues)
+        }
+
+
+@lru_cache(maxsize=1)
+def get_progress_store() -> ProgressStore:
+    """Get the progress store on the configured Redis instance."""
+    return ProgressStore(
+        redis.Redis.from_url(config.ingestion.redis_url),
+        ttl=config.ingestion.progress_ttl_s,
+    )
+
+
+@contextmanager
+def tracking(
+    task_id: str | None, *, final: bool = False, part: int | None = None
+) -> Iterator[None]:
+    """Attribute progress recorded in this context to a tracked document.
+
+    Args:
+        task_id: Tracking id of the document, or None to record nothing.
+        final: Whether the document is done once the block completes.
+        part: Part of a split document processed in this context, if any.
+    """
+    token = current_task_id.set(task_id)
+    part_token = current_part.set(part)
+    try:
+        yield
+        if final and task_id is not None:
+            _safely(get_progress_store().finished, task_id)
+    finally:
+        current_part.reset(part_token)
+        current_task_id.reset(token)
+
+
+def _safely(method: Any, *args: Any) -> None:
+    """Call a store method, logging instead of failing ingestion on errors."""
+    try:
+        method(*args)
+    except redis.RedisError:
+        logger.warning("Failed to record ingestion progress", exc_info=True)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a stage of the document tracked in the current context."""
+    task_id = current_task_id.get()
+    if task_id is None:
+        yield
+        return
+    store = get_progress_store()
+    _safely(store.started, task_id, name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        _safely(store.record, task_id, name, seconds, current_part.get())
+
+
+def release(task_id: str) -> None:
+    """Release a document's in-flight bytes without failing the caller."""
+    _safely(get_progress_store().release, task_id)
+
+
+@contextmanager
+def counting_chunks() -> Iterator[ChunkCount]:
+    """Count chunks produced in this context, without a progress store."""
+    counter = ChunkCount()
+    token = _chunk_count.set(counter)
+    try:
+        yield counter
+    finally:
+        _chunk_count.reset(token)
+
+
+def add_chunks(count: int) -> None:
+    """Count chunks of the document tracked in the current context."""
+    if (counter := _chunk_count.get()) is not None:
+        counter.value += count
+    if (task_id := current_task_id.get()) is not None:
+        _safely(get_progress_store().add_chunks, task_id, count)
+
+
+class PipelineProgress:
+    """SimpleKGPipeline event callback that times components by stage."""
+
+    def __init__(self) -> None:
+        self._started: dict[tuple[str, str], float] = {}
+
+    async def __call__(self, event: Event) -> None:
+        """Record the stage of a component when it starts or finishes."""
+        if event.event_type == EventType.PIPELINE_FAILED:
+            for key in [key for key in self._started if key[0] == event.run_id]:
+                del self._started[key]
+            return
+        if not isinstance(event, TaskEvent):
+            return
+        if (
+            event.event_type == EventType.TASK_FINISHED
+            and event.task_name == "splitter"
+            and event.payload
+            and (counter := _chunk_count.get()) is not None
+        ):
+            counter.value += len(event.payload["chunks"])
+        task_id = current_task_id.get()
+        if task_id is None:
+            return
+        name = COMPONENT_STAGES.get(event.task_name)
+        if name is None:
+            return
+        store = get_progress_store()
+        key = (event.run_id, event.task_name)
+        if event.event_type == EventType.TASK_STARTED:
+            self._started[key] = time.perf_counter()
+            _safely(store.started, task_id, name)
+        elif event.event_type == EventType.TASK_FINISHED and key in self._started:
+            seconds = time.perf_counter() - self._started.pop(key)
+            _safely(store.record, task_id, name, seconds)
+            if event.task_name == "splitter" and event.payload:
+                _safely(store.add_chunks, task_id, len(event.payload["chunks"]))
+
+
+def report_pipeline_progress(pipeline: SimpleKGPipeline) -> None:
+    """Attach a PipelineProgress callback to a pipeline."""
+    runner = getattr(pipeline, "runner", None)
+    if isinstance(runner, PipelineRunner):
+        runner.pipeline.callbacks.append(PipelineProgress())
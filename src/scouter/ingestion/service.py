@@ -1,10 +1,86 @@
 """Service for ingesting documents into the knowledge graph."""
 
-from typing import Any
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import neo4j
+from neo4j_graphrag.experimental.components.graph_pruning import GraphPruning
+from neo4j_graphrag.experimental.components.lexical_graph import LexicalGraphBuilder
+from neo4j_graphrag.experimental.components.pdf_loader import PdfLoader
+from neo4j_graphrag.experimental.components.resolver import (
+    SinglePropertyExactMatchResolver,
+)
+from neo4j_graphrag.experimental.components.schema import SchemaFromTextExtractor
+from neo4j_graphrag.experimental.components.types import (
+    DocumentInfo,
+    LexicalGraphConfig,
+    Neo4jGraph,
+    Neo4jNode,
+    PdfDocument,
+    TextChunk,
+    TextChunks,
+)
 from neo4j_graphrag.experimental.pipeline.kg_builder import SimpleKGPipeline
 
+from scouter.config import config
 from scouter.db import get_neo4j_driver, get_neo4j_embedder, get_neo4j_llm
+from scouter.db.documents import (
+    claim_chunks_for_extraction,
+    create_document_chunks,
+    create_document_constraints,
+    delete_chunks,
+    delete_document_parts,
+    find_document_by_doc_id,
+    find_document_by_hash,
+    find_orphaned_duplicates,
+    get_document_chunks,
+    merge_document_metadata,
+    merge_document_parts,
+    reorder_document_chunks,
+    set_document_extraction,
+    update_chunk_duplicates,
+    update_document_properties,
+)
+from scouter.db.search_cache import bump_corpus_version
+from scouter.ingestion import progress
+from scouter.ingestion.blobstore import get_blob_store
+from scouter.ingestion.chunking import ContentDefinedSplitter
+from scouter.ingestion.dedup import (
+    MinHasher,
+    NearDuplicateSplitter,
+    UniqueChunkExtractor,
+    is_near_duplicate,
+    use_unique_chunk_extractor,
+)
+from scouter.ingestion.embedding import (
+    BatchedChunkEmbedder,
+    EmbeddingBatcher,
+    use_batched_embedder,
+)
+from scouter.ingestion.pdf import load_pdf_pages
+from scouter.ingestion.pipeline import PipelinePool
+from scouter.ingestion.writer import BatchedNeo4jWriter, use_batched_writer
+
+if TYPE_CHECKING:
+    from neo4j_graphrag.experimental.components.text_splitters.base import TextSplitter
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def fingerprint_text(text: str) -> str:
+    """Return the SHA-256 content fingerprint of a text document."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def fingerprint_file(file_path: str) -> str:
+    """Return the SHA-256 content fingerprint of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with Path(file_path).open("rb") as f:
+        while chunk := f.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 class IngestionService:
@@ -15,22 +91,85 @@ class IngestionService:
         self.driver = get_neo4j_driver()
         self.llm = get_neo4j_llm()
         self.embedder = get_neo4j_embedder()
+        self.splitter: TextSplitter = ContentDefinedSplitter()
+        if config.ingestion.near_duplicate_threshold > 0:
+            self.splitter = NearDuplicateSplitter(
+                self.splitter,
+                self.driver,
+                MinHasher(
+                    num_perm=config.ingestion.minhash_permutations,
+                    bands=config.ingestion.minhash_bands,
+                ),
+                threshold=config.ingestion.near_duplicate_threshold,
+            )
+        self.embed_batcher = EmbeddingBatcher(
+            self.embedder,
+            max_batch_size=config.ingestion.embed_batch_size,
+            max_wait_ms=config.ingestion.embed_batch_wait_ms,
+        )
+        self.writer = BatchedNeo4jWriter(
+            self.driver, batch_size=config.ingestion.write_batch_size
+        )
+        self.blobs = get_blob_store()
+        self.pipelines = PipelinePool(
+            self._build_pipeline, size=config.ingestion.pipeline_pool_size
+        )
+        self._schema_ready = False
+
+    def _build_pipeline(self, *, from_pdf: bool) -> SimpleKGPipeline:
+        """Build a knowledge graph pipeline for PDF or text input.
+
+        Chunk embeddings go through the service's shared batcher so chunks of
+        concurrently ingested documents are encoded together, near-duplicate
+        chunks are left out of extraction, graphs are written with the batched
+        writer, and component timings are reported to the progress store.
+        """
+        pipeline = SimpleKGPipeline(
+            llm=self.llm,
+            driver=self.driver,
+            embedder=self.embedder,
+            from_pdf=from_pdf,
+            text_splitter=self.splitter,
+        )
+        use_batched_embedder(pipeline, self.embed_batcher)
+        use_unique_chunk_extractor(pipeline)
+        use_batched_writer(pipeline, self.writer)
+        progress.report_pipeline_progress(pipeline)
+        return pipeline
+
+    def _ensure_schema(self) -> None:
+        """Create document constraints once per service instance."""
+        if not self._schema_ready:
+            create_document_constraints(self.driver)
+            self._schema_ready = True
 
     async def process_document(
         self,
         file_path: str | None = None,
         text: str | None = None,
         metadata: dict[str, Any] | None = None,
+        content_hash: str | None = None,
     ) -> dict[str, Any]:
         """Process a PDF file or text into the knowledge graph using SimpleKGPipeline.
 
+        Documents are fingerprinted with SHA-256 before any pipeline work. If the
+        same content was already ingested, only the new metadata is merged into
+        the existing Document node. If the metadata carries a ``doc_id`` that
+        matches an existing document, the document is updated incrementally
+        with :meth:`update_document` instead of being ingested again.
+
+        A PDF whose text was extracted beforehand, given as both ``file_path``
+        and ``text``, is not parsed again: it goes through the pipeline's
+        stages directly and is stored like any other PDF.
+
         Args:
             file_path: Path to PDF file to process.
-            text: Text content to process.
+            text: Text content to process, or the extracted text of the PDF.
             metadata: Additional metadata for the document.
+            content_hash: Precomputed SHA-256 of the content, if already known.
 
         Returns:
-            Dictionary containing processing status and type.
+            Dictionary containing processing status, type and content hash.
 
         Raises:
             ValueError: If neither file_path nor text is provided.
@@ -44,23 +183,671 @@ class IngestionService:
 
         try:
             from_pdf = file_path is not None
-            kg_builder = SimpleKGPipeline(
-                llm=self.llm,
-                driver=self.driver,
-                embedder=self.embedder,
-                from_pdf=from_pdf,
+            doc_type = "pdf" if from_pdf else "text"
+            if content_hash is None:
+                content_hash = (
+                    fingerprint_file(file_path) if from_pdf else fingerprint_text(text)
+                )
+
+            existing = await self.resolve_existing(
+                file_path=file_path,
+                text=text,
+                metadata=metadata,
+                content_hash=content_hash,
+            )
+            if existing is not None:
+                return existing
+
+            document_metadata = {**metadata, "content_hash": content_hash}
+            await self._run_pipeline(file_path, text, document_metadata)
+        except neo4j.exceptions.ConstraintError:
+            # A concurrent ingest of the same content committed first.
+            if find_document_by_hash(self.driver, content_hash) is None:
+                raise
+            return self.merge_duplicate(content_hash, metadata, from_pdf=from_pdf)
+        except OSError as e:
+            return {"status": "failed", "error": str(e)}
+        else:
+            bump_corpus_version()
+            return {
+                "status": "processed",
+                "type": doc_type,
+                "content_hash": content_hash,
+            }
+
+    async def resolve_existing(
+        self,
+        content_hash: str,
+        metadata: dict[str, Any],
+        file_path: str | None = None,
+        text: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Handle a document whose content or doc_id is already in the graph.
+
+        Identical content only gets the new metadata merged in; a known
+        ``doc_id`` with new content is updated with :meth:`update_document`.
+
+        Args:
+            content_hash: SHA-256 of the document content.
+            metadata: Metadata of the incoming document.
+            file_path: Path to the PDF file, if the document is a PDF.
+            text: Text content, if the document is text.
+
+        Returns:
+            The processing result if the document was handled, None if it is
+            new and must go through the full pipeline.
+        """
+        duplicate = self.find_duplicate(
+            content_hash, metadata, from_pdf=file_path is not None
+        )
+        if duplicate is not None:
+            return duplicate
+        if self.is_update(metadata):
+            return await self.update_document(
+                metadata["doc_id"],
+                file_path=file_path,
+                text=text,
+                metadata=metadata,
+                content_hash=content_hash,
+            )
+        return None
+
+    def find_duplicate(
+        self, content_hash: str, metadata: dict[str, Any], *, from_pdf: bool
+    ) -> dict[str, Any] | None:
+        """Merge metadata into the document with the same content, if any.
+
+        Args:
+            content_hash: SHA-256 of the document content.
+            metadata: Metadata of the incoming document.
+            from_pdf: Whether the incoming document is a PDF.
+
+        Returns:
+            The ``already_ingested`` result, or None if the content is new.
+        """
+        self._ensure_schema()
+        if find_document_by_hash(self.driver, content_hash) is None:
+            return None
+        return self.merge_duplicate(content_hash, metadata, from_pdf=from_pdf)
+
+    def is_update(self, metadata: dict[str, Any]) -> bool:
+        """Return True if the metadata's ``doc_id`` names an existing document."""
+        doc_id = metadata.get("doc_id")
+        return bool(doc_id) and find_document_by_doc_id(self.driver, doc_id) is not None
+
+    def merge_duplicate(
+        self, content_hash: str, metadata: dict[str, Any], *, from_pdf: bool
+    ) -> dict[str, Any]:
+        """Merge metadata into the document already stored with this content.
+
+        Also used when a write fails on the content hash constraint because a
+        concurrent ingest of the same content committed first.
+
+        Args:
+            content_hash: SHA-256 of the document content.
+            metadata: Metadata of the incoming document.
+            from_pdf: Whether the incoming document is a PDF.
+
+        Returns:
+            The ``already_ingested`` result.
+        """
+        merge_document_metadata(self.driver, content_hash, metadata)
+        return {
+            "status": "already_ingested",
+            "type": "pdf" if from_pdf else "text",
+            "content_hash": content_hash,
+        }
+
+    async def process_documents(
+        self, documents: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Process several documents concurrently through the pipeline pool.
+
+        Concurrency is bounded by the pool size; each document borrows its own
+        pipeline, so runs never share pipeline state.
+
+        Args:
+            documents: Keyword arguments for :meth:`process_document`, one dict
+                per document.
+
+        Returns:
+            Processing results in the same order as ``documents``.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.process_document(**document) for document in documents)
+            )
+        )
+
+    async def update_document(
+        self,
+        doc_id: str,
+        file_path: str | None = None,
+        text: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        content_hash: str | None = None,
+    ) -> dict[str, Any]:
+        """Re-ingest a new version of an existing document incrementally.
+
+        The new version is chunked and its chunk hashes are diffed against the
+        Chunk nodes already attached to the document. Only new or changed
+        chunks are embedded, extracted and written; chunks that no longer
+        appear are removed in bulk together with entities extracted solely from
+        them, and the remaining chunks are re-indexed and re-linked in order.
+
+        Args:
+            doc_id: ``doc_id`` of the existing Document node.
+            file_path: Path to the new PDF version.
+            text: New text version.
+            metadata: Metadata to merge into the Document node.
+            content_hash: Precomputed SHA-256 of the new content, if known.
+
+        Returns:
+            Dictionary with status, type, content hash and chunk diff counts.
+
+        Raises:
+            ValueError: If neither file_path nor text is provided.
+        """
+        if file_path is None and text is None:
+            msg = "Either file_path or text must be provided"
+            raise ValueError(msg)
+
+        from_pdf = file_path is not None
+        if from_pdf:
+            if text is None:
+                text = (await PdfLoader().run(filepath=file_path)).text
+            content_hash = content_hash or fingerprint_file(file_path)
+        content_hash = content_hash or fingerprint_text(text)
+
+        chunks = (await self.splitter.run(text)).chunks
+        progress.add_chunks(len(chunks))
+        existing: dict[str, list[str]] = {}
+        for row in get_document_chunks(self.driver, doc_id):
+            existing.setdefault(row["content_hash"], []).append(row["element_id"])
+
+        kept: list[dict[str, Any]] = []
+        new_chunks: list[TextChunk] = []
+        for chunk in chunks:
+            matches = existing.get(chunk.metadata["content_hash"])
+            if matches:
+                kept.append({"element_id": matches.pop(0), "index": chunk.index})
+            else:
+                new_chunks.append(chunk)
+        orphaned = [element_id for ids in existing.values() for element_id in ids]
+        removed = {content_hash for content_hash, ids in existing.items() if ids}
+        if isinstance(self.splitter, NearDuplicateSplitter):
+            # A new chunk must not point at a chunk deleted by this update.
+            new_chunks = [
+                self.splitter.canonical(chunk)
+                if chunk.metadata.get("duplicate_of") in removed
+                else chunk
+                for chunk in new_chunks
+            ]
+
+        if new_chunks:
+            await self._write_new_chunks(doc_id, new_chunks)
+        delete_chunks(self.driver, orphaned)
+        await self._promote_orphaned_duplicates(removed)
+        reorder_document_chunks(self.driver, doc_id, kept)
+        update_document_properties(
+            self.driver, doc_id, {**(metadata or {}), "content_hash": content_hash}
+        )
+        bump_corpus_version()
+        return {
+            "status": "updated",
+            "type": "pdf" if from_pdf else "text",
+            "content_hash": content_hash,
+            "chunks_kept": len(kept),
+            "chunks_added": len(new_chunks),
+            "chunks_removed": len(orphaned),
+        }
+
+    async def _promote_orphaned_duplicates(self, content_hashes: set[str]) -> None:
+        """Re-mark near-duplicates of deleted chunks, in any document.
+
+        Without their canonical chunk, near-duplicates would have no
+        embedding left to be found by. They are checked again against each
+        other and the remaining canonical chunks; those that duplicate
+        nothing become canonical and are embedded, and their entities are
+        extracted unless their document's extraction is deferred.
+
+        Args:
+            content_hashes: Content hashes of the deleted chunks.
+        """
+        rows = find_orphaned_duplicates(self.driver, sorted(content_hashes))
+        if not rows:
+            return
+        chunks = [
+            TextChunk(
+                text=row["text"],
+                index=row["index"],
+                metadata={"content_hash": row["content_hash"]},
+                uid=row["id"],
+            )
+            for row in rows
+        ]
+        if isinstance(self.splitter, NearDuplicateSplitter):
+            chunks = await self.splitter.mark(chunks)
+        embedded = await BatchedChunkEmbedder(self.embed_batcher).run(
+            text_chunks=TextChunks(chunks=chunks)
+        )
+        extracted = {row["id"] for row in rows if row["extraction"] in (None, "done")}
+        to_extract = [
+            chunk
+            for chunk in chunks
+            if chunk.uid in extracted and not is_near_duplicate(chunk)
+        ]
+        extract_ids = {chunk.uid for chunk in to_extract}
+        update_chunk_duplicates(
+            self.driver,
+            [
+                {
+                    "id": chunk.uid,
+                    "duplicate_of": chunk.metadata.get("duplicate_of"),
+                    "minhash": chunk.metadata.get("minhash"),
+                    "minhash_bands": chunk.metadata.get("minhash_bands"),
+                    "embedding": chunk.metadata.get("embedding"),
+                    "extract": chunk.uid in extract_ids,
+                }
+                for chunk in embedded.chunks
+            ],
+        )
+        if to_extract:
+            await self.write_graph(await self._extract_from_chunks(to_extract))
+
+    async def _write_new_chunks(self, doc_id: str, chunks: list[TextChunk]) -> None:
+        """Embed, extract and write chunks that are new to a document."""
+        embedded = await BatchedChunkEmbedder(self.embed_batcher).run(
+            text_chunks=TextChunks(chunks=chunks)
+        )
+        create_document_chunks(
+            self.driver,
+            doc_id,
+            [
+                {
+                    "id": chunk.chunk_id,
+                    "text": chunk.text,
+                    "index": chunk.index,
+                    "properties": {
+                        key: value
+                        for key, value in chunk.metadata.items()
+                        if key != "embedding"
+                    },
+                    "embedding": chunk.metadata.get("embedding"),
+                }
+                for chunk in embedded.chunks
+            ],
+        )
+
+        await self.write_graph(await self._extract_from_chunks(chunks))
+
+    async def _extract_from_chunks(self, chunks: list[TextChunk]) -> Neo4jGraph:
+        """Extract entities from chunks already stored in Neo4j.
+
+        The chunks must carry ``__tmp_internal_id`` equal to their chunk_id.
+        They are added to the graph as bare Chunk nodes so the writer clears
+        their temporary ids even if no entity was extracted from them.
+        """
+        schema = await SchemaFromTextExtractor(llm=self.llm).run(
+            text="\n".join(chunk.text for chunk in chunks)
+        )
+        extractor = UniqueChunkExtractor(llm=self.llm, create_lexical_graph=False)
+        graph = await extractor.run(
+            chunks=TextChunks(chunks=chunks),
+            lexical_graph_config=LexicalGraphConfig(),
+            schema=schema,
+        )
+        graph.nodes.extend(
+            Neo4jNode(id=chunk.chunk_id, label="Chunk") for chunk in chunks
+        )
+        return graph
+
+    async def load_document(
+        self,
+        file_path: str | None,
+        text: str | None,
+        metadata: dict[str, Any],
+    ) -> PdfDocument:
+        """Load a PDF or wrap a text as a document ready for chunking.
+
+        Args:
+            file_path: Path to the PDF file, if the document is a PDF.
+            text: Text content, or the text already extracted from the PDF.
+            metadata: Properties of the Document node.
+
+        Returns:
+            Document text and info.
+        """
+        if file_path is not None and text is None:
+            return await PdfLoader().run(filepath=file_path, metadata=metadata)
+        if file_path is not None:
+            return PdfDocument(
+                text=text,
+                document_info=DocumentInfo(
+                    path=file_path, metadata=metadata, document_type="pdf"
+                ),
             )
-            if from_pdf:
+        return PdfDocument(
+            text=text,
+            document_info=DocumentInfo(
+                path="document.txt", metadata=metadata, document_type="inline_text"
+            ),
+        )
+
+    async def _run_pipeline(
+        self, file_path: str | None, text: str | None, metadata: dict[str, Any]
+    ) -> None:
+        """Ingest a new document through a pooled pipeline.
+
+        A PDF whose text is already extracted runs through the pipeline's
+        stages instead, so the file is not parsed again.
+        """
+        if file_path is not None and text is not None:
+            await self._process_loaded(file_path, text, metadata)
+            return
+        async with self.pipelines.acquire(from_pdf=file_path is not None) as kg_builder:
+            if file_path is not None:
                 await kg_builder.run_async(
-                    file_path=file_path,
-                    document_metadata=metadata,
+                    file_path=file_path, document_metadata=metadata
                 )
             else:
                 await kg_builder.run_async(text=text, document_metadata=metadata)
-        except OSError as e:
-            return {"status": "failed", "error": str(e)}
-        else:
-            return {"status": "processed", "type": "pdf" if from_pdf else "text"}
+
+    async def _process_loaded(
+        self, file_path: str, text: str, metadata: dict[str, Any]
+    ) -> None:
+        """Run the pipeline's stages on a PDF whose text is already extracted.
+
+        Args:
+            file_path: Path to the PDF file.
+            text: Text extracted from the PDF.
+            metadata: Properties of the Document node.
+        """
+        with progress.stage("parse"):
+            document = await self.load_document(file_path, text, metadata)
+            chunks = await self.splitter.run(document.text)
+            progress.add_chunks(len(chunks.chunks))
+        with progress.stage("embed"):
+            chunks = await BatchedChunkEmbedder(self.embed_batcher).run(
+                text_chunks=chunks
+            )
+        with progress.stage("extract"):
+            graph = await self.extract_graph(document, chunks)
+        with progress.stage("write"):
+            await self.write_graph(graph)
+
+    async def index_document(
+        self,
+        file_path: str | None = None,
+        text: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        content_hash: str | None = None,
+        *,
+        defer_extraction: bool = True,
+    ) -> dict[str, Any]:
+        """Write a document's chunks and embeddings without graph extraction.
+
+        The chunks are searchable through the ``chunkEmbedding`` index as soon
+        as this returns. The Document node's ``extraction`` property is set to
+        ``pending`` for :meth:`extract_deferred` to pick up, or ``skipped``.
+        Duplicates and known ``doc_id`` values are handled as in
+        :meth:`process_document`.
+
+        Args:
+            file_path: Path to PDF file to process.
+            text: Text content to process, or the extracted text of the PDF.
+            metadata: Additional metadata for the document.
+            content_hash: Precomputed SHA-256 of the content, if already known.
+            defer_extraction: Whether extraction should run later.
+
+        Returns:
+            Dictionary containing processing status, type, content hash and
+            extraction status.
+
+        Raises:
+            ValueError: If neither file_path nor text is provided.
+        """
+        if file_path is None and text is None:
+            msg = "Either file_path or text must be provided"
+            raise ValueError(msg)
+
+        metadata = metadata or {}
+        from_pdf = file_path is not None
+        with progress.stage("parse"):
+            content_hash = content_hash or (
+                fingerprint_file(file_path) if from_pdf else fingerprint_text(text)
+            )
+            existing = await self.resolve_existing(
+                content_hash=content_hash,
+                metadata=metadata,
+                file_path=file_path,
+                text=text,
+            )
+            if existing is not None:
+                return existing
+            extraction = "pending" if defer_extraction else "skipped"
+            document = await self.load_document(
+                file_path,
+                text,
+                {**metadata, "content_hash": content_hash, "extraction": extraction},
+            )
+            chunks = await self.splitter.run(document.text)
+            progress.add_chunks(len(chunks.chunks))
+        with progress.stage("embed"):
+            chunks = await BatchedChunkEmbedder(self.embed_batcher).run(
+                text_chunks=chunks
+            )
+        with progress.stage("write"):
+            lexical_graph = await LexicalGraphBuilder().run(
+                text_chunks=chunks, document_info=document.document_info
+            )
+            try:
+                await self.write_graph(lexical_graph.graph, resolve=False)
+            except neo4j.exceptions.ConstraintError:
+                if find_document_by_hash(self.driver, content_hash) is None:
+                    raise
+                return self.merge_duplicate(content_hash, metadata, from_pdf=from_pdf)
+        return {
+            "status": "processed",
+            "type": "pdf" if from_pdf else "text",
+            "content_hash": content_hash,
+            "extraction": extraction,
+        }
+
+    async def extract_deferred(self, content_hash: str) -> dict[str, Any]:
+        """Extract the knowledge graph of a document ingested vector-only.
+
+        Args:
+            content_hash: SHA-256 of the document.
+
+        Returns:
+            Dictionary with the extraction status and chunk count. The status
+            is ``skipped`` if the document is not awaiting extraction.
+        """
+        rows = claim_chunks_for_extraction(self.driver, content_hash)
+        if not rows:
+            return {"status": "skipped", "content_hash": content_hash}
+        chunks = [
+            TextChunk(
+                text=row["text"],
+                index=row["index"],
+                metadata={"duplicate_of": row["duplicate_of"]},
+                uid=row["id"],
+            )
+            for row in rows
+        ]
+        try:
+            await self.write_graph(await self._extract_from_chunks(chunks))
+        except Exception:
+            set_document_extraction(self.driver, content_hash, "pending")
+            raise
+        set_document_extraction(self.driver, content_hash, "done")
+        return {
+            "status": "extracted",
+            "content_hash": content_hash,
+            "chunks": len(rows),
+        }
+
+    async def extract_graph(
+        self, document: PdfDocument, chunks: TextChunks
+    ) -> Neo4jGraph:
+        """Extract a pruned knowledge graph, including its lexical graph.
+
+        Args:
+            document: Document text and info for the Document node.
+            chunks: Embedded chunks of the document.
+
+        Returns:
+            Graph of the Document, its chunks and the extracted entities.
+        """
+        schema = await SchemaFromTextExtractor(llm=self.llm).run(text=document.text)
+        graph = await UniqueChunkExtractor(llm=self.llm).run(
+            chunks=chunks,
+            document_info=document.document_info,
+            lexical_graph_config=LexicalGraphConfig(),
+            schema=schema,
+        )
+        pruned = await GraphPruning().run(
+            graph=graph, schema=schema, lexical_graph_config=LexicalGraphConfig()
+        )
+        return pruned.graph
+
+    async def write_graph(self, graph: Neo4jGraph, *, resolve: bool = True) -> None:
+        """Write a graph to Neo4j and optionally merge duplicate entities.
+
+        Cached search results are invalidated once the graph is written.
+        """
+        await self.writer.run(graph=graph, lexical_graph_config=LexicalGraphConfig())
+        if resolve:
+            await SinglePropertyExactMatchResolver(driver=self.driver).run()
+        bump_corpus_version()
+
+    async def process_pdf_part(
+        self,
+        file_path: str,
+        content_hash: str,
+        part: int,
+        start: int,
+        end: int,
+        *,
+        run_id: str,
+    ) -> dict[str, Any]:
+        """Process one page range of a large PDF as a temporary part document.
+
+        The part is written as its own Document node marked with ``part_of``
+        and ``part_run``; :meth:`finalize_pdf_parts` later merges the parts of
+        the run into one Document. Entity resolution is left to the finalize
+        step so parts running on different workers do not resolve
+        concurrently.
+
+        Args:
+            file_path: Path to the PDF file.
+            content_hash: SHA-256 of the whole PDF.
+            part: Position of the page range in the document.
+            start: First page of the range.
+            end: Page after the last page of the range.
+            run_id: Identifies this ingestion of the PDF among concurrent ones.
+
+        Returns:
+            Dictionary with the part number and its chunk count.
+        """
+        with progress.stage("parse"):
+            text = await asyncio.to_thread(load_pdf_pages, file_path, start, end)
+            document = PdfDocument(
+                text=text,
+                document_info=DocumentInfo(
+                    path=file_path,
+                    metadata={
+                        "part_of": content_hash,
+                        "part_run": run_id,
+                        "part": str(part),
+                    },
+                    document_type="pdf_part",
+                ),
+            )
+            chunks = await self.splitter.run(text)
+            progress.add_chunks(len(chunks.chunks))
+        with progress.stage("embed"):
+            chunks = await BatchedChunkEmbedder(self.embed_batcher).run(
+                text_chunks=chunks
+            )
+        with progress.stage("extract"):
+            graph = await self.extract_graph(document, chunks)
+        with progress.stage("write"):
+            await self.write_graph(graph, resolve=False)
+        return {"part": part, "chunks": len(chunks.chunks)}
+
+    async def finalize_pdf_parts(
+        self,
+        file_path: str,
+        content_hash: str,
+        metadata: dict[str, Any] | None = None,
+        *,
+        run_id: str,
+    ) -> dict[str, Any]:
+        """Merge the part documents of a split PDF into a single Document.
+
+        If the PDF was ingested meanwhile, e.g. by a concurrent upload of the
+        same file, the parts are deleted and only the metadata is merged into
+        the existing Document, as for any duplicate.
+
+        Args:
+            file_path: Path to the PDF file.
+            content_hash: SHA-256 of the whole PDF.
+            metadata: Metadata for the Document node.
+            run_id: Identifies the ingestion run that wrote the parts.
+
+        Returns:
+            Dictionary containing processing status, type and content hash.
+        """
+        metadata = metadata or {}
+        self._ensure_schema()
+        with progress.stage("write"):
+            if self._merge_parts(file_path, content_hash, metadata, run_id):
+                await SinglePropertyExactMatchResolver(driver=self.driver).run()
+                result = {
+                    "status": "processed",
+                    "type": "pdf",
+                    "content_hash": content_hash,
+                }
+            else:
+                delete_document_parts(self.driver, content_hash, run_id)
+                result = self.merge_duplicate(content_hash, metadata, from_pdf=True)
+        bump_corpus_version()
+        return result
+
+    def _merge_parts(
+        self,
+        file_path: str,
+        content_hash: str,
+        metadata: dict[str, Any],
+        run_id: str,
+    ) -> bool:
+        """Merge a run's parts into a new Document, unless one already exists.
+
+        Returns:
+            False if a Document with the content hash already exists.
+        """
+        if find_document_by_hash(self.driver, content_hash) is not None:
+            return False
+        try:
+            merge_document_parts(
+                self.driver,
+                content_hash,
+                run_id,
+                {
+                    **metadata,
+                    "path": file_path,
+                    "document_type": "pdf",
+                    "content_hash": content_hash,
+                },
+            )
+        except neo4j.exceptions.ConstraintError:
+            # A concurrent ingest of the same content committed first.
+            if find_document_by_hash(self.driver, content_hash) is None:
+                raise
+            return False
+        return True
 
     def close(self) -> None:
         """Close the Neo4j driver connection."""
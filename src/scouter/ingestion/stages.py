@@ -0,0 +1,166 @@
+"""Ingestion stages run as separate Celery tasks.
+
+Each stage takes the payload returned by the previous one and returns the
+payload for the next. Payloads stay small: documents, chunks and graphs are
+kept in the service's blob store and only their references are passed on.
+A payload carrying a ``result`` was fully handled by an earlier stage, e.g.
+a duplicate, and is passed through untouched. A payload carrying an
+``update`` is a new version of an existing document; it is re-ingested
+incrementally by the extract stage, where its LLM work belongs.
+"""
+
+from typing import Any
+
+import neo4j
+from neo4j_graphrag.experimental.components.types import (
+    Neo4jGraph,
+    PdfDocument,
+    TextChunks,
+)
+
+from scouter.db.documents import find_document_by_hash
+from scouter.ingestion import progress
+from scouter.ingestion.embedding import BatchedChunkEmbedder
+from scouter.ingestion.service import (
+    IngestionService,
+    fingerprint_file,
+    fingerprint_text,
+)
+
+
+async def parse(service: IngestionService, task_data: dict[str, Any]) -> dict[str, Any]:
+    """Load and chunk a document (CPU-bound).
+
+    Args:
+        service: Worker-lifetime ingestion service.
+        task_data: Dictionary containing file_path, text, metadata and
+            optionally a precomputed content_hash.
+
+    Returns:
+        Payload with references to the parsed document and its chunks.
+
+    Raises:
+        ValueError: If neither file_path nor text is provided.
+    """
+    file_path = task_data.get("file_path")
+    text = task_data.get("text")
+    metadata = task_data.get("metadata") or {}
+    if file_path is None and text is None:
+        msg = "Either file_path or text must be provided"
+        raise ValueError(msg)
+
+    with progress.stage("parse"):
+        from_pdf = file_path is not None
+        content_hash = task_data.get("content_hash") or (
+            fingerprint_file(file_path) if from_pdf else fingerprint_text(text)
+        )
+        duplicate = service.find_duplicate(content_hash, metadata, from_pdf=from_pdf)
+        if duplicate is not None:
+            return {"result": duplicate}
+        if service.is_update(metadata):
+            text_ref = None if text is None else service.blobs.put_text("text", text)
+            return {
+                "update": {
+                    "file_path": file_path,
+                    "text_ref": text_ref,
+                    "metadata": metadata,
+                    "content_hash": content_hash,
+                }
+            }
+
+        document = await service.load_document(
+            file_path, text, {**metadata, "content_hash": content_hash}
+        )
+        chunks = await service.splitter.run(document.text)
+        progress.add_chunks(len(chunks.chunks))
+        return {
+            "type": "pdf" if from_pdf else "text",
+            "content_hash": content_hash,
+            "metadata": metadata,
+            "document": service.blobs.put("document", document),
+            "chunks": service.blobs.put("chunks", chunks),
+        }
+
+
+async def embed(service: IngestionService, payload: dict[str, Any]) -> dict[str, Any]:
+    """Embed the chunks of a parsed document (CPU-bound)."""
+    if "result" in payload or "update" in payload:
+        return payload
+    chunks = service.blobs.get(payload["chunks"], TextChunks)
+    with progress.stage("embed"):
+        embedded = await BatchedChunkEmbedder(service.embed_batcher).run(
+            text_chunks=chunks
+        )
+    ref = service.blobs.put("embedded", embedded)
+    service.blobs.delete(payload["chunks"])
+    return {**payload, "chunks": ref}
+
+
+async def extract(service: IngestionService, payload: dict[str, Any]) -> dict[str, Any]:
+    """Extract the schema and knowledge graph with the LLM (I/O-bound).
+
+    A new version of an existing document is updated incrementally here,
+    including the embedding and writing of its changed chunks.
+    """
+    if "result" in payload:
+        return payload
+    if "update" in payload:
+        return {"result": await _update(service, payload["update"])}
+    document = service.blobs.get(payload["document"], PdfDocument)
+    chunks = service.blobs.get(payload["chunks"], TextChunks)
+    with progress.stage("extract"):
+        graph = await service.extract_graph(document, chunks)
+    ref = service.blobs.put("graph", graph)
+    service.blobs.delete(payload["document"], payload["chunks"])
+    return {
+        "type": payload["type"],
+        "content_hash": payload["content_hash"],
+        "metadata": payload.get("metadata", {}),
+        "graph": ref,
+    }
+
+
+async def write(service: IngestionService, payload: dict[str, Any]) -> dict[str, Any]:
+    """Write the extracted graph to Neo4j and resolve entities (I/O-bound).
+
+    If a concurrent ingest of the same content was written first, the
+    document's metadata is merged into it instead.
+
+    Returns:
+        Dictionary containing processing status, type and content hash.
+    """
+    if "result" in payload:
+        return payload["result"]
+    graph = service.blobs.get(payload["graph"], Neo4jGraph)
+    try:
+        with progress.stage("write"):
+            await service.write_graph(graph)
+    except neo4j.exceptions.ConstraintError:
+        if find_document_by_hash(service.driver, payload["content_hash"]) is None:
+            raise
+        service.blobs.delete(payload["graph"])
+        return service.merge_duplicate(
+            payload["content_hash"],
+            payload.get("metadata", {}),
+            from_pdf=payload["type"] == "pdf",
+        )
+    service.blobs.delete(payload["graph"])
+    return {
+        "status": "processed",
+        "type": payload["type"],
+        "content_hash": payload["content_hash"],
+    }
+
+
+async def _update(service: IngestionService, update: dict[str, Any]) -> dict[str, Any]:
+    text_ref = update["text_ref"]
+    result = await service.update_document(
+        update["metadata"]["doc_id"],
+        file_path=update["file_path"],
+        text=None if text_ref is None else service.blobs.get_text(text_ref),
+        metadata=update["metadata"],
+        content_hash=update["content_hash"],
+    )
+    if text_ref is not None:
+        service.blobs.delete(text_ref)
+    return result
@@ -1,51 +1,480 @@
 """Celery tasks for asynchronous document processing."""
 
 import asyncio
-import concurrent.futures
+import logging
 import os
-from typing import Any
+import threading
+from collections.abc import Coroutine
+from pathlib import Path
+from typing import Any, TypeVar
 
-from celery import Celery
+from celery import Celery, chain, chord
+from celery.canvas import Signature
+from celery.signals import (
+    task_failure,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
+from celery.utils import uuid
 
+from scouter.config import config
+from scouter.db import get_neo4j_driver, get_neo4j_llm
+from scouter.db.documents import find_document_by_doc_id, find_document_by_hash
+from scouter.ingestion import progress, stages
+from scouter.ingestion.blobstore import get_blob_store
+from scouter.ingestion.pdf import count_pdf_pages, page_ranges
+from scouter.ingestion.progress import get_progress_store
 from scouter.ingestion.service import IngestionService
+from scouter.ingestion.types import ExtractionMode, IngestMode
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+REDIS_URL = config.ingestion.redis_url
 
 app = Celery(
     "scouter.ingestion.tasks",
-    broker=os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+    broker=REDIS_URL,
+    backend=os.getenv("CELERY_RESULT_BACKEND", REDIS_URL),
 )
 
+# Staged ingestion: each stage has its own queue so CPU-bound and I/O-bound
+# work can run on separately sized and autoscaled worker pools.
+app.conf.task_routes = {
+    "scouter.ingestion.tasks.parse_document_task": {"queue": "ingest.parse"},
+    "scouter.ingestion.tasks.embed_chunks_task": {"queue": "ingest.embed"},
+    "scouter.ingestion.tasks.extract_graph_task": {"queue": "ingest.extract"},
+    "scouter.ingestion.tasks.extract_document_task": {"queue": "ingest.extract"},
+    "scouter.ingestion.tasks.write_graph_task": {"queue": "ingest.write"},
+}
+
+# Priority per ingestion mode. The Redis broker consumes lower values first,
+# so interactive uploads overtake backfill documents already queued on every
+# stage queue. Workers prefetch a single message per pool slot; a larger
+# prefetch would let backfill messages pile up in the worker ahead of them.
+PRIORITIES: dict[str, int] = {"interactive": 0, "backfill": 9}
+app.conf.worker_prefetch_multiplier = 1
+
+INGEST_QUEUES = [
+    app.conf.task_default_queue,
+    *dict.fromkeys(route["queue"] for route in app.conf.task_routes.values()),
+]
+
+# Worker-process state: one ingestion service and one event loop, reused by
+# every task the process runs. Workers run a threads pool, so concurrent tasks
+# share them and their embedding batches; prefork children get their own,
+# created after fork, but run one task at a time.
+_service: IngestionService | None = None
+_loop: asyncio.AbstractEventLoop | None = None
+_lock = threading.Lock()
+
+
+def _start_worker_state() -> None:
+    global _service, _loop  # noqa: PLW0603
+    # Connections inherited from the parent process through fork must not be
+    # reused, so drop cached clients before building the service.
+    get_neo4j_driver.cache_clear()
+    get_neo4j_llm.cache_clear()
+    _service = IngestionService()
+    _loop = asyncio.new_event_loop()
+    threading.Thread(
+        target=_loop.run_forever, name="ingestion-event-loop", daemon=True
+    ).start()
+    logger.info("Initialized worker ingestion service in process %d", os.getpid())
+
+
+@worker_process_init.connect
+def init_worker_process(**_kwargs: Any) -> None:
+    """Create the worker-lifetime ingestion service in a freshly forked child."""
+    with _lock:
+        _start_worker_state()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def shutdown_worker_process(**_kwargs: Any) -> None:
+    """Close the worker-lifetime service and stop its event loop."""
+    global _service, _loop
+    with _lock:
+        if _service is not None:
+            _service.close()
+        if _loop is not None:
+            # Background tasks such as the embedding batcher's consumer are
+            # cancelled first, so they do not outlive the loop.
+            asyncio.run_coroutine_threadsafe(_cancel_pending(), _loop).result()
+            _loop.call_soon_threadsafe(_loop.stop)
+        _service, _loop = None, None
+
+
+async def _cancel_pending() -> None:
+    pending = asyncio.all_tasks() - {asyncio.current_task()}
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+@task_failure.connect
+def release_failed_document(args: tuple[Any, ...] = (), **_kwargs: Any) -> None:
+    """Release the in-flight bytes of a document whose task failed."""
+    for arg in args:
+        if isinstance(arg, dict) and arg.get("task_id"):
+            progress.release(arg["task_id"])
+            return
+
+
+def get_worker_service() -> IngestionService:
+    """Get the worker-lifetime ingestion service.
+
+    Created lazily when tasks run outside a prefork child, e.g. with the
+    threads or solo pool or eager execution.
+    """
+    with _lock:
+        if _service is None or _loop is None:
+            _start_worker_state()
+        assert _service is not None
+        return _service
+
+
+def run_in_worker_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the worker's long-lived event loop and wait for it.
+
+    The loop runs in a dedicated thread, so tasks executing concurrently in
+    the same process share it along with the service's connections.
+    """
+    get_worker_service()
+    assert _loop is not None
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+def run_tracked(
+    task_id: str | None,
+    coro: Coroutine[Any, Any, T],
+    *,
+    final: bool = False,
+    part: int | None = None,
+) -> T:
+    """Run a coroutine in the worker loop, recording progress under task_id.
+
+    Args:
+        task_id: Tracking id of the document, None if it is not tracked.
+        coro: Coroutine doing the work.
+        final: Whether the document is done once the coroutine returns.
+        part: Part of a split document processed by the coroutine, if any.
+    """
+
+    async def tracked() -> T:
+        with progress.tracking(task_id, final=final, part=part):
+            return await coro
+
+    return run_in_worker_loop(tracked())
+
+
+def _next_stage(task_id: str | None, payload: dict[str, Any]) -> dict[str, Any]:
+    """Carry the tracking id over to the next stage's payload."""
+    return {**payload, "task_id": task_id}
+
+
+def _offload_text(task_data: dict[str, Any]) -> dict[str, Any]:
+    """Move a large text out of the task message into the blob store.
+
+    Texts over ``INGEST_TEXT_OFFLOAD_BYTES`` are replaced by a ``text_ref``
+    so only the reference travels through the broker.
+    """
+    text = task_data.get("text")
+    threshold = config.ingestion.text_offload_bytes
+    if text is None or not threshold or len(text.encode("utf-8")) <= threshold:
+        return task_data
+    rest = {key: value for key, value in task_data.items() if key != "text"}
+    return {**rest, "text_ref": get_blob_store().put_text("text", text)}
+
+
+def _load_text(task_data: dict[str, Any]) -> dict[str, Any]:
+    """Read an offloaded text back into the task data."""
+    if "text_ref" not in task_data:
+        return task_data
+    return {**task_data, "text": get_blob_store().get_text(task_data["text_ref"])}
+
+
+def _delete_text(task_data: dict[str, Any]) -> None:
+    """Delete an offloaded text once its task has finished or failed.
+
+    Tasks are not retried, so a failed task's text would never be read again.
+    """
+    if "text_ref" in task_data:
+        get_blob_store().delete(task_data["text_ref"])
+
 
 @app.task
 def process_document_task(task_data: dict[str, Any]) -> dict[str, Any]:
     """Long-running task to process PDF or text into the knowledge graph.
 
     Args:
-        task_data: Dictionary containing file_path, text, and metadata.
+        task_data: Dictionary containing file_path, text, metadata and
+            optionally a precomputed content_hash.
+
+    Returns:
+        Dictionary with processing result.
+    """
+    service = get_worker_service()
+    try:
+        document = _load_text(task_data)
+        return run_tracked(
+            task_data.get("task_id"),
+            service.process_document(
+                file_path=document.get("file_path"),
+                text=document.get("text"),
+                metadata=document.get("metadata", {}),
+                content_hash=document.get("content_hash"),
+            ),
+            final=True,
+        )
+    finally:
+        _delete_text(task_data)
+
+
+@app.task
+def index_document_task(
+    task_data: dict[str, Any], extraction: ExtractionMode = "deferred"
+) -> dict[str, Any]:
+    """Write a document's chunks and embeddings, leaving extraction for later.
+
+    With ``deferred`` extraction, an :func:`extract_document_task` is queued
+    at backfill priority once the chunks are written.
+
+    Args:
+        task_data: Dictionary containing file_path, text, metadata and
+            optionally a precomputed content_hash.
+        extraction: ``deferred`` or ``skip``.
+
+    Returns:
+        Dictionary with processing result.
+    """
+    service = get_worker_service()
+    defer = extraction == "deferred"
+    try:
+        document = _load_text(task_data)
+        result = run_tracked(
+            task_data.get("task_id"),
+            service.index_document(
+                file_path=document.get("file_path"),
+                text=document.get("text"),
+                metadata=document.get("metadata", {}),
+                content_hash=document.get("content_hash"),
+                defer_extraction=defer,
+            ),
+            final=True,
+        )
+    finally:
+        _delete_text(task_data)
+    if defer and result.get("extraction") == "pending":
+        extract_document_task.apply_async(
+            args=(result["content_hash"],), priority=PRIORITIES["backfill"]
+        )
+    return result
+
+
+@app.task
+def extract_document_task(content_hash: str) -> dict[str, Any]:
+    """Extract the knowledge graph of a document indexed without it.
+
+    Args:
+        content_hash: SHA-256 of the document.
+
+    Returns:
+        Dictionary with extraction result.
+    """
+    return run_in_worker_loop(get_worker_service().extract_deferred(content_hash))
+
+
+@app.task
+def parse_document_task(task_data: dict[str, Any]) -> dict[str, Any]:
+    """Stage 1: load and chunk a document (queue ``ingest.parse``)."""
+    task_id = task_data.get("task_id")
+    try:
+        payload = run_tracked(
+            task_id, stages.parse(get_worker_service(), _load_text(task_data))
+        )
+    finally:
+        _delete_text(task_data)
+    return _next_stage(task_id, payload)
+
+
+@app.task
+def embed_chunks_task(payload: dict[str, Any]) -> dict[str, Any]:
+    """Stage 2: embed the document's chunks (queue ``ingest.embed``)."""
+    task_id = payload.get("task_id")
+    return _next_stage(
+        task_id, run_tracked(task_id, stages.embed(get_worker_service(), payload))
+    )
+
+
+@app.task
+def extract_graph_task(payload: dict[str, Any]) -> dict[str, Any]:
+    """Stage 3: extract entities and relations (queue ``ingest.extract``)."""
+    task_id = payload.get("task_id")
+    return _next_stage(
+        task_id, run_tracked(task_id, stages.extract(get_worker_service(), payload))
+    )
+
+
+@app.task
+def write_graph_task(payload: dict[str, Any]) -> dict[str, Any]:
+    """Stage 4: write the graph to Neo4j (queue ``ingest.write``)."""
+    return run_tracked(
+        payload.get("task_id"),
+        stages.write(get_worker_service(), payload),
+        final=True,
+    )
+
+
+@app.task
+def process_pdf_part_task(
+    task_data: dict[str, Any], part: int, start: int, end: int
+) -> dict[str, Any]:
+    """Process one page range of a large PDF.
+
+    Args:
+        task_data: Task data of the whole document, with its content_hash.
+        part: Position of the page range in the document.
+        start: First page of the range.
+        end: Page after the last page of the range.
+
+    Returns:
+        Dictionary with the part number and its chunk count.
+    """
+    return run_tracked(
+        task_data.get("task_id"),
+        get_worker_service().process_pdf_part(
+            task_data["file_path"],
+            task_data["content_hash"],
+            part,
+            start,
+            end,
+            run_id=task_data["task_id"],
+        ),
+        part=part,
+    )
+
+
+@app.task
+def finalize_pdf_task(
+    part_results: list[dict[str, Any]], task_data: dict[str, Any]
+) -> dict[str, Any]:
+    """Merge the processed parts of a large PDF into one Document.
+
+    Args:
+        part_results: Results of every part task.
+        task_data: Task data of the whole document, with its content_hash.
 
     Returns:
         Dictionary with processing result.
     """
+    result = run_tracked(
+        task_data.get("task_id"),
+        get_worker_service().finalize_pdf_parts(
+            task_data["file_path"],
+            task_data["content_hash"],
+            metadata=task_data.get("metadata", {}),
+            run_id=task_data["task_id"],
+        ),
+        final=True,
+    )
+    return {**result, "parts": len(part_results)}
+
+
+def _pdf_page_ranges(task_data: dict[str, Any]) -> list[tuple[int, int]]:
+    """Page ranges to process in parallel, or [] to process the document whole.
+
+    Only new PDFs longer than one part are split. A PDF whose content is
+    already ingested goes through the duplicate path, and one whose doc_id
+    already exists through the incremental update path instead.
+    """
+    pages_per_part = config.ingestion.pdf_pages_per_part
+    file_path = task_data.get("file_path")
+    if not pages_per_part or file_path is None or not task_data.get("content_hash"):
+        return []
+    page_count = count_pdf_pages(file_path)
+    if page_count <= pages_per_part:
+        return []
+    driver = get_neo4j_driver()
+    if find_document_by_hash(driver, task_data["content_hash"]) is not None:
+        return []
+    doc_id = task_data.get("metadata", {}).get("doc_id")
+    if doc_id and find_document_by_doc_id(driver, doc_id) is not None:
+        return []
+    return page_ranges(page_count, pages_per_part)
+
+
+def _document_size(task_data: dict[str, Any]) -> int:
+    if file_path := task_data.get("file_path"):
+        return Path(file_path).stat().st_size
+    return len(task_data.get("text", "").encode("utf-8"))
+
+
+def document_signature(
+    task_data: dict[str, Any],
+    mode: IngestMode = "interactive",
+    tenant: str | None = None,
+    extraction: ExtractionMode = "inline",
+) -> Signature:
+    """Build the Celery signature that ingests one document.
+
+    PDFs longer than ``INGEST_PDF_PAGES_PER_PART`` pages are split into page
+    ranges processed in parallel by a chord, whose callback links the parts
+    into one Document. Otherwise, with ``INGEST_STAGED`` enabled the document
+    runs as a chain of stage tasks, else as a single
+    :func:`process_document_task`. Documents ingested without inline
+    extraction always run as a single :func:`index_document_task`. Either way
+    the final task returns the processing result.
+
+    The final task's id doubles as the document's tracking id: it is passed to
+    every task so they can record progress under it, and the document is
+    registered as queued in the progress store, where its size counts as in
+    flight for admission control until it finishes or fails. Large texts are
+    handed over through the blob store instead of the task message.
+
+    Args:
+        task_data: Dictionary containing file_path, text, metadata and
+            optionally a precomputed content_hash.
+        mode: ``interactive`` for user uploads, ``backfill`` for bulk loads
+            that should yield to them. Sets the priority of every task.
+        tenant: Tenant that submitted the document, if known.
+        extraction: When to extract the knowledge graph, see
+            :data:`~scouter.ingestion.types.ExtractionMode`.
+
+    Returns:
+        Signature to apply or add to a group.
+    """
+    task_id = uuid()
+    size = _document_size(task_data)
+    task_data = _offload_text({**task_data, "task_id": task_id})
+    priority = PRIORITIES[mode]
+
+    def step(task: Any, *args: Any) -> Signature:
+        return task.s(*args).set(priority=priority)
 
-    async def run_async() -> dict[str, Any]:
-        service = IngestionService()
-        try:
-            file_path = task_data.get("file_path")
-            text = task_data.get("text")
-            metadata = task_data.get("metadata", {})
-            return await service.process_document(
-                file_path=file_path,
-                text=text,
-                metadata=metadata,
-            )
-        finally:
-            service.close()
-
-    # Run the async function in the event loop
-    loop = asyncio.get_event_loop()
-    if loop.is_running():
-        # If there's already a running loop, use ThreadPoolExecutor
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, run_async())
-            return future.result()
+    if extraction != "inline":
+        signature = step(index_document_task, task_data, extraction).set(
+            task_id=task_id
+        )
+    elif ranges := _pdf_page_ranges(task_data):
+        signature = chord(
+            (
+                step(process_pdf_part_task, task_data, part, start, end)
+                for part, (start, end) in enumerate(ranges)
+            ),
+            step(finalize_pdf_task, task_data).set(task_id=task_id),
+        )
+    elif config.ingestion.staged:
+        signature = chain(
+            step(parse_document_task, task_data),
+            step(embed_chunks_task),
+            step(extract_graph_task),
+            step(write_graph_task).set(task_id=task_id),
+        )
     else:
-        return asyncio.run(run_async())
+        signature = step(process_document_task, task_data).set(task_id=task_id)
+    get_progress_store().enqueued(task_id, size=size, tenant=tenant)
+    return signature
@@ -0,0 +1,12 @@
+"""Ingestion modes shared by the API, the Celery tasks and bulk ingestion."""
+
+from typing import Literal
+
+# Scheduling priority of a document: ``interactive`` uploads overtake
+# ``backfill`` documents already queued on every stage queue.
+IngestMode = Literal["interactive", "backfill"]
+
+# When to extract the knowledge graph: with the document (``inline``), later
+# by a backfill-priority task (``deferred``), or not at all (``skip``). The
+# last two make chunks searchable by vector as soon as they are embedded.
+ExtractionMode = Literal["inline", "deferred", "skip"]
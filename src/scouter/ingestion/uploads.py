@@ -0,0 +1,152 @@
+"""Streaming helpers for persisting uploaded documents."""
+
+import hashlib
+import json
+import tempfile
+from collections.abc import AsyncIterator, Callable, Coroutine
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from fastapi import HTTPException, Request, Response, UploadFile
+from fastapi.routing import APIRoute
+
+from scouter.config import config
+from scouter.ingestion.admission import check_admission
+
+
+@dataclass
+class StoredUpload:
+    """An upload that has been copied to local disk."""
+
+    path: str
+    content_hash: str
+    size: int
+
+
+def _too_large(limit: int) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"Upload exceeds the maximum allowed size of {limit} bytes",
+    )
+
+
+class UploadLimitRoute(APIRoute):
+    """Route that rejects oversized requests before the body is parsed.
+
+    FastAPI parses multipart forms before the endpoint runs, so checking the
+    declared Content-Length here avoids spooling uploads we would reject anyway.
+    POST requests are also turned away with 429 while ingestion is saturated,
+    see :func:`check_admission`.
+    """
+
+    def max_request_bytes(self) -> int:
+        """Largest request body accepted by this route."""
+        return config.ingestion.max_upload_bytes
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_handler = super().get_route_handler()
+
+        async def handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length")
+            limit = self.max_request_bytes()
+            if (
+                content_length
+                and content_length.isdigit()
+                and int(content_length) > limit
+            ):
+                raise _too_large(limit)
+            if request.method == "POST":
+                await check_admission(request)
+            return await original_handler(request)
+
+        return handler
+
+
+class BatchUploadLimitRoute(UploadLimitRoute):
+    """Upload route that allows request bodies up to the batch size limit."""
+
+    def max_request_bytes(self) -> int:
+        """Largest request body accepted by this route."""
+        return config.ingestion.max_batch_upload_bytes
+
+
+async def save_upload(file: UploadFile, suffix: str = ".pdf") -> StoredUpload:
+    """Copy an upload to a temporary file in fixed-size chunks.
+
+    The SHA-256 digest is computed during the copy so callers get a content
+    fingerprint without reading the file a second time.
+
+    Args:
+        file: Uploaded file to persist.
+        suffix: Suffix for the temporary file name.
+
+    Returns:
+        StoredUpload with the temp file path, content hash and size in bytes.
+
+    Raises:
+        HTTPException: 413 if the upload exceeds the configured maximum size.
+    """
+    max_bytes = config.ingestion.max_upload_bytes
+    chunk_bytes = config.ingestion.upload_chunk_bytes
+    if file.size is not None and file.size > max_bytes:
+        raise _too_large(max_bytes)
+
+    digest = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+        try:
+            while chunk := await file.read(chunk_bytes):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise _too_large(max_bytes)
+                digest.update(chunk)
+                temp_file.write(chunk)
+        except BaseException:
+            temp_file.close()
+            Path(temp_file.name).unlink(missing_ok=True)
+            raise
+
+    return StoredUpload(path=temp_file.name, content_hash=digest.hexdigest(), size=size)
+
+
+async def iter_ndjson(file: UploadFile) -> AsyncIterator[dict[str, Any]]:
+    """Yield JSON objects from an NDJSON upload without loading it whole.
+
+    Blank lines are skipped.
+
+    Args:
+        file: Uploaded NDJSON file, one JSON object per line.
+
+    Yields:
+        Parsed JSON object for each non-empty line.
+
+    Raises:
+        HTTPException: 422 if a line is not a JSON object.
+    """
+    chunk_bytes = config.ingestion.upload_chunk_bytes
+    buffer = b""
+    line_no = 0
+    while True:
+        chunk = await file.read(chunk_bytes)
+        buffer += chunk
+        lines = buffer.split(b"\n")
+        buffer = lines.pop() if chunk else b""
+        for line in lines:
+            line_no += 1
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise HTTPException(
+                    status_code=422, detail=f"Invalid JSON on NDJSON line {line_no}"
+                ) from e
+            if not isinstance(item, dict):
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"NDJSON line {line_no} must be a JSON object",
+                )
+            yield item
+        if not chunk:
+            return
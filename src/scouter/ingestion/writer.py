@@ -0,0 +1,195 @@
+"""Batched Neo4j writer for extracted knowledge graphs."""
+
+import asyncio
+from collections import defaultdict
+from typing import Any
+
+import neo4j
+from neo4j_graphrag.experimental.components.kg_writer import KGWriter, KGWriterModel
+from neo4j_graphrag.experimental.components.types import (
+    LexicalGraphConfig,
+    Neo4jGraph,
+)
+from neo4j_graphrag.experimental.pipeline.config.runner import PipelineRunner
+from neo4j_graphrag.experimental.pipeline.kg_builder import SimpleKGPipeline
+from pydantic import validate_call
+
+_TMP_ID_INDEX = """
+CREATE INDEX __entity__tmp_internal_id IF NOT EXISTS
+FOR (n:__KGBuilder__) ON (n.__tmp_internal_id)
+"""
+
+_CLEAR_TMP_IDS = """
+UNWIND $rows AS id
+MATCH (n:__KGBuilder__ {__tmp_internal_id: id})
+REMOVE n.__tmp_internal_id
+"""
+
+
+def _quote(name: str) -> str:
+    """Quote a label or relationship type for use in Cypher."""
+    return "`" + name.replace("`", "``") + "`"
+
+
+def _node_query(labels: tuple[str, ...], embedding_keys: tuple[str, ...]) -> str:
+    label_set = "".join(f":{_quote(label)}" for label in labels)
+    vectors = "".join(
+        f"\nWITH n, row CALL db.create.setNodeVectorProperty(n, {key!r}, "
+        f"row.embedding_properties[{key!r}])"
+        for key in embedding_keys
+    )
+    return (
+        "UNWIND $rows AS row\n"
+        "MERGE (n:__KGBuilder__ {__tmp_internal_id: row.id})\n"
+        f"SET n{label_set}, n += row.properties"
+        f"{vectors}"
+    )
+
+
+def _relationship_query(rel_type: str, embedding_keys: tuple[str, ...]) -> str:
+    vectors = "".join(
+        f"\nWITH r, row CALL db.create.setRelationshipVectorProperty(r, {key!r}, "
+        f"row.embedding_properties[{key!r}])"
+        for key in embedding_keys
+    )
+    return (
+        "UNWIND $rows AS row\n"
+        "MATCH (start:__KGBuilder__ {__tmp_internal_id: row.start_node_id})\n"
+        "MATCH (end:__KGBuilder__ {__tmp_internal_id: row.end_node_id})\n"
+        f"MERGE (start)-[r:{_quote(rel_type)}]->(end)\n"
+        "SET r += row.properties"
+        f"{vectors}"
+    )
+
+
+def _run_batches(
+    tx: neo4j.ManagedTransaction,
+    statements: list[tuple[str, list[dict[str, Any]]]],
+    batch_size: int,
+) -> None:
+    for query, rows in statements:
+        for start in range(0, len(rows), batch_size):
+            tx.run(query, rows=rows[start : start + batch_size]).consume()
+
+
+class BatchedNeo4jWriter(KGWriter):
+    """Write a knowledge graph with a few large UNWIND statements.
+
+    Nodes are grouped by label set and relationships by type, so labels and
+    types are static in each statement and need no APOC calls per row. Each
+    group is written in ``UNWIND $rows`` batches of ``batch_size`` rows. The
+    graph is committed in three managed transactions (nodes, relationships,
+    temporary id clean-up) that the driver retries on transient errors; the
+    statements MERGE on the temporary id, so a retried transaction does not
+    create duplicates.
+
+    Unlike the default writer, only the temporary ids of nodes this graph
+    touches are cleared, so concurrent pipeline runs do not clear each
+    other's ids before their relationships are written.
+
+    Args:
+        driver: Neo4j driver.
+        batch_size: Rows per UNWIND statement.
+    """
+
+    def __init__(self, driver: neo4j.Driver, batch_size: int = 2000) -> None:
+        if batch_size < 1:
+            msg = "Write batch size must be at least 1"
+            raise ValueError(msg)
+        self.driver = driver
+        self.batch_size = batch_size
+        self._index_ready = False
+
+    def _node_statements(
+        self, graph: Neo4jGraph, lexical_graph_config: LexicalGraphConfig
+    ) -> list[tuple[str, list[dict[str, Any]]]]:
+        groups: dict[tuple[tuple[str, ...], tuple[str, ...]], list[dict[str, Any]]]
+        groups = defaultdict(list)
+        for node in graph.nodes:
+            labels = (node.label,)
+            if node.label not in lexical_graph_config.lexical_graph_node_labels:
+                labels = (node.label, "__Entity__")
+            embeddings = node.embedding_properties or {}
+            groups[labels, tuple(sorted(embeddings))].append(
+                {
+                    "id": node.id,
+                    "properties": node.properties,
+                    "embedding_properties": embeddings,
+                }
+            )
+        return [
+            (_node_query(labels, keys), rows) for (labels, keys), rows in groups.items()
+        ]
+
+    def _relationship_statements(
+        self, graph: Neo4jGraph
+    ) -> list[tuple[str, list[dict[str, Any]]]]:
+        groups: dict[tuple[str, tuple[str, ...]], list[dict[str, Any]]]
+        groups = defaultdict(list)
+        for rel in graph.relationships:
+            embeddings = rel.embedding_properties or {}
+            groups[rel.type, tuple(sorted(embeddings))].append(
+                {
+                    "start_node_id": rel.start_node_id,
+                    "end_node_id": rel.end_node_id,
+                    "properties": rel.properties,
+                    "embedding_properties": embeddings,
+                }
+            )
+        return [
+            (_relationship_query(rel_type, keys), rows)
+            for (rel_type, keys), rows in groups.items()
+        ]
+
+    def _write(
+        self, graph: Neo4jGraph, lexical_graph_config: LexicalGraphConfig
+    ) -> None:
+        if not self._index_ready:
+            self.driver.execute_query(_TMP_ID_INDEX)
+            self._index_ready = True
+
+        # Relationships may point at nodes written earlier in the run, e.g.
+        # chunks created before extraction, so their ids are cleared too.
+        tmp_ids = {node.id for node in graph.nodes}
+        for rel in graph.relationships:
+            tmp_ids.update((rel.start_node_id, rel.end_node_id))
+
+        with self.driver.session() as session:
+            for statements in (
+                self._node_statements(graph, lexical_graph_config),
+                self._relationship_statements(graph),
+                [(_CLEAR_TMP_IDS, sorted(tmp_ids))],
+            ):
+                session.execute_write(_run_batches, statements, self.batch_size)
+
+    @validate_call
+    async def run(
+        self,
+        graph: Neo4jGraph,
+        lexical_graph_config: LexicalGraphConfig = LexicalGraphConfig(),
+    ) -> KGWriterModel:
+        """Write a knowledge graph to Neo4j.
+
+        Args:
+            graph: Nodes and relationships to write.
+            lexical_graph_config: Node labels of the lexical graph, which do
+                not get the ``__Entity__`` label.
+
+        Returns:
+            Writer result with node and relationship counts.
+        """
+        await asyncio.to_thread(self._write, graph, lexical_graph_config)
+        return KGWriterModel(
+            status="SUCCESS",
+            metadata={
+                "node_count": len(graph.nodes),
+                "relationship_count": len(graph.relationships),
+            },
+        )
+
+
+def use_batched_writer(pipeline: SimpleKGPipeline, writer: BatchedNeo4jWriter) -> None:
+    """Replace a pipeline's KG writer with a BatchedNeo4jWriter."""
+    runner = getattr(pipeline, "runner", None)
+    if isinstance(runner, PipelineRunner):
+        runner.pipeline.set_component("writer", writer)
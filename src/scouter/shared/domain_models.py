@@ -53,6 +53,67 @@ class VectorSearchResult(BaseModel):
 
 
 class IngestResponse(BaseModel):
-    task_id: str = Field(..., description="Celery task ID for tracking ingestion")
+    task_id: str | None = Field(
+        None,
+        description="Celery task ID for tracking ingestion (None if already ingested)",
+    )
     status: str = Field(..., description="Status of the ingestion request")
     env: str = Field(..., description="Current environment")
+
+
+class BatchIngestResponse(BaseModel):
+    batch_id: str | None = Field(
+        None,
+        description="Celery group ID for tracking the batch (None if nothing was enqueued)",
+    )
+    status: str = Field(..., description="Status of the batch ingestion request")
+    accepted: int = Field(..., description="Number of documents enqueued")
+    already_ingested: int = Field(
+        ...,
+        description="Number of documents skipped because they were already ingested",
+    )
+    env: str = Field(..., description="Current environment")
+
+
+class BatchStatusResponse(BaseModel):
+    batch_id: str = Field(..., description="Celery group ID of the batch")
+    total: int = Field(..., description="Number of documents in the batch")
+    completed: int = Field(..., description="Documents that finished successfully")
+    failed: int = Field(..., description="Documents whose task failed")
+    pending: int = Field(..., description="Documents still queued or running")
+
+
+class CacheStats(BaseModel):
+    hits: int = Field(..., description="Lookups served from the cache")
+    misses: int = Field(..., description="Lookups that had to be computed")
+    hit_rate: float = Field(..., description="Fraction of lookups served from cache")
+    entries: int = Field(..., description="Number of cached values")
+    max_entries: int = Field(..., description="Cache capacity before LRU eviction")
+
+
+class TaskStatusResponse(BaseModel):
+    task_id: str = Field(..., description="Tracking ID returned by ingestion")
+    state: str = Field(..., description="Celery state of the task")
+    stage: str | None = Field(
+        default=None,
+        description="Current stage: queued, parse, embed, extract, write or done",
+    )
+    chunks: int | None = Field(default=None, description="Chunks produced so far")
+    durations: dict[str, float] = Field(
+        default_factory=dict, description="Seconds spent per stage, incl. queueing"
+    )
+    result: dict | None = Field(default=None, description="Processing result")
+    error: str | None = Field(default=None, description="Error of a failed task")
+
+
+class StageStats(BaseModel):
+    documents: int = Field(..., description="Finished documents that ran the stage")
+    total_seconds: float = Field(..., description="Time spent in the stage")
+    mean_seconds: float = Field(..., description="Mean time per document")
+
+
+class IngestStats(BaseModel):
+    queues: dict[str, int] = Field(..., description="Messages waiting per queue")
+    stages: dict[str, StageStats] = Field(
+        ..., description="Stage timings aggregated over finished documents"
+    )
@@ -0,0 +1,5 @@
+"""Search tools for Scouter agents; importing this package registers them."""
+
+from . import hybrid_search, semantic_search
+
+__all__ = ["hybrid_search", "semantic_search"]
@@ -0,0 +1,19 @@
+"""API endpoints for the search tools."""
+
+from fastapi import APIRouter, HTTPException
+
+from scouter.db.embedding_cache import get_query_embedding_cache
+from scouter.shared.domain_models import CacheStats
+
+router = APIRouter()
+
+
+@router.get("/v1/search/query-embedding-cache", response_model=CacheStats)
+async def get_query_embedding_cache_stats() -> CacheStats:
+    """Report this process's query embedding cache hit/miss counters."""
+    cache = get_query_embedding_cache()
+    if cache is None:
+        raise HTTPException(status_code=404, detail="Query embedding cache is disabled")
+    stats = cache.stats()
+    lookups = stats["hits"] + stats["misses"]
+    return CacheStats(**stats, hit_rate=stats["hits"] / lookups if lookups else 0.0)
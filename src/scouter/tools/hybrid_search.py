@@ -0,0 +1,159 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import neo4j
+from pydantic import BaseModel, Field
+
+from scouter.db import (
+    get_neo4j_driver,
+    get_query_embedder,
+    get_retriever_registry,
+    get_search_result_cache,
+)
+from scouter.db.documents import create_chunk_text_index, search_chunk_text
+from scouter.llmcore import tool
+from scouter.shared.domain_models import VectorSearchResult
+from scouter.tools.semantic_search import (
+    CHUNK_PROPERTIES,
+    SearchResults,
+    format_chunk,
+)
+
+logger = logging.getLogger(__name__)
+
+# Damping constant of reciprocal rank fusion, as in Cormack et al. (2009).
+RRF_K = 60
+
+# Candidates fetched from each ranking per requested result.
+CANDIDATES_PER_RESULT = 2
+
+# Runs full-text queries while the calling thread runs the vector query.
+_fulltext_pool = ThreadPoolExecutor(thread_name_prefix="hybrid-search")
+
+# Set once this process has made sure the chunk_text index exists.
+_fulltext_index_ready = threading.Event()
+
+
+class HybridSearchParams(BaseModel):
+    query_text: str = Field(
+        description="user query; exact identifiers and rare terms are matched literally"
+    )
+    top_k: int = Field(default=10, description="Number of results to return (1-20)")
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[str]], k: int = RRF_K
+) -> list[tuple[str, float]]:
+    """Fuse rankings of ids by summing 1 / (k + rank) over the rankings.
+
+    Args:
+        rankings: Ids ordered best first, one list per ranking.
+        k: Damping constant; larger values flatten the rank contributions.
+
+    Returns:
+        Ids with their fused scores, best first.
+    """
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, node_id in enumerate(ranking, start=1):
+            scores[node_id] = scores.get(node_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def _search_fulltext(query_text: str, limit: int) -> list[dict[str, Any]]:
+    """Rank chunks by full-text match, or return none if the index is unusable.
+
+    The index is created on the first search, as the database may predate
+    it; while it is still being populated the results are vector-only.
+    """
+    driver = get_neo4j_driver()
+    try:
+        if not _fulltext_index_ready.is_set():
+            create_chunk_text_index(driver)
+            _fulltext_index_ready.set()
+        return search_chunk_text(driver, query_text, limit)
+    except neo4j.exceptions.ClientError:
+        logger.warning("Full-text search failed, ranking by vector only", exc_info=True)
+        return []
+
+
+def _search(search_params: HybridSearchParams) -> SearchResults:
+    candidates = search_params.top_k * CANDIDATES_PER_RESULT
+    fulltext = _fulltext_pool.submit(
+        _search_fulltext, search_params.query_text, candidates
+    )
+    vector_items = (
+        get_retriever_registry()
+        .search(
+            "chunkEmbedding",
+            get_query_embedder(),
+            result_formatter=format_chunk,
+            return_properties=CHUNK_PROPERTIES,
+            query_text=search_params.query_text,
+            top_k=candidates,
+        )
+        .items
+    )
+    fulltext_rows = fulltext.result()
+
+    # Text and metadata of every candidate, without its per-ranking score.
+    chunks = {
+        row["id"]: (
+            row["text"],
+            {
+                "id": row["id"],
+                "index": row["index"],
+                "content_hash": row["content_hash"],
+            },
+        )
+        for row in fulltext_rows
+    }
+    for item in vector_items:
+        metadata = {k: v for k, v in item.metadata.items() if k != "score"}
+        chunks[item.metadata["id"]] = (item.content, metadata)
+    rankings = {
+        "vector_rank": [item.metadata["id"] for item in vector_items],
+        "fulltext_rank": [row["id"] for row in fulltext_rows],
+    }
+    ranks = {
+        name: {node_id: rank for rank, node_id in enumerate(ranking, start=1)}
+        for name, ranking in rankings.items()
+    }
+
+    fused = reciprocal_rank_fusion(list(rankings.values()))
+    results = []
+    for node_id, score in fused[: search_params.top_k]:
+        content, metadata = chunks[node_id]
+        results.append(
+            VectorSearchResult(
+                node_id=node_id,
+                score=score,
+                content=content,
+                metadata={
+                    **metadata,
+                    "score": score,
+                    **{name: ranks[name].get(node_id) for name in ranks},
+                },
+            )
+        )
+    return SearchResults(results=results)
+
+
+@tool("hybrid_search")
+def hybrid_search(params: HybridSearchParams) -> SearchResults:
+    """Find relevant information by fusing semantic and keyword search.
+
+    Combines vector similarity with full-text matching of the query's terms,
+    so exact identifiers, names and rare terms are found as well as
+    paraphrases.
+    """
+    # Cast to the expected parameter type
+    search_params = HybridSearchParams(**params.model_dump())
+
+    cache = get_search_result_cache()
+    if cache is None:
+        return _search(search_params)
+    key = ("hybrid_search", search_params.model_dump_json())
+    return cache.get_or_search(key, lambda: _search(search_params))
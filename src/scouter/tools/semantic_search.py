@@ -1,9 +1,12 @@
-import ast
-
-from neo4j_graphrag.retrievers import VectorRetriever
+import neo4j
+from neo4j_graphrag.types import RetrieverResultItem
 from pydantic import BaseModel, Field
 
-from scouter.db import get_neo4j_driver, get_neo4j_embedder
+from scouter.db import (
+    get_query_embedder,
+    get_retriever_registry,
+    get_search_result_cache,
+)
 from scouter.llmcore import tool
 from scouter.shared.domain_models import VectorSearchResult
 
@@ -21,28 +24,52 @@ class SearchResults(BaseModel):
     results: list[VectorSearchResult]
 
 
-@tool("semantic_search")
-def semantic_search(params: SemanticSearchParams) -> SearchResults:
-    """Find relevant information based on cosine similarity search."""
-    # Cast to the expected parameter type
-    search_params = SemanticSearchParams(**params.model_dump())
+# Chunk properties returned by searches; embeddings and MinHash data stay in Neo4j.
+CHUNK_PROPERTIES = ("text", "index", "content_hash")
+
 
-    retriever = VectorRetriever(
-        driver=get_neo4j_driver(),
-        index_name="chunkEmbedding",
-        embedder=get_neo4j_embedder(),
+def format_chunk(record: neo4j.Record) -> RetrieverResultItem:
+    """Turn a chunk search record into a result item with native values."""
+    node = record["node"]
+    return RetrieverResultItem(
+        content=node.get("text") or "",
+        metadata={
+            "id": record["elementId"],
+            "score": record["score"],
+            "index": node.get("index"),
+            "content_hash": node.get("content_hash"),
+        },
     )
 
-    raw_results = retriever.search(**search_params.model_dump())
-    items = raw_results.items
+
+def _search(search_params: SemanticSearchParams) -> SearchResults:
+    raw_results = get_retriever_registry().search(
+        "chunkEmbedding",
+        get_query_embedder(),
+        result_formatter=format_chunk,
+        return_properties=CHUNK_PROPERTIES,
+        **search_params.model_dump(),
+    )
     results = [
         VectorSearchResult(
-            node_id=data.get("id", "unknown"),
-            score=data.get("score", 0.0),
-            content=data.get("text", ""),
-            metadata=data,
+            node_id=item.metadata["id"],
+            score=item.metadata["score"],
+            content=item.content,
+            metadata=item.metadata,
         )
-        for result in items
-        for data in [ast.literal_eval(result.content)]
+        for item in raw_results.items
     ]
     return SearchResults(results=results)
+
+
+@tool("semantic_search")
+def semantic_search(params: SemanticSearchParams) -> SearchResults:
+    """Find relevant information based on cosine similarity search."""
+    # Cast to the expected parameter type
+    search_params = SemanticSearchParams(**params.model_dump())
+
+    cache = get_search_result_cache()
+    if cache is None:
+        return _search(search_params)
+    key = ("semantic_search", search_params.model_dump_json())
+    return cache.get_or_search(key, lambda: _search(search_params))
@@ -0,0 +1,57 @@
+"""Tests for ingestion admission control."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from scouter.config import config
+from scouter.ingestion import admission
+
+
+def _request(content_length: int, tenant: str | None = None) -> MagicMock:
+    request = MagicMock()
+    request.headers = {"content-length": str(content_length)}
+    request.state = SimpleNamespace(
+        identity=SimpleNamespace(tenant_id=tenant) if tenant else None
+    )
+    return request
+
+
+@pytest.mark.asyncio
+async def test_admission_rejects_tenant_over_its_byte_limit(monkeypatch) -> None:
+    """Test a busy tenant gets 429 with Retry-After while others get through."""
+    monkeypatch.setattr(config.ingestion, "max_queued_messages", 100)
+    monkeypatch.setattr(config.ingestion, "max_inflight_bytes", 1000)
+    monkeypatch.setattr(config.ingestion, "tenant_max_inflight_bytes", 100)
+    monkeypatch.setattr(config.ingestion, "retry_after_s", 7)
+    store = MagicMock()
+    store.queue_depths.return_value = {"celery": 3, "ingest.parse": 2}
+    store.inflight_bytes.side_effect = lambda tenant=None: {
+        None: 90,
+        "busy": 90,
+    }.get(tenant, 0)
+    monkeypatch.setattr(admission, "get_progress_store", lambda: store)
+
+    await admission.check_admission(_request(50, tenant="quiet"))
+    with pytest.raises(HTTPException) as exc_info:
+        await admission.check_admission(_request(50, tenant="busy"))
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers == {"Retry-After": "7"}
+
+
+@pytest.mark.asyncio
+async def test_admission_rejects_when_queues_are_full(monkeypatch) -> None:
+    """Test requests wait once the broker queues reach their limit."""
+    monkeypatch.setattr(config.ingestion, "max_queued_messages", 5)
+    store = MagicMock()
+    store.queue_depths.return_value = {"celery": 3, "ingest.parse": 2}
+    store.inflight_bytes.return_value = 0
+    monkeypatch.setattr(admission, "get_progress_store", lambda: store)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await admission.check_admission(_request(10))
+
+    assert exc_info.value.status_code == 429
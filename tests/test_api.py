@@ -0,0 +1,49 @@
+"""Tests for the ingestion API."""
+
+from unittest.mock import ANY, MagicMock
+
+from scouter.ingestion import api
+from scouter.ingestion.api import _skip_duplicates
+
+
+def test_batch_repeats_merge_their_metadata(monkeypatch, tmp_path) -> None:
+    """Test a repeated document keeps its metadata, as a single upload would."""
+    monkeypatch.setattr(api, "get_neo4j_driver", MagicMock)
+    monkeypatch.setattr(api, "find_ingested_hashes", MagicMock(return_value=set()))
+    upload = tmp_path / "copy.pdf"
+    upload.write_bytes(b"%PDF")
+    items = [
+        {"text": "same", "content_hash": "h", "metadata": {"source": "a"}},
+        {
+            "file_path": str(upload),
+            "content_hash": "h",
+            "metadata": {"doc_id": "d2", "source": "b"},
+        },
+        {"text": "other", "content_hash": "o", "metadata": {}},
+    ]
+
+    pending, skipped = _skip_duplicates(items)
+
+    assert skipped == 1
+    assert [item["content_hash"] for item in pending] == ["h", "o"]
+    assert pending[0]["metadata"] == {"source": "b", "doc_id": "d2"}
+    assert not upload.exists()
+
+
+def test_batch_repeats_of_ingested_documents_merge_into_the_node(
+    monkeypatch,
+) -> None:
+    """Test metadata of every repeat reaches the already-ingested document."""
+    monkeypatch.setattr(api, "get_neo4j_driver", MagicMock)
+    monkeypatch.setattr(api, "find_ingested_hashes", MagicMock(return_value={"h"}))
+    merge = MagicMock()
+    monkeypatch.setattr(api, "merge_document_metadata", merge)
+    items = [
+        {"text": "same", "content_hash": "h", "metadata": {"source": "a"}},
+        {"text": "same", "content_hash": "h", "metadata": {"doc_id": "d2"}},
+    ]
+
+    pending, skipped = _skip_duplicates(items)
+
+    assert (pending, skipped) == ([], 2)
+    merge.assert_called_once_with(ANY, "h", {"source": "a", "doc_id": "d2"})
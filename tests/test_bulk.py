@@ -0,0 +1,69 @@
+"""Tests for local bulk ingestion."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from scouter.ingestion import progress
+from scouter.ingestion.bulk import BulkIngester, discover
+
+
+def test_discover_reads_directories_and_manifests(tmp_path) -> None:
+    """Test files are found recursively and manifest entries keep their ids."""
+    (tmp_path / "docs" / "sub").mkdir(parents=True)
+    (tmp_path / "docs" / "a.txt").write_text("a")
+    (tmp_path / "docs" / "sub" / "b.md").write_text("b")
+    (tmp_path / "docs" / "image.png").write_bytes(b"")
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text(
+        json.dumps({"path": "docs/a.txt", "id": "doc-a", "metadata": {"x": 1}})
+        + "\n\n"
+        + json.dumps({"text": "inline"})
+        + "\n"
+    )
+
+    assert [item.key for item in discover(str(tmp_path / "docs"))] == [
+        "a.txt",
+        "sub/b.md",
+    ]
+    by_path, inline = discover(str(manifest))
+    assert by_path.key == "doc-a"
+    assert by_path.metadata["x"] == 1
+    assert by_path.file_path == str(tmp_path / "docs" / "a.txt")
+    assert (inline.key, inline.text) == ("line:3", "inline")
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingest_resumes_from_state_file(tmp_path) -> None:
+    """Test finished documents are skipped and failed ones retried."""
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.txt").write_text(name)
+    state = tmp_path / "state.jsonl"
+    state.write_text(
+        json.dumps({"key": "a.txt", "status": "processed"})
+        + "\n"
+        + json.dumps({"key": "b.txt", "status": "failed"})
+        + '\n{"key": "c.t'
+    )
+
+    async def process_document(file_path, text, metadata, content_hash):
+        assert file_path is None
+        progress.add_chunks(2)
+        return {"status": "processed", "content_hash": content_hash}
+
+    service = MagicMock(process_document=AsyncMock(side_effect=process_document))
+    ingester = BulkIngester(service, str(state), concurrency=2)
+    stats = await ingester.run(
+        item for item in discover(str(tmp_path)) if item.key != "state.jsonl"
+    )
+
+    assert (stats.documents, stats.skipped, stats.chunks) == (2, 1, 4)
+    texts = sorted(c.kwargs["text"] for c in service.process_document.call_args_list)
+    assert texts == ["b", "c"]
+    records = ingester.state.load()
+    assert {key: record["status"] for key, record in records.items()} == {
+        "a.txt": "processed",
+        "b.txt": "processed",
+        "c.txt": "processed",
+    }
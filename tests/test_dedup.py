@@ -0,0 +1,81 @@
+"""Tests for near-duplicate chunk detection."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from neo4j_graphrag.experimental.components.types import TextChunk, TextChunks
+
+from scouter.ingestion import dedup
+from scouter.ingestion.chunking import chunk_hash
+from scouter.ingestion.dedup import MinHasher, NearDuplicateSplitter
+from scouter.ingestion.embedding import BatchedChunkEmbedder
+
+TEMPLATE = " ".join(f"clause {i} of the standard report template" for i in range(60))
+
+
+def test_minhash_estimates_similarity() -> None:
+    """Test a small edit keeps signatures close and other text does not."""
+    hasher = MinHasher()
+    base = hasher.signature(TEMPLATE)
+    edited = hasher.signature(TEMPLATE.replace("clause 7 ", "section 7 "))
+    other = hasher.signature(" ".join(f"unrelated sentence {i}" for i in range(80)))
+
+    assert hasher.similarity(base, edited) > 0.9
+    assert hasher.similarity(base, other) < 0.2
+    assert set(hasher.band_keys(base)) & set(hasher.band_keys(edited))
+
+
+@pytest.mark.asyncio
+async def test_splitter_marks_repeated_and_stored_chunks(monkeypatch) -> None:
+    """Test duplicates within a text and of stored chunks get duplicate_of."""
+    hasher = MinHasher()
+    stored_text = "stored " + TEMPLATE
+    stored = {"content_hash": "stored-hash", "minhash": hasher.signature(stored_text)}
+    lookup = MagicMock(side_effect=lambda *_: [[stored], [], [], []])
+    monkeypatch.setattr(dedup, "find_minhash_candidates", lookup)
+    monkeypatch.setattr(dedup, "create_chunk_minhash_index", MagicMock())
+    texts = [stored_text, TEMPLATE, "something else entirely", TEMPLATE + " end"]
+    splitter = MagicMock(
+        run=AsyncMock(
+            return_value=TextChunks(
+                chunks=[
+                    TextChunk(text=t, index=i, metadata={"content_hash": chunk_hash(t)})
+                    for i, t in enumerate(texts)
+                ]
+            )
+        )
+    )
+
+    chunks = (
+        await NearDuplicateSplitter(splitter, MagicMock(), hasher).run("ignored")
+    ).chunks
+
+    assert chunks[0].metadata["duplicate_of"] == "stored-hash"
+    assert "duplicate_of" not in chunks[1].metadata
+    assert len(chunks[1].metadata["minhash_bands"].split()) == hasher.bands
+    assert "duplicate_of" not in chunks[2].metadata
+    assert chunks[3].metadata["duplicate_of"] == chunk_hash(TEMPLATE)
+
+    canonical = NearDuplicateSplitter(splitter, MagicMock(), hasher).canonical(
+        chunks[3]
+    )
+    assert "duplicate_of" not in canonical.metadata
+    assert canonical.metadata["minhash"] == hasher.signature(TEMPLATE + " end")
+
+
+@pytest.mark.asyncio
+async def test_near_duplicates_are_not_embedded() -> None:
+    """Test the chunk embedder only embeds canonical chunks."""
+    batcher = MagicMock(embed=AsyncMock(return_value=[[0.5]]))
+    chunks = TextChunks(
+        chunks=[
+            TextChunk(text="a", index=0, metadata={"content_hash": "a"}),
+            TextChunk(text="a.", index=1, metadata={"duplicate_of": "a"}),
+        ]
+    )
+
+    embedded = await BatchedChunkEmbedder(batcher).run(text_chunks=chunks)
+
+    batcher.embed.assert_awaited_once_with(["a"])
+    assert embedded.chunks[0].metadata["embedding"] == [0.5]
+    assert "embedding" not in embedded.chunks[1].metadata
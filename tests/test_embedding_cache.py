@@ -0,0 +1,57 @@
+"""Tests for the persistent embedding cache."""
+
+from unittest.mock import MagicMock
+
+from scouter.db.embedding_cache import (
+    CachedEmbedder,
+    EmbeddingCache,
+    QueryCachedEmbedder,
+    QueryEmbeddingCache,
+    text_key,
+)
+
+
+def test_cached_embedder_only_encodes_misses(tmp_path) -> None:
+    """Test cached texts are not re-embedded and counters track lookups."""
+    cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite3"), max_entries=10)
+    inner = MagicMock()
+    inner.embed_query.side_effect = lambda text: [float(len(text)), 0.5]
+    embedder = CachedEmbedder(inner, cache, model="test-model")
+
+    assert embedder.embed_documents(["footer", "body"]) == [[6.0, 0.5], [4.0, 0.5]]
+    assert embedder.embed_documents(["  footer\n", "new"]) == [[6.0, 0.5], [3.0, 0.5]]
+
+    assert inner.embed_query.call_count == 3
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["entries"] == 3
+
+
+def test_embedding_cache_evicts_least_recently_used(tmp_path) -> None:
+    """Test the cache stays within max_entries by evicting stale vectors."""
+    cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite3"), max_entries=2)
+    cache.put_many("m", {"a": [1.0]})
+    cache.put_many("m", {"b": [2.0]})
+    cache.get_many("m", ["a"])
+    cache.put_many("m", {"c": [3.0]})
+
+    assert set(cache.get_many("m", ["a", "b", "c"])) == {"a", "c"}
+    assert text_key("a  b") == text_key("a b\n")
+
+
+def test_query_cache_serves_repeats_in_process() -> None:
+    """Test repeated queries skip the embedder and the LRU stays bounded."""
+    cache = QueryEmbeddingCache(max_entries=2)
+    inner = MagicMock()
+    inner.embed_query.side_effect = lambda text: [float(len(text)), 0.5]
+    embedder = QueryCachedEmbedder(inner, cache, model="test-model")
+
+    assert embedder.embed_query("who wrote it") == [12.0, 0.5]
+    assert embedder.embed_query(" who  wrote it\n") == [12.0, 0.5]
+    embedder.embed_query("second")
+    embedder.embed_query("third")
+    embedder.embed_query("who wrote it")
+
+    assert inner.embed_query.call_count == 4
+    assert cache.stats() == {"hits": 1, "misses": 4, "entries": 2, "max_entries": 2}
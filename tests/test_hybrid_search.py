@@ -0,0 +1,66 @@
+"""Tests for the hybrid search tool."""
+
+from unittest.mock import MagicMock
+
+import neo4j
+from neo4j_graphrag.types import RetrieverResultItem
+
+from scouter.tools import hybrid_search as tool
+from scouter.tools.hybrid_search import HybridSearchParams, reciprocal_rank_fusion
+
+
+def _chunk(node_id: str, text: str) -> dict:
+    return {"id": node_id, "text": text, "index": 0, "content_hash": node_id}
+
+
+def test_reciprocal_rank_fusion_rewards_agreement() -> None:
+    """Test ids ranked by both lists beat ids ranked first by only one."""
+    fused = reciprocal_rank_fusion([["a", "b"], ["b", "c"]], k=60)
+
+    assert [node_id for node_id, _ in fused] == ["b", "a", "c"]
+    assert fused[0][1] == 1 / 62 + 1 / 61
+
+
+def _use_vector_hits(monkeypatch, chunks: list[dict]) -> None:
+    vector_items = [
+        RetrieverResultItem(
+            content=chunk["text"], metadata={**chunk, "score": 0.9 - i / 10}
+        )
+        for i, chunk in enumerate(chunks)
+    ]
+    registry = MagicMock()
+    registry.search.return_value = MagicMock(items=vector_items)
+    monkeypatch.setattr(tool, "get_retriever_registry", lambda: registry)
+    monkeypatch.setattr(tool, "get_query_embedder", MagicMock)
+    monkeypatch.setattr(tool, "get_neo4j_driver", MagicMock)
+    monkeypatch.setattr(tool, "get_search_result_cache", lambda: None)
+    monkeypatch.setattr(tool, "create_chunk_text_index", MagicMock())
+
+
+def test_exact_terms_found_only_by_full_text_are_returned(monkeypatch) -> None:
+    """Test full-text matches missed by vector search reach the results."""
+    _use_vector_hits(monkeypatch, [_chunk("v1", "errors"), _chunk("both", "ERR-42")])
+    fulltext = MagicMock(return_value=[_chunk("both", "ERR-42"), _chunk("t1", "x")])
+    monkeypatch.setattr(tool, "search_chunk_text", fulltext)
+
+    result = tool.hybrid_search(HybridSearchParams(query_text="ERR-42", top_k=2))
+
+    assert [hit.node_id for hit in result.results] == ["both", "v1"]
+    assert result.results[0].metadata["vector_rank"] == 2
+    assert result.results[0].metadata["fulltext_rank"] == 1
+    assert fulltext.call_args.args[1:] == ("ERR-42", 4)
+
+
+def test_unusable_full_text_index_falls_back_to_vector_search(monkeypatch) -> None:
+    """Test a missing or populating chunk_text index leaves vector results."""
+    _use_vector_hits(monkeypatch, [_chunk("v1", "errors"), _chunk("v2", "ERR-42")])
+    monkeypatch.setattr(
+        tool,
+        "search_chunk_text",
+        MagicMock(side_effect=neo4j.exceptions.ClientError("no such index")),
+    )
+
+    result = tool.hybrid_search(HybridSearchParams(query_text="ERR-42", top_k=2))
+
+    assert [hit.node_id for hit in result.results] == ["v1", "v2"]
+    assert result.results[0].metadata["fulltext_rank"] is None
@@ -4,9 +4,25 @@ import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
+import neo4j
 import pytest
-import scouter_app.ingestion.service as svc
-from scouter_app.ingestion.service import IngestionService
+
+import scouter.ingestion.service as svc
+from scouter.config import config
+from scouter.ingestion import dedup
+from scouter.ingestion.service import IngestionService, fingerprint_text
+
+
+@pytest.fixture(autouse=True)
+def _no_near_duplicates(monkeypatch) -> None:
+    monkeypatch.setattr(config.ingestion, "near_duplicate_threshold", 0)
+
+
+@pytest.fixture(autouse=True)
+def no_existing_documents(monkeypatch):
+    """Treat every document as new and skip schema setup."""
+    monkeypatch.setattr(svc, "create_document_constraints", MagicMock())
+    monkeypatch.setattr(svc, "find_document_by_hash", MagicMock(return_value=None))
 
 
 @pytest.mark.asyncio
@@ -36,7 +52,10 @@ async def test_process_document_text() -> None:
         assert result["type"] == "text"
         mock_pipeline.run_async.assert_called_once_with(
             text="sample text",
-            document_metadata={"key": "value"},
+            document_metadata={
+                "key": "value",
+                "content_hash": fingerprint_text("sample text"),
+            },
         )
     finally:
         svc.SimpleKGPipeline = original_pipeline
@@ -68,9 +87,249 @@ async def test_process_document_pdf() -> None:
         assert result["type"] == "pdf"
         mock_pipeline.run_async.assert_called_once_with(
             file_path=temp_path,
-            document_metadata={},
+            document_metadata={"content_hash": svc.fingerprint_file(temp_path)},
         )
     finally:
         svc.SimpleKGPipeline = original_pipeline
         if temp_path:
             Path(temp_path).unlink(missing_ok=True)
+
+
+@pytest.mark.asyncio
+async def test_extracted_pdf_text_is_stored_as_pdf(monkeypatch) -> None:
+    """Test PDF text extracted beforehand keeps the PDF's path and type."""
+    mock_pipeline_cls = MagicMock()
+    monkeypatch.setattr(svc, "SimpleKGPipeline", mock_pipeline_cls)
+    service = IngestionService()
+    monkeypatch.setattr(service, "extract_graph", AsyncMock())
+    monkeypatch.setattr(service, "write_graph", AsyncMock())
+    service.embed_batcher.embed = AsyncMock(
+        side_effect=lambda texts: [[0.1]] * len(texts)
+    )
+
+    result = await service.process_document(
+        file_path="/data/report.pdf", text="page text", content_hash="h"
+    )
+
+    assert result == {"status": "processed", "type": "pdf", "content_hash": "h"}
+    document = service.extract_graph.call_args.args[0]
+    assert document.document_info.path == "/data/report.pdf"
+    assert document.document_info.document_type == "pdf"
+    mock_pipeline_cls.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_process_document_already_ingested(monkeypatch) -> None:
+    """Test identical content short-circuits to a metadata merge."""
+    mock_merge = MagicMock()
+    monkeypatch.setattr(
+        svc, "find_document_by_hash", MagicMock(return_value={"path": "doc"})
+    )
+    monkeypatch.setattr(svc, "merge_document_metadata", mock_merge)
+    mock_pipeline_cls = MagicMock()
+    monkeypatch.setattr(svc, "SimpleKGPipeline", mock_pipeline_cls)
+
+    service = IngestionService()
+    service.driver = MagicMock()
+
+    result = await service.process_document(text="sample text", metadata={"k": 1})
+
+    assert result["status"] == "already_ingested"
+    assert result["content_hash"] == fingerprint_text("sample text")
+    mock_merge.assert_called_once_with(
+        service.driver, fingerprint_text("sample text"), {"k": 1}
+    )
+    mock_pipeline_cls.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_is_merged_on_constraint_error(monkeypatch) -> None:
+    """Test losing the content hash race merges metadata instead of failing."""
+    mock_pipeline = AsyncMock()
+    mock_pipeline.run_async.side_effect = neo4j.exceptions.ConstraintError()
+    monkeypatch.setattr(svc, "SimpleKGPipeline", MagicMock(return_value=mock_pipeline))
+    # Not stored yet when checked, stored by the concurrent ingest on write.
+    monkeypatch.setattr(
+        svc, "find_document_by_hash", MagicMock(side_effect=[None, {"path": "doc"}])
+    )
+    mock_merge = MagicMock()
+    monkeypatch.setattr(svc, "merge_document_metadata", mock_merge)
+
+    service = IngestionService()
+    service.driver = MagicMock()
+
+    result = await service.process_document(text="sample text", metadata={"k": 1})
+
+    assert result == {
+        "status": "already_ingested",
+        "type": "text",
+        "content_hash": fingerprint_text("sample text"),
+    }
+    mock_merge.assert_called_once_with(
+        service.driver, fingerprint_text("sample text"), {"k": 1}
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_document_only_writes_changed_chunks(monkeypatch) -> None:
+    """Test re-ingestion diffs chunk hashes and only writes new chunks."""
+    service = IngestionService()
+    service.driver = MagicMock()
+    service.splitter.min_chunk_size = 1
+    service.splitter.boundary_modulus = 1
+    old = await service.splitter.run("kept line\nremoved line\n")
+    new = await service.splitter.run("kept line\nadded line\n")
+    old_hashes = [chunk.metadata["content_hash"] for chunk in old.chunks]
+
+    monkeypatch.setattr(
+        svc,
+        "get_document_chunks",
+        MagicMock(
+            return_value=[
+                {"element_id": "e0", "content_hash": old_hashes[0]},
+                {"element_id": "e1", "content_hash": old_hashes[1]},
+            ]
+        ),
+    )
+    mock_delete = MagicMock()
+    mock_reorder = MagicMock()
+    monkeypatch.setattr(svc, "delete_chunks", mock_delete)
+    monkeypatch.setattr(svc, "reorder_document_chunks", mock_reorder)
+    monkeypatch.setattr(svc, "update_document_properties", MagicMock())
+    mock_write = AsyncMock()
+    monkeypatch.setattr(service, "_write_new_chunks", mock_write)
+
+    result = await service.update_document("doc1", text="kept line\nadded line\n")
+
+    assert result["chunks_kept"] == 1
+    assert result["chunks_added"] == 1
+    assert result["chunks_removed"] == 1
+    written = mock_write.call_args.args[1]
+    assert [chunk.text for chunk in written] == [new.chunks[1].text]
+    mock_delete.assert_called_once_with(service.driver, ["e1"])
+    mock_reorder.assert_called_once_with(
+        service.driver, "doc1", [{"element_id": "e0", "index": 0}]
+    )
+
+
+@pytest.mark.asyncio
+async def test_deleting_canonical_chunk_promotes_its_duplicates(monkeypatch) -> None:
+    """Test duplicates in other documents become searchable when it is deleted."""
+    monkeypatch.setattr(config.ingestion, "near_duplicate_threshold", 0.9)
+    monkeypatch.setattr(dedup, "create_chunk_minhash_index", MagicMock())
+    monkeypatch.setattr(
+        dedup,
+        "find_minhash_candidates",
+        MagicMock(side_effect=lambda _driver, bands, _limit: [[] for _ in bands]),
+    )
+    service = IngestionService()
+    service.driver = MagicMock()
+    service.embed_batcher.embed = AsyncMock(
+        side_effect=lambda texts: [[0.5]] * len(texts)
+    )
+    service.splitter.splitter.min_chunk_size = 1
+    service.splitter.splitter.boundary_modulus = 1
+    old = await service.splitter.run("kept line\nshared line\n")
+    shared_hash = old.chunks[1].metadata["content_hash"]
+    monkeypatch.setattr(
+        svc,
+        "get_document_chunks",
+        MagicMock(
+            return_value=[
+                {
+                    "element_id": "a0",
+                    "content_hash": old.chunks[0].metadata["content_hash"],
+                },
+                {"element_id": "a1", "content_hash": shared_hash},
+            ]
+        ),
+    )
+    # Two chunks of other documents were near-duplicates of the deleted a1.
+    find_orphans = MagicMock(
+        return_value=[
+            {
+                "id": f"b{i}",
+                "text": "shared line\n",
+                "index": i,
+                "content_hash": "hb",
+                "extraction": "done",
+            }
+            for i in (1, 2)
+        ]
+    )
+    monkeypatch.setattr(svc, "find_orphaned_duplicates", find_orphans)
+    mock_update = MagicMock()
+    monkeypatch.setattr(svc, "update_chunk_duplicates", mock_update)
+    for name in (
+        "delete_chunks",
+        "reorder_document_chunks",
+        "update_document_properties",
+    ):
+        monkeypatch.setattr(svc, name, MagicMock())
+    extract = AsyncMock()
+    monkeypatch.setattr(service, "_extract_from_chunks", extract)
+    monkeypatch.setattr(service, "write_graph", AsyncMock())
+
+    await service.update_document("docA", text="kept line\n")
+
+    find_orphans.assert_called_once_with(service.driver, [shared_hash])
+    promoted, duplicate = mock_update.call_args.args[1]
+    assert promoted["id"] == "b1"
+    assert promoted["duplicate_of"] is None
+    assert promoted["embedding"] == [0.5]
+    assert promoted["extract"] is True
+    assert duplicate["id"] == "b2"
+    assert duplicate["duplicate_of"] == "hb"
+    assert duplicate["embedding"] is None
+    (extracted,) = extract.call_args.args[0]
+    assert extracted.uid == "b1"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_pool_reuses_pipelines() -> None:
+    """Test pipelines are built once per input type and handed out exclusively."""
+    import asyncio
+
+    from scouter.ingestion.pipeline import PipelinePool
+
+    factory = MagicMock(side_effect=lambda *, from_pdf: MagicMock(from_pdf=from_pdf))
+    pool = PipelinePool(factory, size=1)
+    seen = []
+
+    async def borrow(*, from_pdf: bool) -> None:
+        async with pool.acquire(from_pdf=from_pdf) as pipeline:
+            seen.append(pipeline)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(
+        borrow(from_pdf=False), borrow(from_pdf=False), borrow(from_pdf=True)
+    )
+
+    assert factory.call_count == 2
+    assert seen[0] is seen[2]
+    assert seen[1].from_pdf is True
+
+
+@pytest.mark.asyncio
+async def test_embedding_batcher_combines_concurrent_documents(monkeypatch) -> None:
+    """Test chunks from concurrent documents are encoded in one batch."""
+    import asyncio
+
+    from scouter.ingestion import embedding
+
+    batches = []
+
+    def fake_encode(embedder, texts):
+        batches.append(texts)
+        return [[float(len(text))] for text in texts]
+
+    monkeypatch.setattr(embedding, "encode_batch", fake_encode)
+    batcher = embedding.EmbeddingBatcher(MagicMock(), max_batch_size=8, max_wait_ms=50)
+
+    first, second = await asyncio.gather(
+        batcher.embed(["a", "bb"]), batcher.embed(["ccc"])
+    )
+
+    assert batches == [["a", "bb", "ccc"]]
+    assert first == [[1.0], [2.0]]
+    assert second == [[3.0]]
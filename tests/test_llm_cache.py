@@ -0,0 +1,31 @@
+"""Tests for the persistent LLM extraction cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from neo4j_graphrag.llm import LLMResponse
+
+from scouter.db.llm_cache import CachedLLM, ExtractionCache
+
+
+@pytest.mark.asyncio
+async def test_cached_llm_reuses_json_responses(tmp_path) -> None:
+    """Test repeated prompts hit the cache and invalid JSON is not cached."""
+    llm = MagicMock(model_name="test-model", model_params={"temperature": 0})
+    llm.ainvoke = AsyncMock(
+        side_effect=[
+            LLMResponse(content='{"nodes": [], "relationships": []}'),
+            LLMResponse(content="not json"),
+            LLMResponse(content="not json"),
+        ]
+    )
+    cached = CachedLLM(llm, ExtractionCache(str(tmp_path / "x.sqlite3"), 10))
+
+    first = await cached.ainvoke("extract chunk A")
+    second = await cached.ainvoke("extract chunk A")
+    await cached.ainvoke("extract chunk B")
+    await cached.ainvoke("extract chunk B")
+
+    assert first.content == second.content
+    assert llm.ainvoke.await_count == 3
+    assert cached.cache.stats()["hits"] == 1
@@ -0,0 +1,58 @@
+"""Tests for adaptive LLM concurrency control."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from neo4j_graphrag.exceptions import LLMGenerationError, RateLimitError
+
+from scouter.db.llm_limiter import (
+    AdaptiveRateLimitHandler,
+    AIMDLimiter,
+    is_overload,
+    retry_after_seconds,
+)
+
+
+def test_limiter_cuts_once_per_window_and_grows_additively() -> None:
+    """Test concurrent overloads from one window cut the limit only once."""
+    limiter = AIMDLimiter(initial=8, max_limit=16)
+    limiter.in_flight = 3
+
+    limiter.on_overload(epoch=0)
+    limiter.on_overload(epoch=0)
+    assert limiter.limit == 4
+
+    limiter.on_success()
+    assert limiter.limit == 4.25
+    assert limiter.in_flight == 0
+
+
+def test_retry_after_is_read_from_wrapped_provider_error() -> None:
+    """Test Retry-After survives the LLMGenerationError wrapping."""
+    provider_error = Exception("Error code: 429")
+    provider_error.response = MagicMock(headers={"retry-after": "7"})
+    error = RateLimitError("Rate limit exceeded")
+    error.__cause__ = LLMGenerationError(provider_error)
+
+    assert is_overload(error)
+    assert retry_after_seconds(error) == 7
+
+
+@pytest.mark.asyncio
+async def test_handler_retries_overloaded_calls() -> None:
+    """Test async calls are retried after overloads and release their slots."""
+    limiter = AIMDLimiter(initial=2)
+    handler = AdaptiveRateLimitHandler(limiter, max_attempts=3, base_delay=0)
+    calls = []
+
+    async def call() -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            msg = "Rate limit exceeded"
+            raise RateLimitError(msg)
+        return "ok"
+
+    assert await handler.handle_async(call)() == "ok"
+    assert len(calls) == 3
+    assert limiter.in_flight == 0
+    assert limiter.limit == 2.0
@@ -0,0 +1,122 @@
+"""Tests for ingestion progress tracking."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from neo4j_graphrag.experimental.pipeline.notification import EventType, TaskEvent
+
+from scouter.ingestion import progress
+
+
+def test_progress_store_parses_task_hash() -> None:
+    """Test stored fields are decoded into stage, chunks and durations."""
+    client = MagicMock()
+    client.hgetall.return_value = {
+        b"stage": b"extract",
+        b"chunks": b"12",
+        b"enqueued_at": b"1700000000.0",
+        b"duration:queued": b"0.5",
+        b"duration:parse": b"1.25",
+    }
+
+    status = progress.ProgressStore(client, ttl=60).get("task-1")
+
+    client.hgetall.assert_called_once_with("scouter:ingest:task:task-1")
+    assert status == {
+        "stage": "extract",
+        "chunks": 12,
+        "durations": {"queued": 0.5, "parse": 1.25},
+    }
+
+
+def test_parallel_parts_count_their_slowest_part() -> None:
+    """Test stage time of split documents is wall time, not the parts' sum."""
+    client = MagicMock()
+    client.hgetall.return_value = {
+        b"stage": b"write",
+        b"duration:extract:0": b"30.0",
+        b"duration:extract:1": b"20.0",
+        b"duration:write:0": b"1.0",
+        b"duration:write": b"2.0",
+    }
+
+    status = progress.ProgressStore(client, ttl=60).get("task-1")
+
+    assert status["durations"] == {"extract": 30.0, "write": 3.0}
+
+
+def test_part_stage_time_is_kept_per_part() -> None:
+    """Test a part's stage time is recorded under its own field."""
+    client = MagicMock()
+
+    progress.ProgressStore(client, ttl=60).record("task-1", "embed", 1.5, part=2)
+
+    client.hincrbyfloat.assert_called_once_with(
+        "scouter:ingest:task:task-1", "duration:embed:2", 1.5
+    )
+
+
+def test_inflight_bytes_sum_per_task_entries() -> None:
+    """Test in-flight bytes are summed from entries of unreleased tasks."""
+    client = MagicMock()
+    client.zrangebyscore.return_value = [b"crashed"]
+    client.hvals.return_value = [b"100", b"50"]
+    pipe = client.pipeline.return_value
+
+    assert progress.ProgressStore(client, ttl=60).inflight_bytes("acme") == 150
+
+    client.hvals.assert_called_once_with("scouter:ingest:inflight:acme")
+    pipe.hdel.assert_called_once_with("scouter:ingest:inflight:acme", b"crashed")
+
+
+def test_release_deletes_the_task_entries() -> None:
+    """Test releasing a task removes it from the global and tenant totals."""
+    client = MagicMock()
+    client.hget.return_value = b"acme"
+    pipe = client.pipeline.return_value
+
+    progress.ProgressStore(client, ttl=60).release("task-1")
+
+    assert {c.args for c in pipe.hdel.call_args_list} == {
+        ("scouter:ingest:inflight", "task-1"),
+        ("scouter:ingest:inflight:acme", "task-1"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_pipeline_events_are_timed_by_stage(monkeypatch) -> None:
+    """Test pipeline components are recorded under their ingestion stage."""
+    store = MagicMock()
+    monkeypatch.setattr(progress, "get_progress_store", lambda: store)
+    callback = progress.PipelineProgress()
+
+    def event(event_type: EventType, name: str, payload=None) -> TaskEvent:
+        return TaskEvent(
+            event_type=event_type, run_id="run", task_name=name, payload=payload
+        )
+
+    with progress.tracking("task-1", final=True):
+        await callback(event(EventType.TASK_STARTED, "splitter"))
+        await callback(
+            event(EventType.TASK_FINISHED, "splitter", {"chunks": [{}, {}, {}]})
+        )
+        await callback(event(EventType.TASK_STARTED, "pruner"))
+        await callback(event(EventType.TASK_FINISHED, "pruner"))
+
+    store.started.assert_any_call("task-1", "parse")
+    store.started.assert_any_call("task-1", "extract")
+    assert [c.args[1] for c in store.record.call_args_list] == ["parse", "extract"]
+    store.add_chunks.assert_called_once_with("task-1", 3)
+    store.finished.assert_called_once_with("task-1")
+
+
+def test_untracked_work_records_nothing(monkeypatch) -> None:
+    """Test stages outside a tracked task never touch Redis."""
+    store = MagicMock()
+    monkeypatch.setattr(progress, "get_progress_store", lambda: store)
+
+    with progress.stage("parse"):
+        progress.add_chunks(4)
+
+    store.assert_not_called()
+    assert store.method_calls == []
@@ -0,0 +1,47 @@
+"""Tests for the process-wide retriever registry."""
+
+from unittest.mock import MagicMock
+
+import neo4j
+import pytest
+
+from scouter.db import retrievers
+from scouter.db.retrievers import RetrieverRegistry
+
+
+@pytest.fixture
+def built(monkeypatch) -> list[MagicMock]:
+    instances: list[MagicMock] = []
+
+    def build(**_kwargs):
+        instances.append(MagicMock())
+        return instances[-1]
+
+    monkeypatch.setattr(retrievers, "VectorRetriever", build)
+    return instances
+
+
+def test_retrievers_are_reused_until_ttl(built, monkeypatch) -> None:
+    """Test index metadata is fetched once per TTL, not once per search."""
+    clock = iter([0.0, 1.0, 100.0])
+    monkeypatch.setattr(retrievers.time, "monotonic", lambda: next(clock))
+    registry = RetrieverRegistry(MagicMock(), ttl_s=60)
+    embedder = MagicMock()
+
+    first = registry.get("chunkEmbedding", embedder)
+    assert registry.get("chunkEmbedding", embedder) is first
+    assert registry.get("chunkEmbedding", embedder) is not first
+    assert len(built) == 2
+
+
+def test_search_rebuilds_retriever_after_client_error(built) -> None:
+    """Test a search against a changed index is retried on a fresh retriever."""
+    registry = RetrieverRegistry(MagicMock(), ttl_s=60)
+    embedder = MagicMock()
+    stale = registry.get("chunkEmbedding", embedder)
+    stale.search.side_effect = neo4j.exceptions.ClientError("index changed")
+
+    result = registry.search("chunkEmbedding", embedder, query_text="q", top_k=3)
+
+    assert result is built[1].search.return_value
+    built[1].search.assert_called_once_with(query_text="q", top_k=3)
@@ -0,0 +1,48 @@
+"""Tests for the search result cache."""
+
+from unittest.mock import MagicMock
+
+import redis
+
+from scouter.db.search_cache import SearchResultCache
+
+
+def test_results_are_reused_until_the_corpus_changes() -> None:
+    """Test a repeated search is served from memory until a version bump."""
+    client = MagicMock()
+    client.get.return_value = b"3"
+    cache = SearchResultCache(client, ttl_s=60, max_entries=10, version_ttl_s=0)
+    search = MagicMock(side_effect=["first", "second"])
+
+    assert cache.get_or_search("q", search) == "first"
+    assert cache.get_or_search("q", search) == "first"
+    client.get.return_value = b"4"
+    assert cache.get_or_search("q", search) == "second"
+    assert search.call_count == 2
+
+
+def test_searches_run_uncached_without_redis() -> None:
+    """Test an unreachable Redis disables caching instead of failing searches."""
+    client = MagicMock()
+    client.get.side_effect = redis.ConnectionError("down")
+    cache = SearchResultCache(client, ttl_s=60, max_entries=10)
+    search = MagicMock(return_value="result")
+
+    assert cache.get_or_search("q", search) == "result"
+    assert cache.get_or_search("q", search) == "result"
+    assert search.call_count == 2
+    client.get.assert_called_once()
+
+
+def test_corpus_version_is_reused_between_reads() -> None:
+    """Test cache hits within the version TTL make no Redis round trip."""
+    client = MagicMock()
+    client.get.return_value = b"3"
+    cache = SearchResultCache(client, ttl_s=60, max_entries=10, version_ttl_s=60)
+    search = MagicMock(return_value="first")
+
+    assert cache.get_or_search("q", search) == "first"
+    client.get.return_value = b"4"
+    assert cache.get_or_search("q", search) == "first"
+    search.assert_called_once()
+    client.get.assert_called_once()
@@ -0,0 +1,39 @@
+"""Tests for the semantic search tool."""
+
+from unittest.mock import MagicMock
+
+import neo4j
+
+from scouter.tools import semantic_search as tool
+from scouter.tools.semantic_search import SemanticSearchParams
+
+
+def test_results_keep_native_types(monkeypatch) -> None:
+    """Test results are built from projected properties, not parsed strings."""
+    record = neo4j.Record(
+        {
+            "node": {"text": "it's {not} a dict", "index": 2, "content_hash": "h"},
+            "elementId": "4:abc:7",
+            "score": 0.83,
+        }
+    )
+    registry = MagicMock()
+    registry.search.side_effect = lambda *_a, result_formatter, **_kw: MagicMock(
+        items=[result_formatter(record)]
+    )
+    monkeypatch.setattr(tool, "get_retriever_registry", lambda: registry)
+    monkeypatch.setattr(tool, "get_query_embedder", MagicMock)
+    monkeypatch.setattr(tool, "get_search_result_cache", lambda: None)
+
+    result = tool.semantic_search(SemanticSearchParams(query_text="q"))
+
+    (hit,) = result.results
+    assert (hit.node_id, hit.score, hit.content) == (
+        "4:abc:7",
+        0.83,
+        "it's {not} a dict",
+    )
+    assert hit.metadata["index"] == 2
+    assert registry.search.call_args.kwargs["return_properties"] == (
+        tool.CHUNK_PROPERTIES
+    )
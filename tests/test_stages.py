@@ -0,0 +1,197 @@
+"""Tests for the staged ingestion chain."""
+
+from unittest.mock import ANY, AsyncMock, MagicMock
+
+import pytest
+from neo4j_graphrag.experimental.components.types import Neo4jGraph
+
+import scouter.ingestion.service as svc
+from scouter.config import config
+from scouter.ingestion import stages
+from scouter.ingestion.blobstore import BlobStore
+from scouter.ingestion.service import IngestionService
+
+
+@pytest.fixture(autouse=True)
+def _no_near_duplicates(monkeypatch) -> None:
+    monkeypatch.setattr(config.ingestion, "near_duplicate_threshold", 0)
+
+
+def _component(result) -> MagicMock:
+    return MagicMock(return_value=MagicMock(run=AsyncMock(return_value=result)))
+
+
+@pytest.mark.asyncio
+async def test_stages_hand_off_artifacts_through_blob_store(
+    monkeypatch, tmp_path
+) -> None:
+    """Test a text document flows through all stages and leaves no artifacts."""
+    monkeypatch.setattr(svc, "create_document_constraints", MagicMock())
+    monkeypatch.setattr(svc, "find_document_by_hash", MagicMock(return_value=None))
+    monkeypatch.setattr(svc, "SchemaFromTextExtractor", _component(None))
+    monkeypatch.setattr(svc, "UniqueChunkExtractor", _component(None))
+    monkeypatch.setattr(svc, "GraphPruning", _component(MagicMock(graph=Neo4jGraph())))
+    monkeypatch.setattr(svc, "SinglePropertyExactMatchResolver", _component(None))
+
+    service = IngestionService()
+    service.writer = MagicMock(run=AsyncMock())
+    service.blobs = BlobStore(str(tmp_path))
+    service.embed_batcher.embed = AsyncMock(
+        side_effect=lambda texts: [[0.1]] * len(texts)
+    )
+
+    payload = await stages.parse(service, {"text": "hello world", "metadata": {}})
+    assert set(payload) == {"type", "content_hash", "metadata", "document", "chunks"}
+    payload = await stages.embed(service, payload)
+    payload = await stages.extract(service, payload)
+    result = await stages.write(service, payload)
+
+    assert result["status"] == "processed"
+    service.writer.run.assert_awaited_once()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_stages_pass_through_already_ingested(monkeypatch) -> None:
+    """Test a duplicate stops after parsing and skips the later stages."""
+    monkeypatch.setattr(svc, "create_document_constraints", MagicMock())
+    monkeypatch.setattr(svc, "find_document_by_hash", MagicMock(return_value={}))
+    monkeypatch.setattr(svc, "merge_document_metadata", MagicMock())
+
+    service = IngestionService()
+    payload = await stages.parse(service, {"text": "hello", "metadata": {}})
+    for stage in (stages.embed, stages.extract):
+        payload = await stage(service, payload)
+    result = await stages.write(service, payload)
+
+    assert result["status"] == "already_ingested"
+
+
+@pytest.mark.asyncio
+async def test_stages_update_known_doc_id_in_extract_stage(
+    monkeypatch, tmp_path
+) -> None:
+    """Test a new version of a document is re-ingested off the parse queue."""
+    monkeypatch.setattr(svc, "create_document_constraints", MagicMock())
+    monkeypatch.setattr(svc, "find_document_by_hash", MagicMock(return_value=None))
+    monkeypatch.setattr(svc, "find_document_by_doc_id", MagicMock(return_value={}))
+
+    service = IngestionService()
+    service.blobs = BlobStore(str(tmp_path))
+    updated = {"status": "updated", "type": "text", "content_hash": ANY}
+    service.update_document = AsyncMock(return_value=updated)
+    task_data = {"text": "new version", "metadata": {"doc_id": "d1"}}
+
+    payload = await stages.parse(service, task_data)
+    service.update_document.assert_not_awaited()
+    payload = await stages.embed(service, payload)
+    payload = await stages.extract(service, payload)
+    result = await stages.write(service, payload)
+
+    assert result == updated
+    service.update_document.assert_awaited_once_with(
+        "d1",
+        file_path=None,
+        text="new version",
+        metadata={"doc_id": "d1"},
+        content_hash=ANY,
+    )
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_pdf_parts_are_written_unresolved_then_merged(monkeypatch) -> None:
+    """Test page-range parts skip resolution, which runs once on finalize."""
+    monkeypatch.setattr(svc, "create_document_constraints", MagicMock())
+    monkeypatch.setattr(svc, "load_pdf_pages", MagicMock(return_value="page text"))
+    monkeypatch.setattr(svc, "SchemaFromTextExtractor", _component(None))
+    extractor = _component(None)
+    monkeypatch.setattr(svc, "UniqueChunkExtractor", extractor)
+    monkeypatch.setattr(svc, "GraphPruning", _component(MagicMock(graph=Neo4jGraph())))
+    resolver = _component(None)
+    monkeypatch.setattr(svc, "SinglePropertyExactMatchResolver", resolver)
+    merge = MagicMock()
+    monkeypatch.setattr(svc, "merge_document_parts", merge)
+    monkeypatch.setattr(svc, "find_document_by_hash", MagicMock(return_value=None))
+
+    service = IngestionService()
+    service.writer = MagicMock(run=AsyncMock())
+    service.embed_batcher.embed = AsyncMock(
+        side_effect=lambda texts: [[0.1]] * len(texts)
+    )
+
+    part = await service.process_pdf_part("big.pdf", "abc", 1, 50, 100, run_id="r1")
+    assert part["part"] == 1
+    document_info = extractor.return_value.run.await_args.kwargs["document_info"]
+    assert document_info.metadata == {"part_of": "abc", "part_run": "r1", "part": "1"}
+    resolver.return_value.run.assert_not_awaited()
+
+    result = await service.finalize_pdf_parts(
+        "big.pdf", "abc", {"doc_id": "d1"}, run_id="r1"
+    )
+    assert result["status"] == "processed"
+    assert merge.call_args.args[1:3] == ("abc", "r1")
+    assert merge.call_args.args[3]["doc_id"] == "d1"
+    resolver.return_value.run.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_pdf_parts_of_an_ingested_duplicate_are_discarded(monkeypatch) -> None:
+    """Test finalize drops its parts when the PDF was ingested meanwhile."""
+    monkeypatch.setattr(svc, "create_document_constraints", MagicMock())
+    monkeypatch.setattr(svc, "find_document_by_hash", MagicMock(return_value={}))
+    merge = MagicMock()
+    monkeypatch.setattr(svc, "merge_document_parts", merge)
+    delete_parts = MagicMock()
+    monkeypatch.setattr(svc, "delete_document_parts", delete_parts)
+    merge_metadata = MagicMock()
+    monkeypatch.setattr(svc, "merge_document_metadata", merge_metadata)
+    resolver = _component(None)
+    monkeypatch.setattr(svc, "SinglePropertyExactMatchResolver", resolver)
+
+    service = IngestionService()
+    result = await service.finalize_pdf_parts(
+        "big.pdf", "abc", {"doc_id": "d1"}, run_id="r2"
+    )
+
+    assert result["status"] == "already_ingested"
+    merge.assert_not_called()
+    delete_parts.assert_called_once_with(service.driver, "abc", "r2")
+    merge_metadata.assert_called_once_with(service.driver, "abc", {"doc_id": "d1"})
+    resolver.return_value.run.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_deferred_extraction_runs_on_indexed_chunks(monkeypatch) -> None:
+    """Test vector-only indexing skips the LLM until extraction is run."""
+    monkeypatch.setattr(svc, "create_document_constraints", MagicMock())
+    monkeypatch.setattr(svc, "find_document_by_hash", MagicMock(return_value=None))
+    monkeypatch.setattr(svc, "SchemaFromTextExtractor", _component(None))
+    extractor = _component(Neo4jGraph())
+    monkeypatch.setattr(svc, "UniqueChunkExtractor", extractor)
+    monkeypatch.setattr(svc, "SinglePropertyExactMatchResolver", _component(None))
+    rows = [{"id": "c0", "text": "hello world", "index": 0, "duplicate_of": None}]
+    monkeypatch.setattr(
+        svc, "claim_chunks_for_extraction", MagicMock(return_value=rows)
+    )
+    set_extraction = MagicMock()
+    monkeypatch.setattr(svc, "set_document_extraction", set_extraction)
+
+    service = IngestionService()
+    service.writer = MagicMock(run=AsyncMock())
+    service.embed_batcher.embed = AsyncMock(
+        side_effect=lambda texts: [[0.1]] * len(texts)
+    )
+
+    result = await service.index_document(text="hello world")
+    assert result["extraction"] == "pending"
+    extractor.assert_not_called()
+    lexical = service.writer.run.call_args.kwargs["graph"]
+    document = next(node for node in lexical.nodes if node.label == "Document")
+    assert document.properties["extraction"] == "pending"
+
+    result = await service.extract_deferred(result["content_hash"])
+    assert result["status"] == "extracted"
+    graph = service.writer.run.call_args.kwargs["graph"]
+    assert [node.id for node in graph.nodes] == ["c0"]
+    set_extraction.assert_called_once_with(service.driver, ANY, "done")
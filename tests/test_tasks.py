@@ -0,0 +1,144 @@
+"""Tests for building ingestion task signatures."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from neo4j_graphrag.experimental.components.types import TextChunk, TextChunks
+
+from scouter.config import config
+from scouter.ingestion import embedding, tasks
+from scouter.ingestion.blobstore import BlobStore
+
+
+@pytest.mark.parametrize("staged", [False, True])
+def test_backfill_tasks_get_low_priority(monkeypatch, staged) -> None:
+    """Test every task of a backfill document yields to interactive ones."""
+    monkeypatch.setattr(config.ingestion, "staged", staged)
+    store = MagicMock()
+    monkeypatch.setattr(tasks, "get_progress_store", lambda: store)
+
+    signature = tasks.document_signature({"text": "x", "metadata": {}}, "backfill")
+    steps = signature.tasks if staged else [signature]
+
+    assert {step.options["priority"] for step in steps} == {
+        tasks.PRIORITIES["backfill"]
+    }
+    task_id = signature.freeze().id
+    store.enqueued.assert_called_once_with(task_id, size=1, tenant=None)
+    assert steps[0].args[0]["task_id"] == task_id
+
+
+def test_large_text_travels_by_reference(monkeypatch, tmp_path) -> None:
+    """Test texts over the threshold leave the message and are read back."""
+    monkeypatch.setattr(config.ingestion, "text_offload_bytes", 8)
+    monkeypatch.setattr(config.ingestion, "staged", False)
+    monkeypatch.setattr(tasks, "get_blob_store", lambda: BlobStore(str(tmp_path)))
+    monkeypatch.setattr(tasks, "get_progress_store", MagicMock)
+    service = MagicMock()
+    monkeypatch.setattr(tasks, "get_worker_service", lambda: service)
+    monkeypatch.setattr(tasks, "run_tracked", MagicMock(return_value={}))
+
+    small = tasks.document_signature({"text": "tiny"})
+    large = tasks.document_signature({"text": "much longer text"})
+    assert small.args[0]["text"] == "tiny"
+    assert "text" not in large.args[0]
+
+    tasks.process_document_task.run(*large.args)
+    assert service.process_document.call_args.kwargs["text"] == "much longer text"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_offloaded_text_is_deleted_when_the_task_fails(monkeypatch, tmp_path) -> None:
+    """Test a failing task does not leave its text in the blob store."""
+    monkeypatch.setattr(config.ingestion, "text_offload_bytes", 8)
+    monkeypatch.setattr(config.ingestion, "staged", False)
+    monkeypatch.setattr(tasks, "get_blob_store", lambda: BlobStore(str(tmp_path)))
+    monkeypatch.setattr(tasks, "get_progress_store", MagicMock)
+    monkeypatch.setattr(tasks, "get_worker_service", MagicMock)
+    monkeypatch.setattr(
+        tasks, "run_tracked", MagicMock(side_effect=RuntimeError("Neo4j down"))
+    )
+
+    signature = tasks.document_signature({"text": "much longer text"})
+    with pytest.raises(RuntimeError):
+        tasks.process_document_task.run(*signature.args)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_expired_blobs_are_swept(tmp_path) -> None:
+    """Test artifacts left behind longer than the TTL are deleted."""
+    store = BlobStore(str(tmp_path), ttl_s=60)
+    old = store.put_text("text", "left behind")
+    fresh = store.put_text("text", "in flight")
+    os.utime(tmp_path / old, (0, 0))
+
+    assert store.sweep() == 1
+    assert [path.name for path in tmp_path.iterdir()] == [fresh]
+
+
+def test_vector_only_documents_skip_staged_chain(monkeypatch) -> None:
+    """Test deferred extraction indexes the document in a single task."""
+    monkeypatch.setattr(config.ingestion, "staged", True)
+    monkeypatch.setattr(tasks, "get_progress_store", MagicMock)
+
+    signature = tasks.document_signature(
+        {"text": "x", "metadata": {}}, extraction="deferred"
+    )
+
+    assert signature.task == tasks.index_document_task.name
+    assert signature.args[1] == "deferred"
+
+
+@pytest.mark.parametrize(("existing", "split"), [(None, True), ({}, False)])
+def test_only_new_large_pdfs_are_split(monkeypatch, tmp_path, existing, split) -> None:
+    """Test a PDF whose content is already ingested is not fanned out."""
+    pdf = tmp_path / "big.pdf"
+    pdf.write_bytes(b"%PDF")
+    monkeypatch.setattr(config.ingestion, "pdf_pages_per_part", 10)
+    monkeypatch.setattr(tasks, "count_pdf_pages", lambda _: 25)
+    monkeypatch.setattr(tasks, "get_neo4j_driver", MagicMock)
+    monkeypatch.setattr(
+        tasks, "find_document_by_hash", MagicMock(return_value=existing)
+    )
+    monkeypatch.setattr(tasks, "get_progress_store", MagicMock)
+
+    signature = tasks.document_signature(
+        {"file_path": str(pdf), "content_hash": "abc", "metadata": {}}
+    )
+
+    assert (signature.task == "celery.chord") is split
+
+
+def test_concurrent_tasks_share_one_embedding_batch(monkeypatch, tmp_path) -> None:
+    """Test embed tasks running in one threads-pool worker share an encode call."""
+    batches = []
+
+    def fake_encode(embedder, texts):
+        batches.append(texts)
+        return [[0.1]] * len(texts)
+
+    monkeypatch.setattr(embedding, "encode_batch", fake_encode)
+    blobs = BlobStore(str(tmp_path))
+    service = MagicMock(
+        blobs=blobs,
+        embed_batcher=embedding.EmbeddingBatcher(
+            MagicMock(), max_batch_size=8, max_wait_ms=500
+        ),
+    )
+    monkeypatch.setattr(tasks, "IngestionService", lambda: service)
+    monkeypatch.setattr(tasks, "_service", None)
+    monkeypatch.setattr(tasks, "_loop", None)
+    payloads = [
+        {"chunks": blobs.put("chunks", TextChunks(chunks=[TextChunk(text=t, index=0)]))}
+        for t in ("first document", "second document")
+    ]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(tasks.embed_chunks_task.run, payloads))
+    tasks.shutdown_worker_process()
+
+    assert len(batches) == 1
+    assert sorted(batches[0]) == ["first document", "second document"]
@@ -0,0 +1,42 @@
+"""Tests for streaming upload persistence."""
+
+import hashlib
+import io
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from scouter.config import config
+from scouter.ingestion.uploads import save_upload
+
+
+@pytest.mark.asyncio
+async def test_save_upload_hashes_while_copying(monkeypatch) -> None:
+    """Test the upload is copied in chunks and fingerprinted."""
+    monkeypatch.setattr(config.ingestion, "upload_chunk_bytes", 4)
+    payload = b"%PDF-1.4 streamed content"
+    upload = UploadFile(file=io.BytesIO(payload), filename="doc.pdf")
+
+    stored = await save_upload(upload)
+    try:
+        assert stored.size == len(payload)
+        assert stored.content_hash == hashlib.sha256(payload).hexdigest()
+        assert Path(stored.path).read_bytes() == payload
+    finally:
+        Path(stored.path).unlink(missing_ok=True)
+
+
+@pytest.mark.asyncio
+async def test_save_upload_rejects_oversized(monkeypatch, tmp_path) -> None:
+    """Test uploads over the limit raise 413 and leave no temp file behind."""
+    monkeypatch.setattr(config.ingestion, "max_upload_bytes", 8)
+    monkeypatch.setattr(config.ingestion, "upload_chunk_bytes", 4)
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    upload = UploadFile(file=io.BytesIO(b"0123456789"), filename="doc.pdf")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await save_upload(upload)
+
+    assert exc_info.value.status_code == 413
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,58 @@
+"""Tests for the batched knowledge graph writer."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from neo4j_graphrag.experimental.components.types import (
+    Neo4jGraph,
+    Neo4jNode,
+    Neo4jRelationship,
+)
+
+from scouter.ingestion.writer import BatchedNeo4jWriter
+
+
+@pytest.mark.asyncio
+async def test_writer_groups_rows_into_batched_transactions() -> None:
+    """Test nodes and relationships are grouped and written in three txs."""
+    tx = MagicMock()
+    session = MagicMock()
+    session.execute_write.side_effect = lambda work, *args: work(tx, *args)
+    driver = MagicMock()
+    driver.session.return_value.__enter__.return_value = session
+
+    graph = Neo4jGraph(
+        nodes=[
+            Neo4jNode(
+                id="c1", label="Chunk", embedding_properties={"embedding": [0.1]}
+            ),
+            *(Neo4jNode(id=f"p{i}", label="Person") for i in range(3)),
+            Neo4jNode(id="o1", label="Org`x"),
+        ],
+        relationships=[
+            Neo4jRelationship(start_node_id="p0", end_node_id="o1", type="WORKS_AT"),
+            Neo4jRelationship(start_node_id="p1", end_node_id="c9", type="FROM_CHUNK"),
+        ],
+    )
+    result = await BatchedNeo4jWriter(driver, batch_size=2).run(graph=graph)
+
+    assert result.status == "SUCCESS"
+    assert session.execute_write.call_count == 3
+    queries = [c.args[0] for c in tx.run.call_args_list]
+    person = [
+        c.kwargs["rows"] for c in tx.run.call_args_list if ":`Person`" in c.args[0]
+    ]
+    assert [len(rows) for rows in person] == [2, 1]
+    assert any(":`Person`:`__Entity__`" in q for q in queries)
+    assert any(":`Chunk`, n" in q and "setNodeVectorProperty" in q for q in queries)
+    assert any(":`Org``x`" in q for q in queries)
+    assert any("[r:`WORKS_AT`]" in q for q in queries)
+    cleared = [c.kwargs["rows"] for c in tx.run.call_args_list if "REMOVE" in c.args[0]]
+    assert sorted(id_ for rows in cleared for id_ in rows) == [
+        "c1",
+        "c9",
+        "o1",
+        "p0",
+        "p1",
+        "p2",
+    ]